@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import numpy as np
+
+from two_player_games.agent.mcts import MCTS
+from two_player_games.agent.mcts.tree import NO_CHILD, PASS, ROOT, Tree
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical import VerticalBoardAction
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+def test_tree_expansion_and_selection() -> None:
+    tree = Tree(4)
+    assert not tree.is_expanded(ROOT)
+    assert tree.expand(ROOT, 2)
+    assert tree.children(ROOT) == slice(1, 3)
+    assert list(tree.actions[1:3]) == [0, 1]
+    # Unvisited children come first
+    assert tree.select(ROOT, 1.0) == 1
+    tree.backpropagate([ROOT, 1], np.array([0.0, 0.0]))
+    assert tree.select(ROOT, 1.0) == 2
+    tree.backpropagate([ROOT, 2], np.array([0.0, 1.0]))
+    assert tree.select(ROOT, 1.0) == 2
+    assert list(tree.visits[tree.children(ROOT)]) == [1, 1]
+    # There is no room for the two children of node 1
+    assert not tree.expand(1, 2)
+    assert tree.first_children[1] == NO_CHILD
+    # A node without actions has a single child for passing
+    assert tree.expand(2, 0)
+    assert tree.children(2) == slice(3, 4)
+    assert tree.actions[3] == PASS
+
+
+def test_play_the_winning_move() -> None:
+    model = Connect4Bitboard()
+    for action in (0, 1, 0, 1, 0, 1):
+        model.play(action)
+    key = model.key
+    agent: MCTS[VerticalBoardAction, BoardState, BoardChange] = MCTS(
+        500,
+        seed=0,
+    )
+    assert agent.select_action(model) == 0
+    # The search must leave the model as it was
+    assert model.key == key
+    assert model.changes == [(3, 1)]
+
+
+def test_block_the_opponent() -> None:
+    model = TicTacToe()
+    for action in ((0, 0), (1, 1), (0, 1)):
+        model.play(action)
+    agent: MCTS[HorizontalBoardAction, BoardState, BoardChange] = MCTS(
+        2000,
+        seed=0,
+    )
+    assert agent.select_action(model) == (0, 2)
+    assert agent.tree.visits[ROOT] == 2000
+
+
+def test_root_parallelism() -> None:
+    model = TicTacToe()
+    for action in ((0, 0), (1, 1), (0, 1)):
+        model.play(action)
+    agent: MCTS[HorizontalBoardAction, BoardState, BoardChange] = MCTS(
+        1000,
+        seed=0,
+        workers=2,
+    )
+    assert agent.select_action(model) == (0, 2)
+    assert agent.select_action(model) == (0, 2)
+    agent.close()
+    assert agent._executor is None
+    # The worker processes are started again on demand
+    assert agent.select_action(model) == (0, 2)
+    agent.close()
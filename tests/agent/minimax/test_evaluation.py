@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import numpy as np
+import pytest
+
+from two_player_games.agent.arg import AgentArg, AgentOptions, EvaluatorArg
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.minimax.evaluation import (
+    Connect4Evaluator,
+    LineEvaluator,
+    OthelloEvaluator,
+    mobility,
+    stable_discs,
+)
+from two_player_games.agent.minimax.negamax import NegamaxPVS
+from two_player_games.common import (
+    MARK_EMPTY,
+    MARK_FIRST,
+    MARK_SECOND,
+    Category,
+    Turn,
+)
+from two_player_games.model import Model
+from two_player_games.model.board.horizontal.othello import Othello
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    OthelloBitboard,
+)
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4 import (
+    COL_NUM,
+    ROW_NUM,
+    WINNING_STREAK,
+    Connect4,
+)
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize(
+    ("evaluator_arg", "model_type"),
+    [
+        (EvaluatorArg.CONNECT4, Connect4),
+        (EvaluatorArg.CONNECT4, Connect4Bitboard),
+        (EvaluatorArg.OTHELLO, Othello),
+        (EvaluatorArg.OTHELLO, OthelloBitboard),
+        (EvaluatorArg.TICTACTOE, TicTacToe),
+    ],
+)
+def test_evaluation_is_below_terminal_rewards(
+    evaluator_arg: EvaluatorArg,
+    model_type: type[Model[Any, Any, Any]],
+) -> None:
+    evaluator = evaluator_arg.get_evaluator()
+    rng = random.Random(0)
+    for _ in range(5):
+        model = model_type()
+        while not model.is_over() and model.possible_actions:
+            value = evaluator.evaluate(model, Turn.FIRST)
+            assert -1 < value < 1
+            assert evaluator.evaluate(model, Turn.SECOND) == -value
+            model.play(rng.choice(model.possible_actions))
+
+
+@pytest.mark.parametrize(
+    ("evaluator_arg", "model_type", "bitboard_type"),
+    [
+        (EvaluatorArg.CONNECT4, Connect4, Connect4Bitboard),
+        (EvaluatorArg.OTHELLO, Othello, OthelloBitboard),
+    ],
+)
+def test_bitboard_evaluation_matches_grid_evaluation(
+    evaluator_arg: EvaluatorArg,
+    model_type: type[Model[Any, Any, Any]],
+    bitboard_type: type[Model[Any, Any, Any]],
+) -> None:
+    evaluator = evaluator_arg.get_evaluator()
+    rng = random.Random(0)
+    for _ in range(5):
+        model, bitboard = model_type(), bitboard_type()
+        while not model.is_over():
+            assert evaluator.evaluate(bitboard, Turn.FIRST) == (
+                evaluator.evaluate(model, Turn.FIRST)
+            )
+            action = (
+                rng.choice(model.possible_actions)
+                if model.possible_actions
+                else None
+            )
+            model.play(action)
+            bitboard.play(action)
+
+
+def test_connect4_evaluation_favours_playable_threats() -> None:
+    evaluator = Connect4Evaluator()
+    lines = LineEvaluator(ROW_NUM, COL_NUM, WINNING_STREAK)
+    model = Connect4()
+    assert evaluator.evaluate(model, Turn.FIRST) == 0
+    # The first player threatens both ends of the bottom row, whereas the
+    # second player's threats are above empty columns
+    model.state[5, 1:4] = MARK_FIRST
+    model.state[4, 1:4] = MARK_SECOND
+    assert evaluator.evaluate(model, Turn.FIRST) > lines.evaluate(
+        model,
+        Turn.FIRST,
+    )
+    model.state[5, 1:4] = MARK_SECOND
+    model.state[4, 1:4] = MARK_FIRST
+    assert evaluator.evaluate(model, Turn.FIRST) < lines.evaluate(
+        model,
+        Turn.FIRST,
+    )
+
+
+def test_othello_mobility_and_stable_discs() -> None:
+    model = Othello()
+    flat_state = np.append(model.state.ravel(), MARK_EMPTY)
+    assert mobility(flat_state) == (4, 4)
+    assert not stable_discs(flat_state).any()
+    assert OthelloEvaluator().evaluate(model, Turn.FIRST) == 0
+
+    # A corner, and the discs of its colour next to it, are stable, unlike
+    # discs next to an empty cell or an opponent's disc
+    model.state[0, :3] = MARK_FIRST
+    model.state[1, 0] = MARK_FIRST
+    model.state[2, 0] = MARK_SECOND
+    model.state[0, 4] = MARK_SECOND
+    flat_state = np.append(model.state.ravel(), MARK_EMPTY)
+    stable = stable_discs(flat_state).reshape(model.state.shape)
+    assert stable[0, :3].all()
+    assert stable[1, 0]
+    assert not stable[2, 0]
+    assert not stable[0, 4]
+    assert not stable[3:5, 3:5].any()
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_othello_mobility_matches_possible_actions(seed: int) -> None:
+    rng = random.Random(seed)
+    model = Othello()
+    while not model.is_over():
+        flat_state = np.append(model.state.ravel(), MARK_EMPTY)
+        mobilities = mobility(flat_state)
+        assert mobilities[model.turn < 0] == len(model.possible_actions)
+        model.play(
+            (
+                rng.choice(model.possible_actions)
+                if model.possible_actions
+                else None
+            ),
+        )
+
+
+def test_full_othello_board_is_stable() -> None:
+    flat_state = np.full(65, MARK_SECOND, np.int8)
+    flat_state[::3] = MARK_FIRST
+    flat_state[-1] = MARK_EMPTY
+    assert stable_discs(flat_state).all()
+
+
+def test_evaluator_guides_depth_limited_search() -> None:
+    model = Connect4()
+    blind: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(1, Turn.FIRST)
+    assert blind.select_action(model) == 0
+    agent: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(
+        1,
+        Turn.FIRST,
+        evaluator=Connect4Evaluator(),
+    )
+    # The central column is part of the most lines of four
+    assert agent.select_action(model) == 3
+
+
+def test_search_prefers_wins_to_evaluations() -> None:
+    model = Connect4()
+    for action in (0, 6, 0, 6, 0, 5):
+        model.play(action)
+    agent: NegamaxPVS[Any, Any, Any] = NegamaxPVS(
+        3,
+        Turn.FIRST,
+        evaluator=Connect4Evaluator(),
+    )
+    assert agent.maximin(model, 3, Turn.FIRST) == (1, 0)
+
+
+def test_agent_options_select_evaluator() -> None:
+    agent = AgentArg.NEGAMAX_PVS.create(
+        Category.VERTICAL_BOARD,
+        None,
+        AgentOptions(Turn.SECOND, 2, evaluator=EvaluatorArg.CONNECT4),
+    )
+    assert isinstance(agent, NegamaxPVS)
+    assert isinstance(agent.evaluator, Connect4Evaluator)
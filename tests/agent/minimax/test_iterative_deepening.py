@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+
+from two_player_games.agent.arg import parse_duration
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.common import Turn
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical import VerticalBoardAction
+from two_player_games.model.board.vertical.connect4 import Connect4
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"),
+    [("250ms", 0.25), ("2s", 2), ("1.5", 1.5), (" 10MS ", 0.01)],
+)
+def test_parse_duration(value: str, seconds: float) -> None:
+    assert parse_duration(value) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize("value", ["", "ms", "fast", "0", "-1s"])
+def test_parse_invalid_duration(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_duration(value)
+
+
+def test_search_stops_once_the_game_tree_is_exhausted() -> None:
+    model = TicTacToe()
+    model.play((0, 0))
+    agent: AlphaBetaPruning[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = AlphaBetaPruning(0, Turn.SECOND, time_budget=60)
+    start = perf_counter()
+    action = agent.select_action(model)
+    assert perf_counter() - start < 60
+    # Only the centre does not lose against a corner opening
+    assert action == (1, 1)
+
+
+def test_search_respects_the_time_budget() -> None:
+    model = Connect4()
+    key = model.key
+    agent: AlphaBetaPruning[
+        VerticalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = AlphaBetaPruning(0, Turn.FIRST, time_budget=0.2)
+    start = perf_counter()
+    action = agent.select_action(model)
+    assert perf_counter() - start < 0.4
+    assert action in model.possible_actions
+    # The interrupted search must leave the model as it was
+    assert model.key == key
+    assert not model.changes
+    assert not model.state.any()
+
+
+def test_transposition_cutoffs_do_not_stop_the_search() -> None:
+    model = Connect4Bitboard()
+    agent: AlphaBetaPruning[
+        VerticalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = AlphaBetaPruning(0, Turn.FIRST, 16, time_budget=0.1)
+    for _ in range(4):
+        action = agent.select_action(model)
+        assert action is not None
+        # The entries of the previous searches must not end the search at
+        # the root as if the game tree had been exhausted
+        assert agent.searched_depth > 1
+        model.play(action)
+        model.play(model.possible_actions[0])
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from two_player_games.agent.minimax.naive import MaxiMinNaive
+from two_player_games.agent.minimax.negamax import NegamaxPVS
+from two_player_games.model import Model
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    OthelloBitboard,
+)
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize(
+    ("model_type", "depth"),
+    [(TicTacToe, 9), (Connect4Bitboard, 4), (OthelloBitboard, 3)],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_value_matches_naive_maximin(
+    model_type: type[Model[Any, Any, Any]],
+    depth: int,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    model = model_type()
+    for _ in range(rng.randrange(1, 5)):
+        model.play(rng.choice(model.possible_actions))
+    turn = model.turn
+    expected, _ = MaxiMinNaive(depth, turn).maximin(model, depth, turn)
+    agent: NegamaxPVS[Any, Any, Any] = NegamaxPVS(depth, turn)
+    reward, action = agent.maximin(model, depth, turn)
+    assert reward == expected
+    assert action in model.possible_actions
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from two_player_games.agent.arg import parse_ordering
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.minimax.ordering import (
+    MoveOrdering,
+    OrderingSource,
+)
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical import VerticalBoardAction
+from two_player_games.model.board.vertical.connect4 import Connect4
+
+
+def test_order_by_source() -> None:
+    model = Connect4()
+    ordering: MoveOrdering[VerticalBoardAction] = MoveOrdering(
+        OrderingSource.NONE,
+    )
+    assert ordering.order(model, 0, 6) == [0, 1, 2, 3, 4, 5, 6]
+    ordering.sources = OrderingSource.PRIOR
+    assert ordering.order(model, 0) == [3, 2, 4, 1, 5, 0, 6]
+    ordering.sources = OrderingSource.HISTORY | OrderingSource.KILLERS
+    ordering.record_cutoff(5, 1, 2)
+    ordering.record_cutoff(6, 0, 1)
+    ordering.record_cutoff(0, 0, 1)
+    # The latest killer goes first, then the other one, then by history
+    assert ordering.order(model, 0) == [0, 6, 5, 1, 2, 3, 4]
+    assert ordering.order(model, 1) == [5, 0, 6, 1, 2, 3, 4]
+    ordering.sources = OrderingSource.ALL
+    assert ordering.order(model, 0, 3) == [3, 0, 6, 5, 2, 4, 1]
+    ordering.new_search()
+    # Killers are cleared, and aging halves the history scores
+    assert ordering.order(model, 0) == [5, 3, 2, 4, 1, 0, 6]
+
+
+@pytest.mark.parametrize(
+    ("value", "ordering"),
+    [
+        ("hash", OrderingSource.HASH),
+        ("killers, history", OrderingSource.KILLERS | OrderingSource.HISTORY),
+        ("all", OrderingSource.ALL),
+        ("none", OrderingSource.NONE),
+    ],
+)
+def test_parse_ordering(value: str, ordering: OrderingSource) -> None:
+    assert parse_ordering(value) == ordering
+
+
+def test_parse_invalid_ordering() -> None:
+    with pytest.raises(ValueError):
+        parse_ordering("hash,best")
+
+
+def test_ordering_prunes_more_with_the_same_value() -> None:
+    model = TicTacToe()
+    model.play((0, 1))
+    turn = model.turn
+    values, nodes = [], []
+    for sources in (OrderingSource.NONE, OrderingSource.ALL):
+        agent: AlphaBetaPruning[
+            HorizontalBoardAction,
+            BoardState,
+            BoardChange,
+        ] = AlphaBetaPruning(8, turn, ordering=sources)
+        values.append(agent.maximin(model, 8, turn)[0])
+        nodes.append(agent.nodes)
+    assert values[0] == values[1]
+    assert nodes[1] < nodes[0]
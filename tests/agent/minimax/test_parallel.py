@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.minimax.ordering import OrderingSource
+from two_player_games.model import Model
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    OthelloBitboard,
+)
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize(
+    ("model_type", "depth"),
+    [(TicTacToe, 7), (Connect4Bitboard, 5), (OthelloBitboard, 3)],
+)
+def test_value_matches_serial_search(
+    model_type: type[Model[Any, Any, Any]],
+    depth: int,
+) -> None:
+    rng = random.Random(0)
+    model = model_type()
+    for _ in range(2):
+        model.play(rng.choice(model.possible_actions))
+    turn = model.turn
+    serial: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(
+        depth,
+        turn,
+        ordering=OrderingSource.ALL,
+    )
+    parallel: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(
+        depth,
+        turn,
+        ordering=OrderingSource.ALL,
+        workers=2,
+    )
+    key = model.key
+    expected, _ = serial.maximin(model, depth, turn)
+    assert parallel.maximin(model, depth, turn)[0] == expected
+    assert model.key == key
+    parallel.close()
+    assert parallel._executor is None
+
+
+@pytest.mark.parametrize(
+    ("model_type", "actions", "depth"),
+    [
+        # The first root action wins, so that only the workers' searches
+        # are depth-limited
+        (TicTacToe, [(0, 0), (1, 0), (0, 1), (1, 1)], 3),
+        (Connect4Bitboard, [3, 3], 4),
+    ],
+)
+def test_iterative_deepening_matches_serial_search(
+    model_type: type[Model[Any, Any, Any]],
+    actions: list[Any],
+    depth: int,
+) -> None:
+    model = model_type()
+    for action in actions:
+        model.play(action)
+    turn = model.turn
+    serial: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(
+        depth,
+        turn,
+        time_budget=60,
+    )
+    parallel: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(
+        depth,
+        turn,
+        time_budget=60,
+        workers=2,
+    )
+    serial.select_action(model)
+    parallel.select_action(model)
+    parallel.close()
+    assert parallel.searched_depth == serial.searched_depth == depth
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from two_player_games.agent.minimax import MaxiMin
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.minimax.naive import MaxiMinNaive
+from two_player_games.agent.minimax.negamax import NegamaxPVS
+from two_player_games.model import Model
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize(
+    ("agent_type", "model_type", "actions", "depth"),
+    [
+        (MaxiMinNaive, TicTacToe, [(1, 1)], 8),
+        (NegamaxPVS, TicTacToe, [], 9),
+        (NegamaxPVS, Connect4Bitboard, [], 5),
+    ],
+)
+def test_root_actions_are_searched_once(
+    agent_type: type[MaxiMin[Any, Any, Any]],
+    model_type: type[Model[Any, Any, Any]],
+    actions: list[Any],
+    depth: int,
+) -> None:
+    model = model_type()
+    for action in actions:
+        model.play(action)
+    turn = model.turn
+    plain = agent_type(depth, turn)
+    expected, _ = plain.maximin(model, depth, turn)
+    agent = agent_type(depth, turn, symmetric=True)
+    action = agent.select_action(model)
+    assert agent.nodes < plain.nodes
+    model.push(action)
+    assert agent_type(depth, turn).maximin(model, depth - 1, -turn)[0] == (
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("model_type", "depth"),
+    [(TicTacToe, 8), (Connect4Bitboard, 5)],
+)
+def test_transposition_table_merges_symmetric_positions(
+    model_type: type[Model[Any, Any, Any]],
+    depth: int,
+) -> None:
+    model = model_type()
+    model.play(model.possible_actions[0])
+    turn = model.turn
+    expected, _ = AlphaBetaPruning(depth, turn).maximin(model, depth, turn)
+    agent: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(
+        depth,
+        turn,
+        16,
+        symmetric=True,
+    )
+    reward, action = agent.maximin(model, depth, turn)
+    assert reward == expected
+    assert action in model.possible_actions
+    plain: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(depth, turn, 16)
+    plain.maximin(model, depth, turn)
+    assert agent.nodes < plain.nodes
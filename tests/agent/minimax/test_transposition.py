@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.minimax.transposition import (
+    EXACT,
+    LOWER,
+    UPPER,
+    TranspositionTable,
+)
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+
+
+def test_size_follows_memory_budget() -> None:
+    assert len(TranspositionTable(1)) * 21 <= 2**20
+    assert len(TranspositionTable(1)) > len(TranspositionTable(0.25))
+
+
+def test_depth_preferred_and_always_replace_entries() -> None:
+    table = TranspositionTable(0.001)
+    bucket_num = len(table) // 2
+    deep, shallow, other = 1, 1 + bucket_num, 1 + 2 * bucket_num
+    table.store(deep, 5, 1.0, EXACT, 2)
+    table.store(shallow, 3, -1.0, LOWER, 0)
+    assert table.probe(deep) == (5, 1.0, EXACT, 2)
+    assert table.probe(shallow) == (3, -1.0, LOWER, 0)
+    # A shallower entry only evicts the always-replace entry
+    table.store(other, 1, 0.0, UPPER, 1)
+    assert table.probe(deep) == (5, 1.0, EXACT, 2)
+    assert table.probe(shallow) is None
+    assert table.probe(other) == (1, 0.0, UPPER, 1)
+    assert table.hits == 4
+    assert table.probes == 5
+
+
+@pytest.mark.parametrize(
+    "actions",
+    [[(1, 1)], [(0, 0), (1, 1)], [(0, 1), (0, 0), (2, 2)]],
+)
+def test_alpha_beta_value_is_unchanged(
+    actions: list[HorizontalBoardAction],
+) -> None:
+    model = TicTacToe()
+    for action in actions:
+        model.play(action)
+    turn = model.turn
+    agent: AlphaBetaPruning[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = AlphaBetaPruning(9, turn)
+    cached_agent: AlphaBetaPruning[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = AlphaBetaPruning(9, turn, 1)
+    expected = agent.maximin(model, 9, turn)[0]
+    value, best_action = cached_agent.maximin(model, 9, turn)
+    assert value == expected
+    assert best_action in model.possible_actions
+    assert cached_agent.transposition_table is not None
+    assert cached_agent.transposition_table.cutoffs > 0
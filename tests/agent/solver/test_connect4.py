@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from two_player_games.agent.solver.connect4 import (
+    WIN,
+    Connect4Solver,
+    winning_cells,
+)
+from two_player_games.model.board.vertical.connect4 import Connect4
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    COL_HEIGHT,
+    Connect4Bitboard,
+)
+
+
+def exact_reward(model: Connect4) -> float:
+    """Return the reward of the player to move by searching every action."""
+    if model.is_over():
+        return model.reward(model.turn)
+    if not model.possible_actions:
+        return 0
+    best = float("-inf")
+    for action in model.possible_actions:
+        model.push(action)
+        best = max(best, -exact_reward(model))
+        model.pop()
+    return best
+
+
+def random_position(seed: int, empties: int) -> Connect4 | None:
+    """Return a running game with the given number of empty cells."""
+    rng = random.Random(seed)
+    model = Connect4()
+    for _ in range(model.state.size - empties):
+        actions = model.possible_actions.copy()
+        rng.shuffle(actions)
+        for action in actions:
+            model.push(action)
+            if not model.is_over():
+                break
+            model.pop()
+        else:
+            return None
+    return model
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_solve_matches_exhaustive_search(seed: int) -> None:
+    model = random_position(seed, 9)
+    if model is None:
+        pytest.skip("Every random game ended early")
+    reward, action = Connect4Solver(empties=9).solve(model)
+    assert reward == exact_reward(model)
+    model.push(action)
+    assert -exact_reward(model) == reward
+
+
+def test_solve_wins_immediately() -> None:
+    solver = Connect4Solver(empties=42)
+    model = Connect4Bitboard()
+    for action in (0, 6, 0, 6, 0, 1):
+        model.play(action)
+    # Winning moves are played without searching the rest of the game
+    assert solver.solve(model) == (WIN, 0)
+    assert solver.nodes == 0
+
+
+def test_winning_cells() -> None:
+    # Three discs at the bottom of the columns 1 to 3
+    own = sum(1 << (column * COL_HEIGHT) for column in range(1, 4))
+    assert winning_cells(own, own) == 1 | 1 << (4 * COL_HEIGHT)
+    assert winning_cells(own, own | 1) == 1 << (4 * COL_HEIGHT)
+
+
+def test_can_solve_counts_empty_cells() -> None:
+    model = Connect4()
+    assert not Connect4Solver().can_solve(model)
+    assert Connect4Solver(empties=42).can_solve(model)
+    for action in (0, 1, 0, 1, 0, 1, 0):
+        model.play(action)
+    assert not Connect4Solver(empties=42).can_solve(model)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from two_player_games.agent.arg import AgentArg, AgentOptions, SolverArg
+from two_player_games.agent.random import Random
+from two_player_games.agent.solver import SolvingAgent
+from two_player_games.agent.solver.othello import (
+    QUADRANTS,
+    OthelloSolver,
+    odd_regions,
+)
+from two_player_games.common import Category, Turn
+from two_player_games.model.board.horizontal.othello import Othello
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    OthelloBitboard,
+)
+
+
+def exact_reward(model: Othello | OthelloBitboard) -> float:
+    """Return the reward of the player to move by searching every action."""
+    if model.is_over():
+        return model.reward(model.turn)
+    best = float("-inf")
+    actions: list[tuple[int, int] | None] = [*model.possible_actions]
+    for action in actions or [None]:
+        model.push(action)
+        best = max(best, -exact_reward(model))
+        model.pop()
+    return best
+
+
+def random_position(
+    model: Othello | OthelloBitboard,
+    seed: int,
+    empties: int,
+) -> None:
+    """Play random actions until the given number of empty cells remain."""
+    rng = random.Random(seed)
+    while not model.is_over() and (model.state == 0).sum() > empties:
+        model.play(
+            (
+                rng.choice(model.possible_actions)
+                if model.possible_actions
+                else None
+            ),
+        )
+
+
+@pytest.mark.parametrize("model_type", [Othello, OthelloBitboard])
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_matches_exhaustive_search(
+    model_type: type[Othello | OthelloBitboard],
+    seed: int,
+) -> None:
+    model = model_type()
+    random_position(model, seed, 7)
+    reward, action = OthelloSolver().solve(model)
+    assert reward == exact_reward(model)
+    model.push(action)
+    assert -exact_reward(model) == reward
+
+
+def test_odd_regions() -> None:
+    assert odd_regions(0) == 0
+    # A single empty cell in the top left quadrant, and two in the last one
+    assert odd_regions(1 | 1 << 62 | 1 << 63) == QUADRANTS[0]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_solving_agent_switches_to_the_solver(seed: int) -> None:
+    agent = AgentArg.RANDOM.create(
+        Category.HORIZONTAL_BOARD,
+        None,
+        AgentOptions(Turn.FIRST, solver=SolverArg.OTHELLO, solver_empties=6),
+    )
+    assert isinstance(agent, SolvingAgent)
+    assert isinstance(agent.agent, Random)
+    model: Any = OthelloBitboard()
+    random_position(model, seed, 10)
+    assert not agent.solver.can_solve(model)
+    random_position(model, seed, 6)
+    if model.is_over():
+        pytest.skip("The random game ended early")
+    turn = model.turn
+    reward = exact_reward(model)
+    # The agent plays perfectly for both players
+    while not model.is_over():
+        assert model.push(agent.select_action(model))
+    assert model.reward(turn) == reward
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.solver.tic_tac_toe import (
+    UNSOLVED,
+    TicTacToeSolver,
+    solved_table,
+)
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+
+
+def exact_reward(model: TicTacToe, rewards: dict[bytes, float]) -> float:
+    """
+    Return the reward of the player to move by searching every action, and
+    record it for every running position reached.
+    """
+    if model.is_over():
+        return model.reward(model.turn)
+    if not model.possible_actions:
+        # The board is full, and the game ends in a draw once the player
+        # passes
+        return 0
+    key = model.state.tobytes()
+    if key not in rewards:
+        best = float("-inf")
+        for action in model.possible_actions:
+            model.push(action)
+            best = max(best, -exact_reward(model, rewards))
+            model.pop()
+        rewards[key] = best
+    return rewards[key]
+
+
+def test_table_matches_exhaustive_search() -> None:
+    model = TicTacToe()
+    rewards: dict[bytes, float] = {}
+    exact_reward(model, rewards)
+    # The running positions, which are 627 up to symmetry
+    assert len(rewards) == 4520
+    assert (solved_table() != UNSOLVED).sum() == 627
+    solver = TicTacToeSolver()
+    checked: set[bytes] = set()
+
+    def check(model: TicTacToe) -> None:
+        key = model.state.tobytes()
+        if model.is_over() or key in checked:
+            return
+        checked.add(key)
+        reward, action = solver.solve(model)
+        assert reward == exact_reward(model, rewards)
+        model.push(action)
+        assert -exact_reward(model, rewards) == reward
+        model.pop()
+        for child in model.possible_actions:
+            model.push(child)
+            check(model)
+            model.pop()
+
+    check(model)
+
+
+def test_unreachable_position() -> None:
+    model = TicTacToe()
+    model.state[0, :] = model.turn
+    with pytest.raises(ValueError, match="not reachable"):
+        TicTacToeSolver().solve(model)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_alpha_beta_matches_the_table(seed: int) -> None:
+    rng = random.Random(seed)
+    model = TicTacToe()
+    for _ in range(rng.randrange(1, 4)):
+        model.play(rng.choice(model.possible_actions))
+    turn = model.turn
+    agent: AlphaBetaPruning[Any, Any, Any] = AlphaBetaPruning(9, turn)
+    reward, action = agent.maximin(model, 9, turn)
+    assert reward == TicTacToeSolver().solve(model)[0]
+    model.push(action)
+    assert -TicTacToeSolver().solve(model)[0] == reward
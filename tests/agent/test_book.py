@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from two_player_games import book
+from two_player_games.agent.arg import AgentArg, AgentOptions
+from two_player_games.agent.book import (
+    BookAgent,
+    BookEntry,
+    OpeningBook,
+    build_book,
+    write_book,
+)
+from two_player_games.agent.mcts import MCTS
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.agent.solver.tic_tac_toe import TicTacToeSolver
+from two_player_games.common import Category, Turn
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.fixture(name="tic_tac_toe_book", scope="module")
+def fixture_tic_tac_toe_book(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    agents: dict[int, AlphaBetaPruning[Any, Any, Any]] = {
+        turn: AlphaBetaPruning(9, turn, 16) for turn in Turn
+    }
+    entries = build_book(TicTacToe(), agents, 2)
+    path = tmp_path_factory.mktemp("book") / "tictactoe.book"
+    write_book(path, entries)
+    return path
+
+
+def test_book_holds_the_best_actions(tic_tac_toe_book: Path) -> None:
+    solver = TicTacToeSolver()
+    model = TicTacToe()
+    with OpeningBook(tic_tac_toe_book) as opening_book:
+        # The start position, and those after 1 and 2 plies up to symmetry
+        assert len(opening_book) == 1 + 3 + 12
+        keys = list(opening_book)
+        assert keys == sorted(keys)
+
+        def check(ply: int) -> None:
+            value, _ = solver.solve(model)
+            key, symmetry = model.canonical_key()
+            entry = opening_book.get(key)
+            assert entry is not None
+            assert entry.score == value
+            (action,) = (
+                action
+                for action in model.possible_actions
+                if model.symmetric_cell(action, symmetry) == entry.action
+            )
+            model.push(action)
+            assert -solver.solve(model)[0] == value
+            model.pop()
+            if ply < 2:
+                for child in model.possible_actions:
+                    model.push(child)
+                    check(ply + 1)
+                    model.pop()
+
+        check(0)
+
+
+def test_book_agent_falls_back_on_misses(tic_tac_toe_book: Path) -> None:
+    agent = AgentArg.MCTS.create(
+        Category.HORIZONTAL_BOARD,
+        None,
+        AgentOptions(Turn.FIRST, iterations=50, book=str(tic_tac_toe_book)),
+    )
+    assert isinstance(agent, BookAgent)
+    assert isinstance(agent.agent, MCTS)
+    model = TicTacToe()
+    for _ in range(4):
+        assert model.push(agent.select_action(model))
+    # Only the positions within 2 plies are in the book
+    assert (agent.hits, agent.misses) == (3, 1)
+    agent.book.close()
+
+
+def test_invalid_book(tmp_path: Path) -> None:
+    path = tmp_path / "invalid.book"
+    path.write_bytes(b"not a book")
+    with pytest.raises(ValueError, match="Not an opening book"):
+        OpeningBook(path)
+
+
+def test_write_book_sorts_records(tmp_path: Path) -> None:
+    path = tmp_path / "sorted.book"
+    entries = {key: BookEntry(key % 7, key / 2) for key in (5, 2**63, 3, 1)}
+    write_book(path, entries)
+    with OpeningBook(path) as opening_book:
+        assert list(opening_book) == [1, 3, 5, 2**63]
+        for key, entry in entries.items():
+            assert opening_book.get(key) == entry
+        assert opening_book.get(4) is None
+
+
+def test_main(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "connect4.book"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "2pg-book",
+            "-m",
+            "connect4-bitboard",
+            "-a",
+            "maximin-alpha-beta:depth=2",
+            "-n",
+            "1",
+            "-o",
+            str(path),
+        ],
+    )
+    book.main()
+    with OpeningBook(path) as opening_book:
+        # The mirror of each column but the central one is the same position
+        assert len(opening_book) == 1 + 4
+        assert opening_book.get(Connect4Bitboard().key) is not None
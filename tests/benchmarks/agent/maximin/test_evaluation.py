@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore
+
+from two_player_games.agent.arg import EvaluatorArg
+from two_player_games.common import Turn
+from two_player_games.model import Model
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    OthelloBitboard,
+)
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize(
+    ("evaluator_arg", "model_type", "plies"),
+    [
+        (EvaluatorArg.CONNECT4, Connect4Bitboard, 12),
+        (EvaluatorArg.OTHELLO, OthelloBitboard, 20),
+    ],
+)
+@pytest.mark.benchmark(group="evaluation", disable_gc=True)
+def test_bitboard_evaluation(
+    benchmark: BenchmarkFixture,
+    evaluator_arg: EvaluatorArg,
+    model_type: type[Model[Any, Any, Any]],
+    plies: int,
+) -> None:
+    evaluator = evaluator_arg.get_evaluator()
+    rng = random.Random(0)
+    model = model_type()
+    for _ in range(plies):
+        model.play(rng.choice(model.possible_actions))
+    key = model.key
+    result: float = benchmark(evaluator.evaluate, model, Turn.FIRST)
+    assert -1 < result < 1
+    assert model.key == key
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from numpy.typing import NDArray
+from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore
+
+from two_player_games.agent.minimax.negamax import NegamaxPVS
+from two_player_games.common import Turn
+from two_player_games.config.board.tic_tac_toe import TICTACTOE
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.presenter import Presenter
+from two_player_games.view.hidden import HiddenView
+
+TICTACTOE_ARRAY = np.array(
+    [
+        [1, 1, -1],
+        [-1, -1, 1],
+        [1, -1, 1],
+    ],
+)
+
+
+def negamax_pvs() -> NDArray[np.int8]:
+    model = TicTacToe()
+    config = TICTACTOE
+    first_agent: NegamaxPVS[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = NegamaxPVS(6, Turn.FIRST)
+    second_agent: NegamaxPVS[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = NegamaxPVS(6, Turn.SECOND)
+    view: HiddenView[HorizontalBoardAction, BoardState, BoardChange] = (
+        HiddenView(config)
+    )
+    presenter = Presenter(model, first_agent, second_agent, view, False)
+    presenter.main_loop()
+    return model.state
+
+
+@pytest.mark.benchmark(group="maximin", disable_gc=True, warmup=False)
+def test_negamax_pvs(benchmark: BenchmarkFixture) -> None:
+    result: NDArray[np.int8] = benchmark(negamax_pvs)
+    assert_array_equal(result, TICTACTOE_ARRAY)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore
+
+from two_player_games.agent.random import Random
+from two_player_games.agent.solver import SolvingAgent
+from two_player_games.agent.solver.tic_tac_toe import TicTacToeSolver
+from two_player_games.common import Status
+from two_player_games.config.board.tic_tac_toe import TICTACTOE
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.presenter import Presenter
+from two_player_games.view.hidden import HiddenView
+
+
+def solved_table_lookup() -> Status:
+    model = TicTacToe()
+    config = TICTACTOE
+    first_agent: SolvingAgent[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = SolvingAgent(Random(), TicTacToeSolver())
+    second_agent: SolvingAgent[
+        HorizontalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = SolvingAgent(Random(), TicTacToeSolver())
+    view: HiddenView[HorizontalBoardAction, BoardState, BoardChange] = (
+        HiddenView(config)
+    )
+    presenter = Presenter(model, first_agent, second_agent, view, False)
+    presenter.main_loop()
+    return model.status
+
+
+@pytest.mark.benchmark(group="solver", disable_gc=True, warmup=False)
+def test_solved_table_lookup(benchmark: BenchmarkFixture) -> None:
+    result: Status = benchmark(solved_table_lookup)
+    # Perfect play draws
+    assert result == Status.DRAW
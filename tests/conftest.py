@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+
+from two_player_games.model import VERIFY_ENV
+
+
+@pytest.fixture(autouse=True)
+def verify_models(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that searches restore the models they explore."""
+    monkeypatch.setenv(VERIFY_ENV, "1")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from two_player_games.common import MARK_EMPTY
+from two_player_games.model.board.horizontal.othello import Othello
+
+
+def expected_frontier(model: Othello) -> list[bool]:
+    """Return whether each flat cell is empty and next to a disc."""
+    occupied = model.state != MARK_EMPTY
+    # Whether any of the eight neighbours of each cell is occupied
+    padded = np.pad(occupied, 1)
+    row_num, col_num = occupied.shape
+    near_disc = sum(
+        padded[d_row:, d_col:][:row_num, :col_num]
+        for d_row in range(3)
+        for d_col in range(3)
+    )
+    return list((~occupied & (near_disc > 0)).ravel())
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_frontier_is_restored_by_pop(seed: int) -> None:
+    rng = random.Random(seed)
+    model = Othello()
+    frontiers = []
+    while not model.is_over():
+        # pylint: disable=protected-access
+        assert_array_equal(model._frontier, expected_frontier(model))
+        frontiers.append(model._frontier.copy())
+        action = (
+            rng.choice(model.possible_actions)
+            if model.possible_actions
+            else None
+        )
+        assert model.push(action)
+    for frontier in reversed(frontiers):
+        model.pop()
+        assert_array_equal(model._frontier, frontier)
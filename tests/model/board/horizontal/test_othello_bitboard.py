@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from numpy.testing import assert_array_equal
+
+from two_player_games.model.board.horizontal.othello import Othello
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    OthelloBitboard,
+)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_game_matches_othello(seed: int) -> None:
+    rng = random.Random(seed)
+    model = Othello()
+    bitboard = OthelloBitboard()
+    while not model.is_over():
+        assert bitboard.possible_actions == model.possible_actions
+        action = (
+            rng.choice(model.possible_actions)
+            if model.possible_actions
+            else None
+        )
+        assert model.play(action)
+        assert bitboard.play(action)
+        assert_array_equal(bitboard.state, model.state)
+        assert sorted(bitboard.changes) == sorted(model.changes)
+        assert bitboard.scores == model.scores
+        assert bitboard.status == model.status
+        assert bitboard.turn == model.turn
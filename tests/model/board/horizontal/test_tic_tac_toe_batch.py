@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from two_player_games.common import Turn
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.horizontal.tic_tac_toe_batch import (
+    TicTacToeBatch,
+)
+from two_player_games.model.board.lines import cell_windows, line_windows
+
+
+def test_line_windows() -> None:
+    assert len(line_windows(3, 3, 3)) == 8
+    assert len(line_windows(6, 7, 4)) == 69
+    # The centre is on four lines, and each corner on three
+    assert_array_equal(
+        [
+            len({tuple(line) for line in lines})
+            for lines in cell_windows(3, 3, 3)
+        ],
+        [3, 2, 3, 2, 4, 2, 3, 2, 3],
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_games_match_tic_tac_toe(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    batch = TicTacToeBatch(50)
+    models = [TicTacToe() for _ in range(batch.size)]
+    while not batch.is_terminal().all():
+        actions = batch.random_actions(rng)
+        for model, action in zip(models, actions):
+            if not model.is_over():
+                assert model.play(divmod(int(action), 3))
+            if not model.is_over() and not model.possible_actions:
+                model.play(None)
+        batch.step(actions)
+        for index, model in enumerate(models):
+            assert_array_equal(batch.states[index], model.state)
+            assert batch.is_terminal()[index] == model.is_over()
+    assert_array_equal(
+        batch.reward(Turn.FIRST),
+        [model.reward(Turn.FIRST) for model in models],
+    )
+
+
+def test_play_out() -> None:
+    batch = TicTacToeBatch(100)
+    batch.play_out(np.random.default_rng(0))
+    assert batch.is_terminal().all()
+    # X has an extra mark in drawn and X-won games
+    assert_array_equal(
+        (batch.states == 1).sum(axis=(1, 2))
+        - (batch.states == -1).sum(axis=(1, 2)),
+        batch.winners != -1,
+    )
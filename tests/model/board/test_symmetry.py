@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from two_player_games.model.arg import ModelArg
+from two_player_games.model.board import Board, BoardState, zobrist_table
+from two_player_games.model.board.symmetry import (
+    mirror_symmetries,
+    square_symmetries,
+)
+
+
+def board_key(state: BoardState) -> int:
+    """Compute the Zobrist key of the marks of the given state."""
+    key = 0
+    for mark, cell_keys in zobrist_table(*state.shape).cells.items():
+        for cell, cell_key in cell_keys.items():
+            if state[cell] == mark:
+                key ^= cell_key
+    return key
+
+
+def test_symmetries_are_permutations() -> None:
+    for symmetries in (square_symmetries(8), mirror_symmetries(6, 7)):
+        assert (symmetries[0] == np.arange(symmetries.shape[1])).all()
+        assert (np.sort(symmetries, axis=1) == symmetries[0]).all()
+        assert len({tuple(symmetry) for symmetry in symmetries.tolist()}) == (
+            len(symmetries)
+        )
+
+
+@pytest.mark.parametrize("model_arg", list(ModelArg))
+@pytest.mark.parametrize("seed", range(3))
+def test_symmetric_keys(model_arg: ModelArg, seed: int) -> None:
+    rng = random.Random(seed)
+    model: Board[object] = model_arg.get_model()()
+    for _ in range(6):
+        model.play(
+            (
+                rng.choice(model.possible_actions)
+                if model.possible_actions
+                else None
+            ),
+        )
+        state = model.state
+        keys = model.symmetric_keys()
+        assert keys[0] == model.key
+        for symmetry, cells in enumerate(model.symmetries):
+            image = state.ravel()[cells].reshape(state.shape)
+            assert keys[symmetry] == (
+                model.key ^ board_key(state) ^ board_key(image)
+            )
+        assert model.canonical_key()[0] == min(keys)
+
+
+@pytest.mark.parametrize(
+    ("model_arg", "unique_num"),
+    [
+        (ModelArg.TICTACTOE, 3),
+        (ModelArg.CONNECT4, 4),
+        (ModelArg.CONNECT4_BITBOARD, 4),
+        (ModelArg.OTHELLO, 1),
+        (ModelArg.OTHELLO_BITBOARD, 1),
+    ],
+)
+def test_unique_actions(model_arg: ModelArg, unique_num: int) -> None:
+    model: Board[object] = model_arg.get_model()()
+    actions = model.unique_actions()
+    assert len(actions) == unique_num
+    # Every possible action leads to the image of the position after one of
+    # the unique actions
+    canonical_keys = set()
+    for action in actions:
+        model.push(action)
+        canonical_keys.add(model.canonical_key()[0])
+        model.pop()
+    for action in model.possible_actions:
+        model.push(action)
+        assert model.canonical_key()[0] in canonical_keys
+        model.pop()
+
+
+def test_symmetric_action() -> None:
+    model: Board[object] = ModelArg.TICTACTOE.get_model()()
+    model.play((0, 1))
+    key, symmetry = model.canonical_key()
+    # The image of the position after the image of an action is the image of
+    # the position after that action
+    image = ModelArg.TICTACTOE.get_model()()
+    image.play(model.symmetric_action((0, 1), symmetry))
+    assert image.key == key
+    connect4: Board[object] = ModelArg.CONNECT4.get_model()()
+    assert connect4.symmetric_action(0, 1) == 6
+    assert connect4.symmetric_cell(3, 1) == 3
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from two_player_games.model.arg import ModelArg
+from two_player_games.model.board import Board
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4 import Connect4
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize("model_arg", list(ModelArg))
+@pytest.mark.parametrize("seed", range(3))
+def test_key_is_updated_incrementally(model_arg: ModelArg, seed: int) -> None:
+    rng = random.Random(seed)
+    model: Board[object] = model_arg.get_model()()
+    keys = [model.key]
+    assert model.key == model.compute_key()
+    while not model.is_over():
+        action = (
+            rng.choice(model.possible_actions)
+            if model.possible_actions
+            else None
+        )
+        model.push(action)
+        assert model.key == model.compute_key()
+        keys.append(model.key)
+    while keys:
+        assert model.key == keys.pop()
+        if keys:
+            model.pop()
+
+
+def test_transpositions_share_a_key() -> None:
+    first = TicTacToe()
+    second = TicTacToe()
+    for action in ((0, 0), (1, 1), (2, 2)):
+        first.play(action)
+    for action in ((2, 2), (1, 1), (0, 0)):
+        second.play(action)
+    assert first.key == second.key
+    second.play((0, 1))
+    assert first.key != second.key
+
+
+def test_bitboard_keys_match() -> None:
+    model = Connect4()
+    bitboard = Connect4Bitboard()
+    for action in (3, 3, 4, 2, 6):
+        model.play(action)
+        bitboard.play(action)
+        assert bitboard.key == model.key
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from two_player_games.common import Turn
+from two_player_games.model.board.vertical.connect4 import Connect4
+from two_player_games.model.board.vertical.connect4_batch import Connect4Batch
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_games_match_connect4(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    batch = Connect4Batch(50)
+    models = [Connect4() for _ in range(batch.size)]
+    while not batch.is_terminal().all():
+        actions = batch.random_actions(rng)
+        for model, action in zip(models, actions):
+            if not model.is_over():
+                assert model.play(int(action))
+            # The model only ends a game on a full board after a pass
+            if not model.is_over() and not model.possible_actions:
+                model.play(None)
+        batch.step(actions)
+        for index, model in enumerate(models):
+            assert_array_equal(batch.states[index], model.state)
+            assert batch.is_terminal()[index] == model.is_over()
+    assert_array_equal(
+        batch.reward(Turn.SECOND),
+        [model.reward(Turn.SECOND) for model in models],
+    )
+
+
+def test_step_detects_wins_per_board() -> None:
+    batch = Connect4Batch(2)
+    for actions in ([0, 6], [1, 0], [0, 6], [1, 1], [0, 5], [6, 2], [0, 5]):
+        batch.step(np.array(actions))
+    # The first board is won vertically, the second one horizontally
+    assert_array_equal(batch.is_terminal(), [True, False])
+    batch.step(np.array([0, 3]))
+    assert_array_equal(batch.reward(Turn.FIRST), [1, -1])
+    assert not batch.legal_mask().any()
+
+
+def test_reset_to_position() -> None:
+    model = Connect4()
+    for action in (3, 3, 3):
+        model.play(action)
+    batch = Connect4Batch(3)
+    batch.reset(model.state, model.turn)
+    assert_array_equal(batch.heights[:, 3], [3, 3, 3])
+    batch.step(np.array([3, 4, 3]))
+    assert_array_equal(batch.states[:, 2, 3], [-1, 0, -1])
+    batch.reset()
+    assert not batch.states.any()
+    assert batch.legal_mask().all()
+
+
+def test_illegal_action() -> None:
+    batch = Connect4Batch(1)
+    for _ in range(6):
+        batch.step(np.array([0]))
+    with pytest.raises(ValueError):
+        batch.step(np.array([0]))
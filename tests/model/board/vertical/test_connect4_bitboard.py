@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from numpy.testing import assert_array_equal
+
+from two_player_games.agent.minimax.alpha_beta_pruning import AlphaBetaPruning
+from two_player_games.common import Turn
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.vertical import VerticalBoardAction
+from two_player_games.model.board.vertical.connect4 import Connect4
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_game_matches_connect4(seed: int) -> None:
+    rng = random.Random(seed)
+    model = Connect4()
+    bitboard = Connect4Bitboard()
+    while not model.is_over():
+        assert bitboard.possible_actions == model.possible_actions
+        action = rng.choice(model.possible_actions)
+        assert model.play(action)
+        assert bitboard.play(action)
+        assert_array_equal(bitboard.state, model.state)
+        assert bitboard.changes == model.changes
+        assert bitboard.scores == model.scores
+        assert bitboard.status == model.status
+        assert bitboard.turn == model.turn
+
+
+def test_alpha_beta_pruning_matches_connect4() -> None:
+    model = Connect4()
+    bitboard = Connect4Bitboard()
+    for action in (3, 3, 2, 4):
+        model.play(action)
+        bitboard.play(action)
+    agent: AlphaBetaPruning[
+        VerticalBoardAction,
+        BoardState,
+        BoardChange,
+    ] = AlphaBetaPruning(4, Turn.FIRST)
+    expected = agent.maximin(model, 4, Turn.FIRST)
+    assert agent.maximin(bitboard, 4, Turn.FIRST) == expected
+    # The search must leave the position untouched
+    assert_array_equal(bitboard.state, model.state)
+    assert bitboard.possible_actions == model.possible_actions
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import random
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from two_player_games.common import Status, Turn
+from two_player_games.model import VERIFY_ENV, InvalidAction, Model
+from two_player_games.model.arg import ModelArg
+from two_player_games.model.board.horizontal.tic_tac_toe import TicTacToe
+from two_player_games.model.board.vertical.connect4 import Connect4
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    Connect4Bitboard,
+)
+
+
+@pytest.mark.parametrize("model_arg", list(ModelArg))
+@pytest.mark.parametrize("seed", range(3))
+def test_pop_restores_every_position(model_arg: ModelArg, seed: int) -> None:
+    rng = random.Random(seed)
+    model: Model[Any, Any, Any] = model_arg.get_model()()
+    history = []
+    while not model.is_over():
+        history.append(
+            (
+                model.state.copy(),
+                model.changes,
+                model.turn,
+                model.scores.copy(),
+                model.status,
+                # A copy, in case the list were modified in place
+                model.possible_actions.copy(),
+            ),
+        )
+        action = (
+            rng.choice(model.possible_actions)
+            if model.possible_actions
+            else None
+        )
+        assert model.push(action)
+    for state, changes, turn, scores, status, possible_actions in reversed(
+        history,
+    ):
+        model.pop()
+        assert_array_equal(model.state, state)
+        assert model.changes == changes
+        assert model.turn == turn
+        assert model.scores == scores
+        assert model.status == status
+        assert model.possible_actions == possible_actions
+
+
+@pytest.mark.parametrize("model_arg", list(ModelArg))
+def test_push_rejects_invalid_action(model_arg: ModelArg) -> None:
+    model: Model[Any, Any, Any] = model_arg.get_model()()
+    invalid = (-1, -1) if isinstance(model.possible_actions[0], tuple) else -1
+    assert not model.push(invalid)
+    with pytest.raises(IndexError):
+        model.pop()
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [Connect4, Connect4Bitboard, TicTacToe],
+)
+def test_legal_mask_follows_possible_actions(
+    model_class: type[Connect4 | TicTacToe],
+) -> None:
+    rng = random.Random(0)
+    model: Any = model_class()
+    masks = []
+    while not model.is_over() and model.possible_actions:
+        mask = model.legal_mask
+        expected = np.zeros_like(mask)
+        for action in model.possible_actions:
+            expected[action] = True
+        assert_array_equal(mask, expected)
+        masks.append(mask)
+        assert model.push(rng.choice(model.possible_actions))
+    for mask in reversed(masks):
+        model.pop()
+        assert_array_equal(model.legal_mask, mask)
+
+
+def test_peek_then_eval_only_verifies_on_demand(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def corrupt(model: Model[Any, Any, Any]) -> tuple[float, Any]:
+        model.state[0, 0] = 1
+        return 0, None
+
+    monkeypatch.delenv(VERIFY_ENV)
+    model = Connect4()
+    assert not model.verify
+    model.peek_then_eval(3, partial(corrupt))
+    model = Connect4()
+    model.verify = True
+    with pytest.raises(AssertionError, match="state not restored"):
+        model.peek_then_eval(3, partial(corrupt))
+
+
+def test_make_rejects_invalid_action() -> None:
+    model = Connect4()
+    model.make(3)
+    with pytest.raises(InvalidAction):
+        model.make(-1)
+    model.unmake()
+    assert model.turn == Turn.FIRST
+    assert not model._snapshots
+    with pytest.raises(IndexError):
+        model.unmake()
+
+
+def test_turn_is_a_plain_cell_mark() -> None:
+    model = TicTacToe()
+    for action in ((1, 1), (0, 0), (0, 1), (2, 2), (2, 1)):
+        # Enum members would slow down the search
+        assert type(model.turn) is int
+        assert model.play(action)
+    assert model.turn == Turn.SECOND
+    assert model.status == Status.FIRST_WON
+    assert model.scores == {Turn.FIRST: 1, Turn.SECOND: 0}
+    assert model.reward(Turn.FIRST) == model.reward(1) == 1
+    assert model.reward(-model.turn) == 1
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from two_player_games.agent.arg import AgentArg
+from two_player_games.agent.minimax.ordering import OrderingSource
+from two_player_games.common import Status
+from two_player_games.model.arg import ModelArg
+from two_player_games.tournament import (
+    Record,
+    format_elo,
+    parse_agent_spec,
+    play_game,
+    run_tournament,
+    score_to_elo,
+)
+
+
+def test_parse_agent_spec() -> None:
+    spec = parse_agent_spec("maximin-alpha-beta:depth=4,tt=8,order=all")
+    assert spec.agent == AgentArg.MAXIMIN_ALPHA_BETA_PRUNING
+    assert spec.options == {
+        "depth": 4,
+        "transposition_table_size": 8.0,
+        "ordering": OrderingSource.ALL,
+    }
+    assert parse_agent_spec("random").options == {}
+    # A time budget stops maximin searches without a depth
+    assert parse_agent_spec("negamax-pvs:time=1s").options == {
+        "time_budget": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["human", "unknown", "mcts:speed=1", "maximin-naive", "negamax-pvs:tt=8"],
+)
+def test_parse_invalid_agent_spec(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_agent_spec(value)
+
+
+def test_elo() -> None:
+    assert score_to_elo(0.5) == 0
+    assert score_to_elo(0.75) == pytest.approx(190.85, abs=0.01)
+    assert score_to_elo(1) == math.inf
+    record = Record(60, 20, 20)
+    assert record.score == 0.7
+    low, high = record.elo_interval()
+    assert low < record.elo() < high
+    assert record.reversed().elo() == pytest.approx(-record.elo())
+
+
+@pytest.mark.parametrize(
+    "record",
+    [Record(10, 0, 0), Record(0, 10, 0), Record(0, 0, 10), Record()],
+)
+def test_elo_interval_is_not_degenerate(record: Record) -> None:
+    low, high = record.elo_interval()
+    assert low < high
+    assert low <= record.elo() <= high
+
+
+def test_format_elo() -> None:
+    assert format_elo(Record(3, 0, 3).elo()) == "+0"
+    assert format_elo(-0.4) == "+0"
+    assert format_elo(190.85) == "+191"
+    assert format_elo(-math.inf) == "-inf"
+
+
+def test_play_game() -> None:
+    status = play_game(
+        ModelArg.TICTACTOE,
+        parse_agent_spec("maximin-alpha-beta:depth=9"),
+        parse_agent_spec("negamax-pvs:depth=9"),
+    )
+    assert status == Status.DRAW
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_tournament(workers: int) -> None:
+    specs = [
+        parse_agent_spec("random"),
+        parse_agent_spec("maximin-alpha-beta:depth=2"),
+    ]
+    records = run_tournament(ModelArg.TICTACTOE, specs, 10, workers)
+    record = records[(0, 1)]
+    assert record.games == 10
+    assert record.wins < record.losses
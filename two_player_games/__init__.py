@@ -4,7 +4,15 @@ import logging
 import sys
 from argparse import ArgumentParser
 
-from .agent.arg import AgentArg
+from .agent.arg import (
+    AgentArg,
+    AgentOptions,
+    EvaluatorArg,
+    SolverArg,
+    parse_duration,
+    parse_ordering,
+)
+from .agent.minimax.ordering import OrderingSource
 from .common import Turn
 from .model.arg import ModelArg
 from .presenter import Presenter
@@ -68,6 +76,190 @@ def main() -> None:
         dest="second_depth",
         type=int,
     )
+    arg_parser.add_argument(
+        "--tt1",
+        "--first-transposition-table",
+        dest="first_transposition_table_size",
+        type=float,
+        default=0,
+        metavar="MB",
+        help="Transposition table size of the first agent (alpha-beta only)",
+    )
+    arg_parser.add_argument(
+        "--tt2",
+        "--second-transposition-table",
+        dest="second_transposition_table_size",
+        type=float,
+        default=0,
+        metavar="MB",
+        help="Transposition table size of the second agent (alpha-beta only)",
+    )
+    arg_parser.add_argument(
+        "--time1",
+        "--first-time-budget",
+        dest="first_time_budget",
+        type=parse_duration,
+        metavar="DURATION",
+        help="Time per move of the first agent, e.g. 250ms (maximin and mcts)",
+    )
+    arg_parser.add_argument(
+        "--time2",
+        "--second-time-budget",
+        dest="second_time_budget",
+        type=parse_duration,
+        metavar="DURATION",
+        help="Time per move of the second agent, e.g. 2s (maximin and mcts)",
+    )
+    arg_parser.add_argument(
+        "--order1",
+        "--first-ordering",
+        dest="first_ordering",
+        type=parse_ordering,
+        default=OrderingSource.HASH,
+        metavar="SOURCES",
+        help=(
+            "Move ordering of the first agent, e.g. hash,killers,history,"
+            "prior or all (alpha-beta and negamax only)"
+        ),
+    )
+    arg_parser.add_argument(
+        "--order2",
+        "--second-ordering",
+        dest="second_ordering",
+        type=parse_ordering,
+        default=OrderingSource.HASH,
+        metavar="SOURCES",
+        help=(
+            "Move ordering of the second agent, e.g. hash,killers,history,"
+            "prior or all (alpha-beta and negamax only)"
+        ),
+    )
+    arg_parser.add_argument(
+        "--iterations1",
+        "--first-iterations",
+        dest="first_iterations",
+        type=int,
+        metavar="N",
+        help="Iterations per move of the first agent (mcts only)",
+    )
+    arg_parser.add_argument(
+        "--iterations2",
+        "--second-iterations",
+        dest="second_iterations",
+        type=int,
+        metavar="N",
+        help="Iterations per move of the second agent (mcts only)",
+    )
+    arg_parser.add_argument(
+        "--exploration1",
+        "--first-exploration",
+        dest="first_exploration",
+        type=float,
+        metavar="C",
+        help="Exploration constant of the first agent (mcts only)",
+    )
+    arg_parser.add_argument(
+        "--exploration2",
+        "--second-exploration",
+        dest="second_exploration",
+        type=float,
+        metavar="C",
+        help="Exploration constant of the second agent (mcts only)",
+    )
+    arg_parser.add_argument(
+        "-p1",
+        "--first-workers",
+        dest="first_workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Processes searching for the first agent (mcts and alpha-beta)",
+    )
+    arg_parser.add_argument(
+        "-p2",
+        "--second-workers",
+        dest="second_workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Processes searching for the second agent (mcts and alpha-beta)",
+    )
+    arg_parser.add_argument(
+        "--eval1",
+        "--first-evaluator",
+        dest="first_evaluator",
+        type=EvaluatorArg,
+        choices=EvaluatorArg,
+        help="Heuristic of the first agent at the depth limit (maximin only)",
+    )
+    arg_parser.add_argument(
+        "--eval2",
+        "--second-evaluator",
+        dest="second_evaluator",
+        type=EvaluatorArg,
+        choices=EvaluatorArg,
+        help="Heuristic of the second agent at the depth limit (maximin only)",
+    )
+    arg_parser.add_argument(
+        "--solve1",
+        "--first-solver",
+        dest="first_solver",
+        type=SolverArg,
+        choices=SolverArg,
+        help="Solver the first agent switches to once few empty cells remain",
+    )
+    arg_parser.add_argument(
+        "--solve2",
+        "--second-solver",
+        dest="second_solver",
+        type=SolverArg,
+        choices=SolverArg,
+        help="Solver the second agent switches to once few empty cells remain",
+    )
+    arg_parser.add_argument(
+        "--empties1",
+        "--first-solver-empties",
+        dest="first_solver_empties",
+        type=int,
+        metavar="N",
+        help="Empty cells from which the first agent solves the game",
+    )
+    arg_parser.add_argument(
+        "--empties2",
+        "--second-solver-empties",
+        dest="second_solver_empties",
+        type=int,
+        metavar="N",
+        help="Empty cells from which the second agent solves the game",
+    )
+    arg_parser.add_argument(
+        "--book1",
+        "--first-book",
+        dest="first_book",
+        metavar="PATH",
+        help="Opening book of the first agent",
+    )
+    arg_parser.add_argument(
+        "--book2",
+        "--second-book",
+        dest="second_book",
+        metavar="PATH",
+        help="Opening book of the second agent",
+    )
+    arg_parser.add_argument(
+        "--sym1",
+        "--first-symmetric",
+        dest="first_symmetric",
+        action="store_true",
+        help="Merge symmetric positions in the first agent's maximin search",
+    )
+    arg_parser.add_argument(
+        "--sym2",
+        "--second-symmetric",
+        dest="second_symmetric",
+        action="store_true",
+        help="Merge symmetric positions in the second agent's maximin search",
+    )
 
     args = arg_parser.parse_args()
     # TODO Variable types are already specified in the `add_argument` method;
@@ -84,38 +276,44 @@ def main() -> None:
     category = config.category
     view = arg_view.get_view()(config)
 
-    # TODO move these match statements to agent/arg.py
-    match arg_first_agent:
-        case AgentArg.HUMAN:
-            first_agent = arg_first_agent.get_agent(category)(view)
-        case (
-            AgentArg.MAXIMIN_NAIVE
-            | AgentArg.MAXIMIN_DEFENSIVE
-            | AgentArg.MAXIMIN_STOCHASTIC
-            | AgentArg.MAXIMIN_ALPHA_BETA_PRUNING
-        ):
-            first_agent = arg_first_agent.get_agent(category)(
-                arg_first_depth,
-                Turn.FIRST,
-            )
-        case _:
-            first_agent = arg_first_agent.get_agent(category)()
-
-    match arg_second_agent:
-        case AgentArg.HUMAN:
-            second_agent = arg_second_agent.get_agent(category)(view)
-        case (
-            AgentArg.MAXIMIN_NAIVE
-            | AgentArg.MAXIMIN_DEFENSIVE
-            | AgentArg.MAXIMIN_STOCHASTIC
-            | AgentArg.MAXIMIN_ALPHA_BETA_PRUNING
-        ):
-            second_agent = arg_second_agent.get_agent(category)(
-                arg_second_depth,
-                Turn.SECOND,
-            )
-        case _:
-            second_agent = arg_second_agent.get_agent(category)()
+    first_agent = arg_first_agent.create(
+        category,
+        view,
+        AgentOptions(
+            Turn.FIRST,
+            arg_first_depth,
+            args.first_transposition_table_size,
+            args.first_time_budget,
+            args.first_ordering,
+            args.first_iterations,
+            args.first_exploration,
+            args.first_workers,
+            args.first_evaluator,
+            args.first_solver,
+            args.first_solver_empties,
+            args.first_book,
+            args.first_symmetric,
+        ),
+    )
+    second_agent = arg_second_agent.create(
+        category,
+        view,
+        AgentOptions(
+            Turn.SECOND,
+            arg_second_depth,
+            args.second_transposition_table_size,
+            args.second_time_budget,
+            args.second_ordering,
+            args.second_iterations,
+            args.second_exploration,
+            args.second_workers,
+            args.second_evaluator,
+            args.second_solver,
+            args.second_solver_empties,
+            args.second_book,
+            args.second_symmetric,
+        ),
+    )
 
     presenter = Presenter(
         model(),
@@ -123,7 +321,10 @@ def main() -> None:
         second_agent,
         view,
     )
-    presenter.main_loop()
+    try:
+        presenter.main_loop()
+    finally:
+        presenter.close()
 
 
 if __name__ == "__main__":
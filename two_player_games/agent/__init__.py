@@ -21,3 +21,6 @@ class Agent(ABC, Generic[Action, State, Change]):
         # TODO If the view emits an event, it should be returned instead.
         # Currently, the view does not close before the game is over. This
         # change would allow the user to interrupt the game.
+
+    def close(self) -> None:
+        """Release the resources of the agent, e.g. its worker processes."""
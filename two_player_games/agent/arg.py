@@ -1,8 +1,139 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from enum import StrEnum
+from typing import Any
 
-from two_player_games.common import Category
+from two_player_games.agent import Agent
+from two_player_games.agent.book import BookAgent, OpeningBook
+from two_player_games.agent.minimax.evaluation import (
+    Connect4Evaluator,
+    Evaluator,
+    LineEvaluator,
+    OthelloEvaluator,
+)
+from two_player_games.agent.minimax.ordering import OrderingSource
+from two_player_games.agent.solver import Solver, SolvingAgent
+from two_player_games.common import Category, Turn
+from two_player_games.config.board.tic_tac_toe import TICTACTOE
+from two_player_games.view import View
+
+
+@dataclass
+class AgentOptions:
+    """The command line options used to instantiate an agent."""
+
+    turn: Turn
+    depth: int = 0
+    # The memory budget of the transposition table in megabytes
+    transposition_table_size: float = 0
+    # The time budget per move in seconds, which enables iterative deepening
+    time_budget: float | None = None
+    # The sources used to order actions in alpha-beta and negamax searches
+    ordering: OrderingSource = OrderingSource.HASH
+    # The number of MCTS iterations per move
+    iterations: int | None = None
+    # The UCT exploration constant, which defaults to sqrt(2)
+    exploration: float | None = None
+    # The number of processes searching in parallel
+    workers: int = 1
+    # The heuristic evaluating depth-limited positions in maximin searches
+    evaluator: EvaluatorArg | None = None
+    # The solver playing perfectly once few empty cells remain
+    solver: SolverArg | None = None
+    # The largest number of empty cells solved, which defaults to the solver's
+    solver_empties: int | None = None
+    # The path of the opening book played before searching
+    book: str | None = None
+    # Whether maximin searches merge symmetric positions
+    symmetric: bool = False
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration, e.g. "250ms", "2s" or "1.5", into seconds.
+
+    Durations without a unit are in seconds.
+    """
+    text = value.strip().lower()
+    try:
+        if text.endswith("ms"):
+            seconds = float(text[:-2]) / 1000
+        else:
+            seconds = float(text.removesuffix("s"))
+    except ValueError as exc:
+        raise ValueError(f"Invalid duration: {value!r}") from exc
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive: {value!r}")
+    return seconds
+
+
+def parse_flag(value: str) -> bool:
+    """Parse a flag, e.g. "1", "true" or "no"."""
+    text = value.strip().lower()
+    if text in ("1", "true", "yes", "on"):
+        return True
+    if text in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid flag: {value!r}")
+
+
+def parse_ordering(value: str) -> OrderingSource:
+    """
+    Parse comma-separated move ordering sources, e.g. "hash,killers".
+
+    "all" and "none" select all and none of the sources, respectively.
+    """
+    ordering = OrderingSource.NONE
+    for name in value.split(","):
+        try:
+            ordering |= OrderingSource[name.strip().upper()]
+        except KeyError as exc:
+            raise ValueError(f"Invalid ordering source: {name!r}") from exc
+    return ordering
+
+
+class EvaluatorArg(StrEnum):
+    CONNECT4 = "connect4"
+    OTHELLO = "othello"
+    TICTACTOE = "tictactoe"
+
+    def get_evaluator(self) -> Evaluator[Any, Any, Any]:
+        match self:
+            case EvaluatorArg.CONNECT4:
+                return Connect4Evaluator()
+            case EvaluatorArg.OTHELLO:
+                return OthelloEvaluator()
+            case EvaluatorArg.TICTACTOE:
+                return LineEvaluator(
+                    TICTACTOE.row_num,
+                    TICTACTOE.col_num,
+                    TICTACTOE.row_num,
+                )
+
+
+class SolverArg(StrEnum):
+    CONNECT4 = "connect4"
+    OTHELLO = "othello"
+    TICTACTOE = "tictactoe"
+
+    # pylint: disable=import-outside-toplevel
+    def get_solver(self, empties: int | None = None) -> Solver[Any, Any, Any]:
+        kwargs = {} if empties is None else {"empties": empties}
+        match self:
+            case SolverArg.CONNECT4:
+                from .solver.connect4 import Connect4Solver
+
+                return Connect4Solver(**kwargs)
+            case SolverArg.OTHELLO:
+                from .solver.othello import OthelloSolver
+
+                return OthelloSolver(**kwargs)
+            case SolverArg.TICTACTOE:
+                from .solver.tic_tac_toe import TicTacToeSolver
+
+                return TicTacToeSolver(**kwargs)
 
 
 class AgentArg(StrEnum):
@@ -13,6 +144,8 @@ class AgentArg(StrEnum):
     MAXIMIN_DEFENSIVE = "maximin-defensive"
     MAXIMIN_STOCHASTIC = "maximin-stochastic"
     MAXIMIN_ALPHA_BETA_PRUNING = "maximin-alpha-beta"
+    MCTS = "mcts"
+    NEGAMAX_PVS = "negamax-pvs"
     RANDOM = "random"
 
     # pylint: disable=import-outside-toplevel,too-many-return-statements
@@ -55,7 +188,101 @@ class AgentArg(StrEnum):
                 from .minimax.alpha_beta_pruning import AlphaBetaPruning
 
                 return AlphaBetaPruning
+
+            case AgentArg.NEGAMAX_PVS:
+                from .minimax.negamax import NegamaxPVS
+
+                return NegamaxPVS
+
+            case AgentArg.MCTS:
+                from .mcts import MCTS
+
+                return MCTS
             case AgentArg.RANDOM:
                 from .random import Random
 
                 return Random
+
+    def create(
+        self,
+        category: Category,
+        view: View[Any, Any, Any] | None,
+        options: AgentOptions,
+    ) -> Agent[Any, Any, Any]:
+        """
+        Instantiate the agent. Only the human agent needs a view.
+
+        With a solver, the agent plays perfectly once few empty cells remain.
+        With a book, it plays the actions of the book while it can.
+        """
+        agent = self._create(category, view, options)
+        if options.solver is not None:
+            agent = SolvingAgent(
+                agent,
+                options.solver.get_solver(options.solver_empties),
+            )
+        if options.book is not None:
+            agent = BookAgent(agent, OpeningBook(options.book))
+        return agent
+
+    def _create(
+        self,
+        category: Category,
+        view: View[Any, Any, Any] | None,
+        options: AgentOptions,
+    ) -> Agent[Any, Any, Any]:
+        agent: Callable[..., Agent[Any, Any, Any]] = self.get_agent(category)
+        evaluator = (
+            options.evaluator.get_evaluator()
+            if options.evaluator is not None
+            else None
+        )
+        match self:
+            case AgentArg.HUMAN:
+                if view is None:
+                    raise ValueError("The human agent needs a view")
+                return agent(view)
+            case (
+                AgentArg.MAXIMIN_NAIVE
+                | AgentArg.MAXIMIN_DEFENSIVE
+                | AgentArg.MAXIMIN_STOCHASTIC
+            ):
+                return agent(
+                    options.depth,
+                    options.turn,
+                    time_budget=options.time_budget,
+                    evaluator=evaluator,
+                    symmetric=options.symmetric,
+                )
+            case AgentArg.NEGAMAX_PVS:
+                return agent(
+                    options.depth,
+                    options.turn,
+                    time_budget=options.time_budget,
+                    ordering=options.ordering,
+                    evaluator=evaluator,
+                    symmetric=options.symmetric,
+                )
+            case AgentArg.MAXIMIN_ALPHA_BETA_PRUNING:
+                return agent(
+                    options.depth,
+                    options.turn,
+                    options.transposition_table_size,
+                    time_budget=options.time_budget,
+                    ordering=options.ordering,
+                    workers=options.workers,
+                    evaluator=evaluator,
+                    symmetric=options.symmetric,
+                )
+            case AgentArg.MCTS:
+                kwargs: dict[str, Any] = {}
+                if options.exploration is not None:
+                    kwargs["exploration"] = options.exploration
+                return agent(
+                    options.iterations,
+                    time_budget=options.time_budget,
+                    workers=options.workers,
+                    **kwargs,
+                )
+            case _:
+                return agent()
@@ -0,0 +1,187 @@
+"""
+Opening books, which store the best action of the positions near the start
+of the game, where searches are the most expensive.
+
+A book file starts with `MAGIC`, followed by fixed-size records sorted by the
+canonical Zobrist key of their position, see `Board.canonical_key`, so that
+symmetric positions share a record. Books are memory-mapped and
+binary-searched, so that opening one does not read it into memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import struct
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import NamedTuple
+
+from two_player_games.agent import Agent
+from two_player_games.common import CellMark
+from two_player_games.model import Action, Change, Model, State
+
+from .minimax import MaxiMin
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"2PGBOOK1"
+# The key, the score of the player to move and the action, as the cell of its
+# image in the canonical position, see `Board.symmetric_cell`
+RECORD = struct.Struct("<QfI")
+
+
+class BookEntry(NamedTuple):
+    """The cell of the best action of a position and its score."""
+
+    action: int
+    score: float
+
+
+def write_book(path: str | Path, entries: Mapping[int, BookEntry]) -> None:
+    """Write the given entries, keyed by position, to a book file."""
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        for key in sorted(entries):
+            entry = entries[key]
+            file.write(RECORD.pack(key, entry.score, entry.action))
+
+
+def build_book(
+    model: Model[Action, State, Change],
+    agents: Mapping[CellMark, MaxiMin[Action, State, Change]],
+    plies: int,
+) -> dict[int, BookEntry]:
+    """
+    Search every position reachable within `plies` plies of the given one,
+    up to symmetry, with the agent of the player to move, and return the
+    entries of those with an action.
+
+    Agents search to their fixed depth, from the perspective of the player
+    they are given for.
+    """
+    entries: dict[int, BookEntry] = {}
+    searched: set[int] = set()
+
+    def search(ply: int) -> None:
+        key, symmetry = model.canonical_key()
+        # The positions after symmetric ones are symmetric too
+        if model.is_over() or key in searched:
+            return
+        searched.add(key)
+        agent = agents[model.turn]
+        score, action = agent.maximin(model, agent.depth, agent.maximin_turn)
+        if action is not None:
+            entries[key] = BookEntry(
+                model.symmetric_cell(action, symmetry),
+                score,
+            )
+        if ply >= plies:
+            return
+        children: list[Action | None] = [*model.possible_actions]
+        for child in children or [None]:
+            model.make(child)
+            try:
+                search(ply + 1)
+            finally:
+                model.unmake()
+
+    search(0)
+    logger.info("Built %s book entries", len(entries))
+    return entries
+
+
+class OpeningBook:
+    """A memory-mapped book file."""
+
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not an opening book: {path}")
+        self.size = (len(self._map) - len(MAGIC)) // RECORD.size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(self.size):
+            yield self._record(index)[0]
+
+    def _record(self, index: int) -> tuple[int, float, int]:
+        key, score, action = RECORD.unpack_from(
+            self._map,
+            len(MAGIC) + index * RECORD.size,
+        )
+        return key, score, action
+
+    def get(self, key: int) -> BookEntry | None:
+        """Return the entry of the given key, or None if it is missing."""
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            middle_key, score, action = self._record(middle)
+            if middle_key == key:
+                return BookEntry(action, score)
+            if middle_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# TODO pylint: disable=too-few-public-methods
+class BookAgent(Agent[Action, State, Change]):
+    """
+    Play the action of the book while the position is in it, and let the
+    given agent select actions otherwise.
+    """
+
+    def __init__(
+        self,
+        agent: Agent[Action, State, Change],
+        book: OpeningBook,
+    ) -> None:
+        super().__init__()
+        self.agent = agent
+        self.book = book
+        # The number of positions found in the book, and of those missing
+        self.hits = 0
+        self.misses = 0
+
+    def select_action(
+        self,
+        model: Model[Action, State, Change],
+    ) -> Action | None:
+        key, symmetry = model.canonical_key()
+        entry = self.book.get(key)
+        if entry is not None:
+            # The action is also checked against the unlikely collisions of
+            # Zobrist keys
+            for action in model.possible_actions:
+                if model.symmetric_cell(action, symmetry) == entry.action:
+                    self.hits += 1
+                    logger.info("Book: %s scores %s", action, entry.score)
+                    return action
+        self.misses += 1
+        return self.agent.select_action(model)
+
+    def close(self) -> None:
+        self.agent.close()
+        self.book.close()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import logging
+import math
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from two_player_games.agent import Agent
+from two_player_games.common import Turn
+from two_player_games.model import Action, Change, Model, State
+
+from .tree import PASS, ROOT, Tree
+
+logger = logging.getLogger(__name__)
+
+EXPLORATION = math.sqrt(2)
+ITERATIONS = 1000
+# About 30 MB of zeroed arrays, which are only committed to memory as the tree
+# grows, see `Tree`
+MAX_NODES = 2**20
+
+
+# pylint: disable=too-many-arguments
+def _root_visits(
+    model: Model[Any, Any, Any],
+    iterations: int,
+    exploration: float,
+    time_budget: float | None,
+    max_nodes: int,
+    seed: int,
+) -> npt.NDArray[np.int64]:
+    """Search in a worker process and return the visits of each action."""
+    agent: MCTS[Any, Any, Any] = MCTS(
+        iterations,
+        exploration,
+        time_budget,
+        max_nodes,
+        seed,
+    )
+    tree = agent.search(model)
+    return tree.visits[tree.children(ROOT)]
+
+
+# TODO pylint: disable=too-many-instance-attributes
+class MCTS(Agent[Action, State, Change]):
+    """
+    Monte Carlo tree search with upper confidence bounds applied to trees
+    (UCT) and random playouts.
+
+    A playout scores 1 for a win, 0.5 for a draw and 0 for a loss.
+
+    With several workers, each worker process grows an independent tree from
+    the current position, and their visits of the root's children are summed
+    up (root parallelism).
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        iterations: int | None = None,
+        exploration: float = EXPLORATION,
+        time_budget: float | None = None,
+        max_nodes: int = MAX_NODES,
+        seed: int | None = None,
+        workers: int = 1,
+    ) -> None:
+        """
+        The search stops after `iterations` iterations or `time_budget`
+        seconds, whichever comes first. `iterations` does not limit the search
+        if it is not positive, and defaults to `ITERATIONS` without a time
+        budget. Each of the `workers` processes searches that long.
+        """
+        super().__init__()
+        if iterations is None:
+            iterations = ITERATIONS if time_budget is None else 0
+        if iterations <= 0 and time_budget is None:
+            print("MCTS iterations must be greater than 0.", file=sys.stderr)
+            sys.exit(1)
+        self.iterations = iterations
+        self.exploration = exploration
+        self.time_budget = time_budget
+        self.max_nodes = max_nodes
+        self._rng = random.Random(seed)
+        self.workers = workers
+        # Created on demand, and reused for the following moves
+        self._executor: ProcessPoolExecutor | None = None
+        # The tree of the last search in this process
+        self.tree = Tree(1)
+
+    def select_action(
+        self,
+        model: Model[Action, State, Change],
+    ) -> Action | None:
+        if not model.possible_actions:
+            return None
+        if self.workers > 1:
+            visits = self._search_in_parallel(model)
+        else:
+            tree = self.search(model)
+            visits = tree.visits[tree.children(ROOT)]
+        # The most visited action is the most robust choice
+        return model.possible_actions[int(visits.argmax())]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _search_in_parallel(
+        self,
+        model: Model[Action, State, Change],
+    ) -> npt.NDArray[np.int64]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+        futures = [
+            self._executor.submit(
+                _root_visits,
+                model,
+                self.iterations,
+                self.exploration,
+                self.time_budget,
+                self.max_nodes,
+                # Each worker needs its own random playouts
+                self._rng.getrandbits(64),
+            )
+            for _ in range(self.workers)
+        ]
+        visits = sum(future.result() for future in futures)
+        logger.info("MCTS: %s workers, root visits %s", self.workers, visits)
+        return visits
+
+    def search(self, model: Model[Action, State, Change]) -> Tree:
+        """Grow a new search tree from the current position of the model."""
+        start = perf_counter()
+        deadline = (
+            start + self.time_budget
+            if self.time_budget is not None
+            else float("inf")
+        )
+        self.tree = Tree(self.max_nodes)
+        iteration = 0
+        while self.iterations <= 0 or iteration < self.iterations:
+            if perf_counter() > deadline:
+                break
+            self._iterate(model)
+            iteration += 1
+        logger.info(
+            "MCTS: %s iterations, %s nodes in %.3fs",
+            iteration,
+            self.tree.size,
+            perf_counter() - start,
+        )
+        return self.tree
+
+    def _iterate(self, model: Model[Action, State, Change]) -> None:
+        """Select, expand, play out and backpropagate once."""
+        tree = self.tree
+        node = ROOT
+        path = [ROOT]
+        # The player who played the action leading to each node of the path
+        movers = [-model.turn]
+        # Selection and expansion, until reaching a node never visited before
+        while not model.is_over():
+            if not tree.is_expanded(node) and not tree.expand(
+                node,
+                len(model.possible_actions),
+            ):
+                # The tree is full: play out from this node
+                break
+            movers.append(model.turn)
+            node = tree.select(node, self.exploration)
+            action_index = tree.actions[node]
+            model.push(
+                (
+                    model.possible_actions[action_index]
+                    if action_index != PASS
+                    else None
+                ),
+            )
+            path.append(node)
+            if not tree.visits[node]:
+                break
+        # Playout
+        playout_length = 0
+        while not model.is_over():
+            actions = model.possible_actions
+            model.push(self._rng.choice(actions) if actions else None)
+            playout_length += 1
+        reward = model.reward(Turn.FIRST)
+        for _ in range(playout_length + len(path) - 1):
+            model.pop()
+        # Backpropagation
+        first_value = 1.0 if reward > 0 else 0.5 if reward == 0 else 0.0
+        tree.backpropagate(
+            path,
+            np.array(
+                [
+                    first_value if mover == Turn.FIRST else 1 - first_value
+                    for mover in movers
+                ],
+            ),
+        )
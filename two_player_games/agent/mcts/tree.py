@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+ROOT = 0
+# The first child of nodes that have not been expanded yet, which is free as
+# the root is nobody's child
+NO_CHILD = ROOT
+# The action index of a child reached by passing the turn, e.g. in Othello
+PASS = -1
+
+
+# TODO pylint: disable=too-many-instance-attributes
+class Tree:
+    """
+    A search tree stored in preallocated arrays indexed by node.
+
+    The children of a node are allocated next to each other when the node is
+    expanded, so they are identified by the index of the first child and
+    their number. The action of a child is its index in the parent's
+    `possible_actions`.
+
+    The value sum of a node is from the perspective of the player who played
+    the action leading to it.
+
+    The arrays are zeroed rather than filled, so that the operating system
+    only commits their pages to memory as the tree grows into them.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.visits: npt.NDArray[np.int64] = np.zeros(capacity, np.int64)
+        self.value_sums: npt.NDArray[np.float64] = np.zeros(
+            capacity,
+            np.float64,
+        )
+        self.first_children: npt.NDArray[np.int32] = np.zeros(
+            capacity,
+            np.int32,
+        )
+        self.child_nums: npt.NDArray[np.int32] = np.zeros(capacity, np.int32)
+        self.actions: npt.NDArray[np.int32] = np.zeros(capacity, np.int32)
+        self.size = 1
+
+    def is_expanded(self, node: int) -> bool:
+        return int(self.first_children[node]) != NO_CHILD
+
+    def expand(self, node: int, action_num: int) -> bool:
+        """
+        Allocate a child for each of the `action_num` actions of the node, or
+        a single one for passing if there are none.
+
+        Return False if the tree is full.
+        """
+        child_num = max(action_num, 1)
+        first_child = self.size
+        if first_child + child_num > self.capacity:
+            return False
+        self.size += child_num
+        self.first_children[node] = first_child
+        self.child_nums[node] = child_num
+        if action_num:
+            self.actions[self.children(node)] = np.arange(action_num)
+        else:
+            self.actions[first_child] = PASS
+        return True
+
+    def children(self, node: int) -> slice:
+        first_child = self.first_children[node]
+        return slice(first_child, first_child + self.child_nums[node])
+
+    def select(self, node: int, exploration: float) -> int:
+        """
+        Return the child with the highest upper confidence bound (UCT).
+
+        Children that have not been visited are selected first.
+        """
+        children = self.children(node)
+        visits = self.visits[children]
+        # argmin returns the first unvisited child, if any
+        index = int(visits.argmin())
+        if visits[index]:
+            uct = self.value_sums[children] / visits + exploration * np.sqrt(
+                np.log(self.visits[node]) / visits,
+            )
+            index = int(uct.argmax())
+        return int(children.start) + index
+
+    def backpropagate(
+        self,
+        path: list[int],
+        values: npt.NDArray[np.float64],
+    ) -> None:
+        """Add a visit and the given values to the nodes of the path."""
+        self.visits[path] += 1
+        self.value_sums[path] += values
@@ -1,37 +1,199 @@
 from __future__ import annotations
 
+import logging
 import random
 import sys
 from abc import abstractmethod
+from time import perf_counter
 
 from two_player_games.agent import Agent
-from two_player_games.common import Turn
+from two_player_games.common import CellMark
 from two_player_games.model import Action, Change, Model, State
 
+from .evaluation import Evaluator
+
+logger = logging.getLogger(__name__)
+
+
+class SearchTimeout(Exception):
+    """Raised when the time budget of a search runs out."""
+
 
 class MaxiMin(Agent[Action, State, Change]):
-    def __init__(self, depth: int, maximin_turn: Turn) -> None:
+    def __init__(
+        self,
+        depth: int,
+        maximin_turn: CellMark,
+        time_budget: float | None = None,
+        evaluator: Evaluator[Action, State, Change] | None = None,
+        symmetric: bool = False,
+    ) -> None:
+        """
+        If `time_budget` is given, the agent searches with iterative
+        deepening for up to `time_budget` seconds per move, and `depth` only
+        limits the depth if it is positive.
+
+        If `evaluator` is given, it estimates the reward of the running games
+        where the depth runs out, instead of `model.reward`.
+
+        If `symmetric`, root actions leading to symmetric positions, e.g. the
+        corners of an empty Tic-Tac-Toe board, are only searched once.
+        """
         super().__init__()
-        if depth <= 0:
+        if depth <= 0 and time_budget is None:
             print("Minmax depth must be greater than 0.", file=sys.stderr)
             sys.exit(1)
         self.depth = depth
         self.maximin_turn = maximin_turn
+        self.time_budget = time_budget
+        self.evaluator = evaluator
+        self.symmetric = symmetric
+        self._deadline = float("inf")
+        # The number of nodes visited by the last search
+        self.nodes = 0
+        # The depth of the last completed search
+        self.searched_depth = 0
+        # Whether the current search stopped at non-terminal positions
+        self._depth_limited = False
+        # The depth of the root and the action to search first there, i.e.,
+        # the best action of the previous iteration
+        self._root_depth = depth
+        self._root_action: Action | None = None
+        # The root actions that are unique up to symmetry, if `symmetric`
+        self._root_actions: list[Action] | None = None
 
     @abstractmethod
     def maximin(
         self,
         model: Model[Action, State, Change],
         depth: int,
-        turn: Turn,
+        turn: CellMark,
     ) -> tuple[float, Action | None]:
         pass
 
+    def _search_child(
+        self,
+        model: Model[Action, State, Change],
+        action: Action,
+        depth: int,
+        turn: CellMark,
+    ) -> tuple[float, Action | None]:
+        """
+        Return the result of `maximin` for the given depth and turn after the
+        given action.
+        """
+        model.make(action)
+        try:
+            return self.maximin(model, depth, turn)
+        finally:
+            model.unmake()
+
     def select_action(
         self,
         model: Model[Action, State, Change],
     ) -> Action | None:
-        _, action = self.maximin(model, self.depth, self.maximin_turn)
+        self.nodes = 0
+        if self.symmetric:
+            self._root_actions = model.unique_actions()
+        try:
+            if self.time_budget is None:
+                _, action = self.maximin(model, self.depth, self.maximin_turn)
+                self.searched_depth = self.depth
+            else:
+                action = self._iterative_deepening(model, self.time_budget)
+        finally:
+            self._root_actions = None
+        logger.debug("Searched %s nodes", self.nodes)
         if model.possible_actions and action is None:
             action = random.choice(model.possible_actions)
         return action
+
+    def _iterative_deepening(
+        self,
+        model: Model[Action, State, Change],
+        time_budget: float,
+    ) -> Action | None:
+        """
+        Search with increasing depth until the time budget runs out, and
+        return the action found by the deepest completed search.
+        """
+        start = perf_counter()
+        self._deadline = start + time_budget
+        action = None
+        depth = 0
+        try:
+            while self.depth <= 0 or depth < self.depth:
+                self._root_depth = depth + 1
+                self._root_action = action
+                self._depth_limited = False
+                _, action = self.maximin(
+                    model,
+                    depth + 1,
+                    self.maximin_turn,
+                )
+                depth += 1
+                if not self._depth_limited:
+                    # The whole game tree has been searched
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self._deadline = float("inf")
+            self._root_depth = self.depth
+            self.searched_depth = depth
+            self._root_action = None
+        logger.info(
+            "Iterative deepening: depth %s in %.3fs",
+            depth,
+            perf_counter() - start,
+        )
+        # TODO Consider using the best action of an interrupted search if it
+        # searched the previous best action first
+        return action if depth else None
+
+    def _actions(
+        self,
+        model: Model[Action, State, Change],
+        depth: int,
+    ) -> list[Action]:
+        """
+        Return the actions to search at the given node, which are unique up
+        to symmetry at the root.
+        """
+        if depth == self._root_depth and self._root_actions is not None:
+            return self._root_actions
+        return model.possible_actions
+
+    def _leaf_reward(
+        self,
+        model: Model[Action, State, Change],
+        turn: CellMark,
+    ) -> float:
+        """Return the reward of a leaf for the player with the given mark."""
+        if self.evaluator is None or model.is_over():
+            return model.reward(turn)
+        return self.evaluator.evaluate(model, turn)
+
+    def _is_leaf(
+        self,
+        model: Model[Action, State, Change],
+        depth: int,
+    ) -> bool:
+        """
+        Return whether the search must stop at the given node.
+
+        Raise `SearchTimeout` if the time budget has run out.
+        """
+        self.nodes += 1
+        if perf_counter() > self._deadline:
+            raise SearchTimeout
+        # Note: In some games, like Othello, a player may not have any valid
+        # actions and pass their turn to the opponent without the game ending.
+        # TODO Amend model implementations to ensure that game_over implies
+        # no possible actions. Then, simplify the condition below.
+        if model.is_over() or not model.possible_actions:
+            return True
+        if depth <= 0:
+            self._depth_limited = True
+            return True
+        return False
@@ -1,61 +1,457 @@
 from __future__ import annotations
 
-from functools import partial
+import logging
+import multiprocessing
+from multiprocessing.sharedctypes import Synchronized
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter, time
+from typing import Any
 
-from two_player_games.common import Turn
+from two_player_games.common import CellMark
 from two_player_games.model import Action, Change, Model, State
 
 from . import MaxiMin
+from .evaluation import Evaluator
+from .ordering import MoveOrdering, OrderingSource
+from .transposition import (
+    EXACT,
+    LOWER,
+    NO_MOVE,
+    SOLVED_DEPTH,
+    UPPER,
+    TranspositionTable,
+)
+
+logger = logging.getLogger(__name__)
+
+# The smallest depth left at which nodes use canonical keys, if `symmetric`
+SYMMETRIC_DEPTH = 2
+# The symmetry of the keys that are not canonical
+IDENTITY = 0
+
+# The agent of a worker process, and the alpha shared by all workers
+_worker_agent: AlphaBetaPruning[Any, Any, Any] | None = None
+_shared_alpha: Synchronized[float] | None = None
+
+
+def _init_worker(
+    shared_alpha: Synchronized[float],
+    maximin_turn: CellMark,
+    transposition_table_size: float,
+    ordering: OrderingSource,
+    evaluator: Evaluator[Any, Any, Any] | None,
+    symmetric: bool,
+) -> None:
+    # pylint: disable=global-statement
+    global _worker_agent, _shared_alpha
+    _worker_agent = AlphaBetaPruning(
+        1,
+        maximin_turn,
+        transposition_table_size,
+        ordering=ordering,
+        evaluator=evaluator,
+        symmetric=symmetric,
+    )
+    _shared_alpha = shared_alpha
+
+
+def _search_root_action(
+    model: Model[Action, State, Change],
+    action: Action,
+    depth: int,
+    beta: float,
+    deadline: float | None,
+) -> tuple[float, float, int, bool]:
+    """
+    Search the given root action in a worker process, starting from the
+    current shared alpha, and share the reward if it is better.
+
+    Return the reward, the alpha used, the number of nodes visited and
+    whether the search was depth-limited.
+    """
+    assert _worker_agent is not None and _shared_alpha is not None
+    alpha = _shared_alpha.value
+    reward, nodes, depth_limited = _worker_agent.search_root_action(
+        model,
+        action,
+        depth,
+        alpha,
+        beta,
+        deadline,
+    )
+    with _shared_alpha.get_lock():
+        if reward > _shared_alpha.value:
+            _shared_alpha.value = reward
+    return reward, alpha, nodes, depth_limited
 
 
 # TODO Benchmark and compare this agent with the naive maximin one
 # TODO Refactor to avoid code duplication among the different maximin variants
 class AlphaBetaPruning(MaxiMin[Action, State, Change]):
+    def __init__(
+        self,
+        depth: int,
+        maximin_turn: CellMark,
+        transposition_table_size: float = 0,
+        time_budget: float | None = None,
+        ordering: OrderingSource = OrderingSource.HASH,
+        workers: int = 1,
+        evaluator: Evaluator[Action, State, Change] | None = None,
+        symmetric: bool = False,
+    ) -> None:
+        """
+        `transposition_table_size` is the memory budget of the transposition
+        table in megabytes. The table is disabled if it is not positive.
+        With several `workers`, each worker process has its own table.
+
+        `ordering` selects the sources used to order the actions of each node.
+
+        With several `workers`, the first root action is searched in this
+        process, and the others are split among worker processes. Whenever a
+        worker improves on the best reward, it shares it through shared memory
+        as the alpha of the root actions searched afterwards.
+
+        If `symmetric`, the nodes at least `SYMMETRIC_DEPTH` from the leaves
+        share the entries of the transposition table with their symmetric
+        positions.
+        """
+        super().__init__(
+            depth,
+            maximin_turn,
+            time_budget,
+            evaluator,
+            symmetric,
+        )
+        self.ordering: MoveOrdering[Action] = MoveOrdering(ordering)
+        self.transposition_table_size = transposition_table_size
+        self.transposition_table = (
+            TranspositionTable(transposition_table_size)
+            if transposition_table_size > 0
+            else None
+        )
+        self.workers = workers
+        # Created on demand, and reused for the following moves
+        self._executor: ProcessPoolExecutor | None = None
+        self._shared_alpha: Synchronized[float] | None = None
+
+    def select_action(
+        self,
+        model: Model[Action, State, Change],
+    ) -> Action | None:
+        self.ordering.new_search()
+        table = self.transposition_table
+        if table is None:
+            return super().select_action(model)
+        table.reset_stats()
+        action = super().select_action(model)
+        logger.info("Transposition table: %s", table)
+        return action
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    # TODO pylint: disable=too-many-locals,too-many-branches
     # pylint: disable=too-many-arguments
     def maximin(
         self,
         model: Model[Action, State, Change],
         depth: int,
-        turn: Turn,
+        turn: CellMark,
         alpha: float = float("-inf"),
         beta: float = float("inf"),
     ) -> tuple[float, Action | None]:
         # https://en.wikipedia.org/wiki/Alpha%E2%80%93beta_pruning#Pseudocode
-        if model.is_over() or not model.possible_actions or depth <= 0:
-            return model.reward(self.maximin_turn), None
+        if self._is_leaf(model, depth):
+            return self._leaf_reward(model, self.maximin_turn), None
+
+        # https://en.wikipedia.org/wiki/Negamax#Negamax_with_alpha_beta_pruning_and_transposition_tables
+        table = self.transposition_table
+        hash_move = NO_MOVE
+        if table is not None:
+            key, symmetry = self._table_key(model, depth)
+            entry = table.probe(key)
+            if entry is not None:
+                entry_depth, value, bound, hash_move = entry
+                if self.symmetric:
+                    hash_move = self._hash_move_index(
+                        model,
+                        hash_move,
+                        symmetry,
+                    )
+                if entry_depth >= depth and (
+                    bound == EXACT
+                    or (bound == LOWER and value >= beta)
+                    or (bound == UPPER and value <= alpha)
+                ):
+                    table.cutoffs += 1
+                    # The search must go deeper if the stored one did
+                    if entry_depth != SOLVED_DEPTH:
+                        self._depth_limited = True
+                    return value, (
+                        model.possible_actions[hash_move]
+                        if hash_move != NO_MOVE
+                        else None
+                    )
+        alpha_orig, beta_orig = alpha, beta
+        # Whether this subtree is depth-limited, which is stored in its entry
+        depth_limited = self._depth_limited
+        self._depth_limited = False
+
+        # Search the best action of a previous search first, as it is likely
+        # to cause an early cutoff
+        actions = model.possible_actions
+        hash_action = None
+        if 0 <= hash_move < len(actions):
+            hash_action = actions[hash_move]
+        elif depth == self._root_depth:
+            hash_action = self._root_action
+        ply = self._root_depth - depth
+        ordering = self.ordering
+        node_actions = self._actions(model, depth)
 
-        if turn == self.maximin_turn:
+        if (
+            self.workers > 1
+            and depth == self._root_depth
+            and turn == self.maximin_turn
+        ):
+            maximin_reward, maximin_action = self._maximin_in_parallel(
+                model,
+                depth,
+                ordering.order(model, ply, hash_action, node_actions),
+                alpha,
+                beta,
+            )
+        elif turn == self.maximin_turn:
             maximin_reward, maximin_action = float("-inf"), None
             # TODO Consider refactoring and using np.argmax
-            for action in model.possible_actions:
-                maximin_f = partial(
-                    self.maximin,
-                    depth=depth - 1,
-                    turn=-turn,
-                    alpha=alpha,
-                    beta=beta,
-                )
-                reward, _ = model.peek_then_eval(action, maximin_f)
+            for action in ordering.order(
+                model,
+                ply,
+                hash_action,
+                node_actions,
+            ):
+                model.make(action)
+                try:
+                    reward, _ = self.maximin(
+                        model,
+                        depth - 1,
+                        -turn,
+                        alpha,
+                        beta,
+                    )
+                finally:
+                    model.unmake()
                 if reward > maximin_reward:
                     maximin_reward, maximin_action = reward, action
                 if maximin_reward > beta:
+                    ordering.record_cutoff(action, ply, depth)
                     break
                 alpha = max(alpha, maximin_reward)
+        else:
+            maximin_reward, maximin_action = float("inf"), None
+            for action in ordering.order(
+                model,
+                ply,
+                hash_action,
+                node_actions,
+            ):
+                model.make(action)
+                try:
+                    reward, _ = self.maximin(
+                        model,
+                        depth - 1,
+                        -turn,
+                        alpha,
+                        beta,
+                    )
+                finally:
+                    model.unmake()
+                if reward < maximin_reward:
+                    maximin_reward, maximin_action = reward, action
+                if maximin_reward < alpha:
+                    ordering.record_cutoff(action, ply, depth)
+                    break
+                beta = min(beta, maximin_reward)
+
+        if table is not None:
+            if maximin_reward <= alpha_orig:
+                bound = UPPER
+            elif maximin_reward >= beta_orig:
+                bound = LOWER
+            else:
+                bound = EXACT
+            if maximin_action is None:
+                move = NO_MOVE
+            elif self.symmetric:
+                move = model.symmetric_cell(maximin_action, symmetry)
+            else:
+                move = actions.index(maximin_action)
+            table.store(
+                key,
+                depth if self._depth_limited else SOLVED_DEPTH,
+                maximin_reward,
+                bound,
+                move,
+            )
+        self._depth_limited |= depth_limited
+        return maximin_reward, maximin_action
+
+    def _table_key(
+        self,
+        model: Model[Action, State, Change],
+        depth: int,
+    ) -> tuple[int, int]:
+        """
+        Return the key of the node in the transposition table and the
+        symmetry giving it.
+
+        Only the nodes far enough from the leaves are worth the cost of the
+        canonical key.
+        """
+        if self.symmetric and depth >= SYMMETRIC_DEPTH:
+            key, symmetry = model.canonical_key()
+            return key, symmetry
+        return model.key, IDENTITY
+
+    @staticmethod
+    def _hash_move_index(
+        model: Model[Action, State, Change],
+        move: int,
+        symmetry: int,
+    ) -> int:
+        """
+        Return the index of the possible action whose image by the given
+        symmetry is the given stored move, i.e. a cell or a column.
+        """
+        if move == NO_MOVE:
+            return NO_MOVE
+        for index, action in enumerate(model.possible_actions):
+            if model.symmetric_cell(action, symmetry) == move:
+                return index
+        return NO_MOVE
+
+    # pylint: disable=too-many-arguments
+    def _maximin_in_parallel(
+        self,
+        model: Model[Action, State, Change],
+        depth: int,
+        actions: list[Action],
+        alpha: float,
+        beta: float,
+    ) -> tuple[float, Action | None]:
+        """
+        Search the first root action, which is likely the best one, and then
+        the others in parallel with the alpha it provides.
+        """
+        first_action = actions[0]
+        maximin_reward = self._search_root_child(
+            model,
+            first_action,
+            depth,
+            alpha,
+            beta,
+        )
+        maximin_action: Action | None = first_action
+        if len(actions) == 1 or maximin_reward > beta:
             return maximin_reward, maximin_action
 
-        minimax_reward, minimax_action = float("inf"), None
-        for action in model.possible_actions:
-            maximin_f = partial(
-                self.maximin,
-                depth=depth - 1,
-                turn=-turn,
-                alpha=alpha,
-                beta=beta,
+        if self._executor is None:
+            self._shared_alpha = multiprocessing.Value("d", float("-inf"))
+            self._executor = ProcessPoolExecutor(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    self._shared_alpha,
+                    self.maximin_turn,
+                    self.transposition_table_size,
+                    self.ordering.sources,
+                    self.evaluator,
+                    self.symmetric,
+                ),
+            )
+        assert self._shared_alpha is not None
+        self._shared_alpha.value = max(alpha, maximin_reward)
+        # The clock of `perf_counter` may differ among processes
+        deadline = (
+            time() + self._deadline - perf_counter()
+            if self._deadline != float("inf")
+            else None
+        )
+        futures = [
+            self._executor.submit(
+                _search_root_action,
+                model,
+                action,
+                depth,
+                beta,
+                deadline,
+            )
+            for action in actions[1:]
+        ]
+        try:
+            for action, future in zip(actions[1:], futures):
+                reward, alpha_used, nodes, depth_limited = future.result()
+                self.nodes += nodes
+                # Iterative deepening must go on if any worker's search did
+                self._depth_limited |= depth_limited
+                # A reward that does not exceed the alpha used is only an
+                # upper bound, and the alpha has been reached by another action
+                if reward > alpha_used and reward > maximin_reward:
+                    maximin_reward, maximin_action = reward, action
+        finally:
+            for future in futures:
+                future.cancel()
+        return maximin_reward, maximin_action
+
+    # pylint: disable=too-many-arguments
+    def search_root_action(
+        self,
+        model: Model[Action, State, Change],
+        action: Action,
+        depth: int,
+        alpha: float,
+        beta: float,
+        deadline: float | None,
+    ) -> tuple[float, int, bool]:
+        """
+        Return the reward of a root action searched at the given depth, the
+        number of nodes visited and whether the search was depth-limited.
+        Used by the worker processes.
+
+        `deadline` is in seconds since the epoch, as returned by `time.time`.
+        """
+        self.nodes = 0
+        self._depth_limited = False
+        self._root_depth = depth
+        self._deadline = (
+            perf_counter() + deadline - time()
+            if deadline is not None
+            else float("inf")
+        )
+        reward = self._search_root_child(model, action, depth, alpha, beta)
+        return reward, self.nodes, self._depth_limited
+
+    # pylint: disable=too-many-arguments
+    def _search_root_child(
+        self,
+        model: Model[Action, State, Change],
+        action: Action,
+        depth: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        """Return the reward of a root action searched at the given depth."""
+        model.make(action)
+        try:
+            reward, _ = self.maximin(
+                model,
+                depth - 1,
+                -self.maximin_turn,
+                alpha,
+                beta,
             )
-            reward, _ = model.peek_then_eval(action, maximin_f)
-            if reward < minimax_reward:
-                minimax_reward, minimax_action = reward, action
-            if minimax_reward < alpha:
-                break
-            beta = min(beta, minimax_reward)
-        return minimax_reward, minimax_action
+        finally:
+            model.unmake()
+        return reward
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
-
-from two_player_games.common import Turn
+from two_player_games.common import CellMark
 from two_player_games.model import Action, Change, Model, State
 
 from . import MaxiMin
@@ -15,20 +13,15 @@ class MaxiMinDefensive(MaxiMin[Action, State, Change]):
         self,
         model: Model[Action, State, Change],
         depth: int,
-        turn: Turn,
+        turn: CellMark,
     ) -> tuple[float, Action | None]:
-        # Note: In some games, like Othello, a player may not have any valid
-        # actions and pass their turn to the opponent without the game ending.
-        # TODO Amend model implementations to ensure that game_over implies
-        # no possible actions. Then, simplify the condition below.
-        if model.is_over() or not model.possible_actions or depth <= 0:
-            return model.reward(self.maximin_turn), None
+        if self._is_leaf(model, depth):
+            return self._leaf_reward(model, self.maximin_turn), None
 
-        maximin_f = partial(self.maximin, depth=depth - 1, turn=-turn)
-        # Utiliying d alongside f ensures the agent does not disregard
-        # tactical actions in losing situations. This behavior is more
-        # intuitive than that of `MaxiMinNaive`, but only useful if the
-        # opponent is not playing optimally.
+        # Utiliying a search of depth 1 alongside the full one ensures the
+        # agent does not disregard tactical actions in losing situations. This
+        # behavior is more intuitive than that of `MaxiMinNaive`, but only
+        # useful if the opponent is not playing optimally.
         # TODO Explain in more detail why this is the case
 
         # TODO This is OK for tic-tac-toe, but others might require different
@@ -37,11 +30,10 @@ class MaxiMinDefensive(MaxiMin[Action, State, Change]):
         # Defensive: Looking for moves that maximise the opponent's reward to
         # block them if the agent is in a losing state.
         # TODO Instead, instantiate a new MaxiMinNaive for the opponent
-        maximin_d = partial(self.maximin, depth=1, turn=-turn)
 
         rewards_and_actions = [
-            (model.peek_then_eval(action, maximin_f)[0], action)
-            for action in model.possible_actions
+            (self._search_child(model, action, depth - 1, -turn)[0], action)
+            for action in self._actions(model, depth)
         ]
 
         if turn == self.maximin_turn:
@@ -64,8 +56,8 @@ class MaxiMinDefensive(MaxiMin[Action, State, Change]):
             # TODO Refactor this repeated code
             rewards_and_actions_d = [
                 # Returns the reward of the opponent's actions
-                model.peek_then_eval(action, maximin_d)
-                for action in model.possible_actions
+                self._search_child(model, action, 1, -turn)
+                for action in self._actions(model, depth)
             ]
             # Determines the best action for the opponent to block it
             maximin_reward_d = (
@@ -0,0 +1,394 @@
+"""
+Heuristic evaluation of the positions where a depth-limited search stops.
+
+Without an evaluator, searches use `model.reward`, which is 0 in every
+running game of Connect Four and Tic-Tac-Toe. Evaluations of running games
+are kept within (-1, 1), below the reward of any won game, so that a search
+always prefers a proven win to a promising position.
+
+The Connect Four and Othello evaluators score the bitboard models on their
+bitboards, since building their `state` grid costs more than a move.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Generic
+
+import numpy as np
+import numpy.typing as npt
+
+from two_player_games.common import (
+    MARK_EMPTY,
+    MARK_FIRST,
+    MARK_SECOND,
+    CellMark,
+)
+from two_player_games.model import Action, Change, Model, State
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal.othello import (
+    BLACK,
+    CELL_NUM,
+    OFF_BOARD,
+    POSITIONAL_WEIGHTS,
+    RAYS,
+)
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    DIRECTIONS,
+    FULL_MASK,
+    OthelloBitboard,
+    legal_moves,
+)
+from two_player_games.model.board.lines import line_windows
+from two_player_games.model.board.vertical.connect4 import (
+    COL_NUM,
+    ROW_NUM,
+    WINNING_STREAK,
+)
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    BOARD_MASK,
+    WINNING_SHIFTS,
+    Connect4Bitboard,
+)
+
+# The weight of a line only open to one player, by the number of marks on it
+LINE_WEIGHTS = (0, 1, 4, 16)
+# The extra weight of a line missing a single disc that can be dropped now
+PLAYABLE_THREAT_WEIGHT = 32
+# The score whose evaluation is 0.5
+LINE_SCALE = 64
+
+# The weights of the difference in legal actions and in stable discs. The
+# positional weights of the board are added as they are.
+MOBILITY_WEIGHT = 10
+STABLE_WEIGHT = 20
+OTHELLO_SCALE = 400
+# The indices of opposite directions in `othello.DIRECTIONS`, e.g. up and down
+AXIS_STARTS = np.array([0, 1, 2, 3])
+AXIS_ENDS = np.array([7, 6, 5, 4])
+# The cell next to each cell in each direction, which may be OFF_BOARD
+NEIGHBOUR_CELLS = RAYS[:, :, 0]
+OTHELLO_SHAPE = np.shape(POSITIONAL_WEIGHTS)
+OTHELLO_WEIGHTS: npt.NDArray[np.int_] = np.array(POSITIONAL_WEIGHTS).ravel()
+
+
+def _step(bits: int, direction: tuple[int, int]) -> int:
+    """Move the given Othello bits to their neighbour in the direction."""
+    amount, mask = direction
+    if amount > 0:
+        return (bits << amount) & mask
+    return (bits >> -amount) & mask
+
+
+def _cell_masks(ids: npt.NDArray[np.int_]) -> tuple[int, ...]:
+    """
+    Return the bitmask of the Othello cells of each distinct value of the
+    given flat array, in increasing order, in the layout of `OthelloBitboard`,
+    where the bit of each cell is its flat index.
+    """
+    return tuple(
+        sum(1 << int(cell) for cell in np.flatnonzero(ids == value))
+        for value in np.unique(ids)
+    )
+
+
+# The positional weights, and the bitmask of their cells
+WEIGHT_MASKS: tuple[tuple[int, int], ...] = tuple(
+    zip(np.unique(OTHELLO_WEIGHTS).tolist(), _cell_masks(OTHELLO_WEIGHTS)),
+)
+_ROWS, _COLS = (cells.ravel() for cells in np.indices(OTHELLO_SHAPE))
+# The bitmasks of the lines along each axis, in the order of `AXIS_STARTS`,
+# i.e. the diagonals (\), the columns, the anti-diagonals (/) and the rows
+AXIS_LINES = tuple(
+    _cell_masks(line_ids)
+    for line_ids in (_ROWS - _COLS, _COLS, _ROWS + _COLS, _ROWS)
+)
+
+# The cells next to the edge along each axis, i.e. with a neighbour off the
+# board in either direction
+AXIS_EDGES = tuple(
+    FULL_MASK
+    ^ (_step(FULL_MASK, DIRECTIONS[start]) & _step(FULL_MASK, DIRECTIONS[end]))
+    for start, end in zip(AXIS_STARTS.tolist(), AXIS_ENDS.tolist())
+)
+
+
+def squash(score: float, scale: float) -> float:
+    """Map the given score to (-1, 1), keeping its order."""
+    return score / (abs(score) + scale)
+
+
+class Evaluator(ABC, Generic[Action, State, Change]):
+    """Estimate the reward of running games where a search stops."""
+
+    @abstractmethod
+    def evaluate(
+        self,
+        model: Model[Action, State, Change],
+        turn: CellMark,
+    ) -> float:
+        """
+        Return the estimated reward for the player with the given mark or
+        `Turn`, within (-1, 1).
+        """
+
+
+class LineEvaluator(Evaluator[Any, BoardState, BoardChange]):
+    """
+    Weigh the lines that could still win a game, e.g. the rows, columns and
+    diagonals of Tic-Tac-Toe, by the number of marks on them.
+
+    A line only counts for a player if the opponent has no mark on it.
+    `weights` holds the weight of such a line by the number of marks on it,
+    from none to one less than the winning streak.
+    """
+
+    def __init__(
+        self,
+        row_num: int,
+        col_num: int,
+        winning_streak: int,
+        weights: tuple[int, ...] = LINE_WEIGHTS,
+    ) -> None:
+        self._windows = line_windows(row_num, col_num, winning_streak)
+        # Each line is identified by a code, the sum of (mark + 1) * 3^i over
+        # its cells, so that a single lookup weighs it
+        self._powers = 3 ** np.arange(winning_streak, dtype=np.intp)
+        self._code_marks = (
+            np.arange(3**winning_streak)[:, None] // self._powers % 3 - 1
+        )
+        firsts = (self._code_marks == MARK_FIRST).sum(axis=1)
+        seconds = (self._code_marks == MARK_SECOND).sum(axis=1)
+        # Lines with a winning streak end the game, so they are not weighed
+        line_weights = np.array([*weights[:winning_streak], 0], np.int_)
+        self._code_scores = np.where(seconds == 0, line_weights[firsts], 0)
+        self._code_scores -= np.where(firsts == 0, line_weights[seconds], 0)
+
+    def evaluate(
+        self,
+        model: Model[Any, BoardState, BoardChange],
+        turn: CellMark,
+    ) -> float:
+        state = model.state
+        codes = (state.ravel()[self._windows] + 1) @ self._powers
+        return turn * squash(self._score(state, codes), LINE_SCALE)
+
+    def _score(self, state: BoardState, codes: npt.NDArray[np.intp]) -> float:
+        """Return the score of the first player given the code of each line."""
+        return float(self._code_scores[codes].sum())
+
+
+class Connect4Evaluator(LineEvaluator):
+    """
+    Weigh the lines of four, and the threats, i.e. lines missing a single
+    disc, whose disc can be dropped on the next move.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(ROW_NUM, COL_NUM, WINNING_STREAK)
+        sums = self._code_marks.sum(axis=1)
+        # The player of each line that is a threat, and the index of its
+        # empty cell
+        self._code_threats = np.where(
+            np.abs(sums) == WINNING_STREAK - 1,
+            np.sign(sums),
+            0,
+        )
+        self._code_holes = (self._code_marks == MARK_EMPTY).argmax(axis=1)
+
+    def evaluate(
+        self,
+        model: Model[Any, BoardState, BoardChange],
+        turn: CellMark,
+    ) -> float:
+        if isinstance(model, Connect4Bitboard):
+            score = connect4_score(*model.bitboards, model.legal_moves)
+            return turn * squash(score, LINE_SCALE)
+        return super().evaluate(model, turn)
+
+    def _score(self, state: BoardState, codes: npt.NDArray[np.intp]) -> float:
+        score = super()._score(state, codes)
+        threats = self._code_threats[codes]
+        lines = threats.nonzero()[0]
+        if not lines.size:
+            return score
+        # The lowest empty cell of each column that is not full
+        heights = (state != MARK_EMPTY).sum(axis=0)
+        columns = (heights < ROW_NUM).nonzero()[0]
+        playable = np.zeros(ROW_NUM * COL_NUM, np.bool_)
+        playable[(ROW_NUM - 1 - heights[columns]) * COL_NUM + columns] = True
+        holes = self._windows[lines, self._code_holes[codes[lines]]]
+        return score + PLAYABLE_THREAT_WEIGHT * float(
+            threats[lines][playable[holes]].sum(),
+        )
+
+
+class OthelloEvaluator(Evaluator[Any, BoardState, BoardChange]):
+    """
+    Combine the difference in legal actions, a.k.a. mobility, the positional
+    weights, which favour the corners, and the difference in stable discs.
+    """
+
+    def evaluate(
+        self,
+        model: Model[Any, BoardState, BoardChange],
+        turn: CellMark,
+    ) -> float:
+        if isinstance(model, OthelloBitboard):
+            return turn * squash(othello_score(model), OTHELLO_SCALE)
+        state = model.state.ravel()
+        flat_state = np.append(state, MARK_EMPTY)
+        first_mobility, second_mobility = mobility(flat_state)
+        score = (
+            MOBILITY_WEIGHT * (first_mobility - second_mobility)
+            + int(OTHELLO_WEIGHTS @ state)
+            + STABLE_WEIGHT * int(state[stable_discs(flat_state)].sum())
+        )
+        return turn * squash(score, OTHELLO_SCALE)
+
+
+def connect4_score(first: int, second: int, playable: int) -> int:
+    """
+    Return the score of `Connect4Evaluator` for the first player, given the
+    bitboards of both players and of the cells where a disc can be dropped,
+    in the layout of `Connect4Bitboard`.
+
+    The lines of four are identified by the bit of their first cell, so that
+    the lines along each direction are weighed all at once.
+    """
+    score = 0
+    for sign, own, opponent in ((1, first, second), (-1, second, first)):
+        free = BOARD_MASK & ~opponent
+        for shift in WINNING_SHIFTS:
+            lines = free & free >> shift & free >> 2 * shift
+            lines &= free >> 3 * shift
+            discs = [own >> offset * shift for offset in range(4)]
+            # The bits of the number of discs on each line, whose bits of
+            # value 4 are left out as such lines end the game
+            ones = discs[0] ^ discs[1] ^ discs[2] ^ discs[3]
+            twos = (
+                (discs[0] & discs[1])
+                ^ (discs[2] & discs[3])
+                ^ ((discs[0] ^ discs[1]) & (discs[2] ^ discs[3]))
+            )
+            threes = lines & ones & twos
+            score += sign * (
+                LINE_WEIGHTS[1] * (lines & ones & ~twos).bit_count()
+                + LINE_WEIGHTS[2] * (lines & twos & ~ones).bit_count()
+                + LINE_WEIGHTS[3] * threes.bit_count()
+            )
+            if not threes:
+                continue
+            for offset, disc in enumerate(discs):
+                holes = (threes & ~disc) << offset * shift
+                score += (
+                    sign
+                    * PLAYABLE_THREAT_WEIGHT
+                    * (holes & playable).bit_count()
+                )
+    return score
+
+
+def othello_score(model: OthelloBitboard) -> int:
+    """
+    Return the score of `OthelloEvaluator` for the first player, computed on
+    the bitboards of the given model.
+    """
+    black, white = model.bitboards
+    # The legal actions of the player to move are already known
+    if model.turn == BLACK:
+        black_mobility = len(model.possible_actions)
+        white_mobility = legal_moves(white, black).bit_count()
+    else:
+        black_mobility = legal_moves(black, white).bit_count()
+        white_mobility = len(model.possible_actions)
+    filled = black | white
+    full_axes = [
+        sum(line for line in lines if filled & line == line)
+        for lines in AXIS_LINES
+    ]
+    return (
+        MOBILITY_WEIGHT * (black_mobility - white_mobility)
+        + sum(
+            weight * ((black & mask).bit_count() - (white & mask).bit_count())
+            for weight, mask in WEIGHT_MASKS
+        )
+        + STABLE_WEIGHT
+        * (
+            stable_bits(black, full_axes).bit_count()
+            - stable_bits(white, full_axes).bit_count()
+        )
+    )
+
+
+def stable_bits(own: int, full_axes: list[int]) -> int:
+    """
+    Return the bitboard of the stable discs among the given ones, as
+    `stable_discs` does, given the bitmask of the full lines along each axis.
+    """
+    stable = 0
+    while True:
+        stable_now = own
+        for start, end, full, edges in zip(
+            AXIS_STARTS.tolist(),
+            AXIS_ENDS.tolist(),
+            full_axes,
+            AXIS_EDGES,
+        ):
+            stable_now &= (
+                full
+                | edges
+                | _step(stable, DIRECTIONS[start])
+                | _step(stable, DIRECTIONS[end])
+            )
+        if stable_now == stable:
+            return stable
+        stable = stable_now
+
+
+def mobility(flat_state: npt.NDArray[np.int8]) -> tuple[int, int]:
+    """
+    Return the number of legal actions of the first and second players.
+
+    `flat_state` is the flat Othello board followed by an empty OFF_BOARD
+    cell.
+    """
+    empty = flat_state[:CELL_NUM] == MARK_EMPTY
+    # Only empty cells next to a disc can be legal
+    cells = empty & (flat_state[NEIGHBOUR_CELLS] != MARK_EMPTY).any(axis=1)
+    rays = flat_state[RAYS[cells.nonzero()[0]]]
+    legal_nums = []
+    for mark in (MARK_FIRST, MARK_SECOND):
+        runs = np.cumprod(rays == -mark, axis=2).sum(axis=2)
+        ends = np.take_along_axis(rays, runs[..., None], axis=2)[..., 0]
+        legal_nums.append(int(((ends == mark) & (runs > 0)).any(axis=1).sum()))
+    return legal_nums[0], legal_nums[1]
+
+
+def stable_discs(flat_state: npt.NDArray[np.int8]) -> npt.NDArray[np.bool_]:
+    """
+    Return whether each disc of the given Othello board can never be flipped.
+
+    Along each axis, a stable disc must lie on a full line, or next to the
+    edge or to a stable disc of its colour. Stable discs are found from the
+    corners until no other disc qualifies.
+    """
+    marks = flat_state[:CELL_NUM]
+    filled = flat_state != MARK_EMPTY
+    filled[OFF_BOARD] = True
+    # Whether the cells from each cell to the edge in each direction are full
+    ray_filled = filled[RAYS].all(axis=2)
+    full_axes = ray_filled[:, AXIS_STARTS] & ray_filled[:, AXIS_ENDS]
+    same = (flat_state[NEIGHBOUR_CELLS] == marks[:, None]) | (
+        NEIGHBOUR_CELLS == OFF_BOARD
+    )
+    stable = np.zeros(CELL_NUM + 1, np.bool_)
+    stable[OFF_BOARD] = True
+    while True:
+        anchored = same & stable[NEIGHBOUR_CELLS]
+        stable_now: npt.NDArray[np.bool_] = filled[:CELL_NUM] & (
+            full_axes | anchored[:, AXIS_STARTS] | anchored[:, AXIS_ENDS]
+        ).all(axis=1)
+        if (stable_now == stable[:CELL_NUM]).all():
+            return stable_now
+        stable[:CELL_NUM] = stable_now
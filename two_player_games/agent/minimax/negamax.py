@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+
+from two_player_games.common import CellMark
+from two_player_games.model import Action, Change, Model, State
+
+from . import MaxiMin
+from .evaluation import Evaluator
+from .ordering import MoveOrdering, OrderingSource
+
+
+class NegamaxPVS(MaxiMin[Action, State, Change]):
+    """
+    Negamax with principal variation search (PVS), a.k.a. NegaScout.
+
+    Values are always from the perspective of the player to move, so a single
+    recursion handles both players. The first action is searched with the full
+    window. The remaining actions are searched with a null window, only proving
+    that they are no better than the best one so far. An action that turns out
+    better is searched again with the full window.
+    """
+
+    def __init__(
+        self,
+        depth: int,
+        maximin_turn: CellMark,
+        time_budget: float | None = None,
+        ordering: OrderingSource = OrderingSource.HASH,
+        evaluator: Evaluator[Action, State, Change] | None = None,
+        symmetric: bool = False,
+    ) -> None:
+        """`ordering` selects how the actions of each node are ordered."""
+        super().__init__(
+            depth,
+            maximin_turn,
+            time_budget,
+            evaluator,
+            symmetric,
+        )
+        self.ordering: MoveOrdering[Action] = MoveOrdering(ordering)
+
+    def select_action(
+        self,
+        model: Model[Action, State, Change],
+    ) -> Action | None:
+        self.ordering.new_search()
+        return super().select_action(model)
+
+    def maximin(
+        self,
+        model: Model[Action, State, Change],
+        depth: int,
+        turn: CellMark,
+    ) -> tuple[float, Action | None]:
+        reward, action = self.negamax(model, depth)
+        return reward if turn == self.maximin_turn else -reward, action
+
+    def negamax(
+        self,
+        model: Model[Action, State, Change],
+        depth: int,
+        alpha: float = float("-inf"),
+        beta: float = float("inf"),
+    ) -> tuple[float, Action | None]:
+        # https://en.wikipedia.org/wiki/Principal_variation_search#Pseudocode
+        if self._is_leaf(model, depth):
+            return self._leaf_reward(model, model.turn), None
+
+        ply = self._root_depth - depth
+        # Search the best action of the previous iteration first
+        hash_action = self._root_action if ply == 0 else None
+
+        negamax_reward, negamax_action = float("-inf"), None
+        for action in self.ordering.order(
+            model,
+            ply,
+            hash_action,
+            self._actions(model, depth),
+        ):
+            if negamax_action is None:
+                reward = -self._evaluate(model, action, depth, -beta, -alpha)
+            else:
+                # The smallest window above alpha, which also works for
+                # non-integer rewards
+                null_beta = math.nextafter(alpha, math.inf)
+                reward = -self._evaluate(
+                    model,
+                    action,
+                    depth,
+                    -null_beta,
+                    -alpha,
+                )
+                if alpha < reward < beta:
+                    # The null-window search failed high: `reward` is only a
+                    # lower bound, so search again to get the exact reward.
+                    reward = -self._evaluate(
+                        model,
+                        action,
+                        depth,
+                        -beta,
+                        -reward,
+                    )
+            if reward > negamax_reward:
+                negamax_reward, negamax_action = reward, action
+            alpha = max(alpha, negamax_reward)
+            if alpha >= beta:
+                self.ordering.record_cutoff(action, ply, depth)
+                break
+        return negamax_reward, negamax_action
+
+    # pylint: disable=too-many-arguments
+    def _evaluate(
+        self,
+        model: Model[Action, State, Change],
+        action: Action,
+        depth: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        """Return the opponent's reward after the given action."""
+        model.make(action)
+        try:
+            reward, _ = self.negamax(model, depth - 1, alpha, beta)
+        finally:
+            model.unmake()
+        return reward
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from enum import Flag, auto
+from typing import Generic
+
+from two_player_games.model import Action, Change, Model, State
+
+# The number of killer actions kept per ply
+KILLER_NUM = 2
+
+
+class OrderingSource(Flag):
+    """The sources of move ordering, which can be combined and benchmarked."""
+
+    NONE = 0
+    # The best action of a previous search, from the transposition table or
+    # the previous iteration of iterative deepening
+    HASH = auto()
+    # The last actions that caused a cutoff at the same ply
+    KILLERS = auto()
+    # Actions weighted by the cutoffs they caused anywhere in the tree
+    HISTORY = auto()
+    # The game-specific static prior, see `Model.action_prior`
+    PRIOR = auto()
+    ALL = HASH | KILLERS | HISTORY | PRIOR
+
+
+class MoveOrdering(Generic[Action]):
+    """
+    Order the actions of a node so that the best ones are searched first.
+
+    The hash action goes first, then the killer actions of the ply, and the
+    remaining actions are sorted by their history score, and then by their
+    prior. Ties keep the order of `model.possible_actions`.
+    """
+
+    def __init__(self, sources: OrderingSource = OrderingSource.ALL) -> None:
+        self.sources = sources
+        self._killers: list[list[Action]] = []
+        # A.k.a. the butterfly table
+        self._history: dict[Action, int] = {}
+
+    def new_search(self) -> None:
+        """Prepare for the search of a new position."""
+        # Killers are relative to the root, so they are stale after a move
+        self._killers.clear()
+        # Keep the history, which is still informative, but age it so that
+        # recent cutoffs dominate
+        for action, score in self._history.items():
+            self._history[action] = score >> 1
+
+    def order(
+        self,
+        model: Model[Action, State, Change],
+        ply: int,
+        hash_action: Action | None = None,
+        actions: list[Action] | None = None,
+    ) -> list[Action]:
+        """Order the given actions, by default `model.possible_actions`."""
+        sources = self.sources
+        if actions is None:
+            actions = model.possible_actions
+        if sources & (
+            OrderingSource.KILLERS
+            | OrderingSource.HISTORY
+            | OrderingSource.PRIOR
+        ):
+            killers = (
+                self._killers[ply]
+                if OrderingSource.KILLERS in sources
+                and ply < len(self._killers)
+                else []
+            )
+            history = (
+                self._history if OrderingSource.HISTORY in sources else {}
+            )
+            use_prior = OrderingSource.PRIOR in sources
+
+            def key(action: Action) -> tuple[int, int, float]:
+                return (
+                    (
+                        KILLER_NUM - killers.index(action)
+                        if action in killers
+                        else 0
+                    ),
+                    history.get(action, 0),
+                    model.action_prior(action) if use_prior else 0,
+                )
+
+            # The sort is stable, also in reverse
+            actions = sorted(actions, key=key, reverse=True)
+        if (
+            OrderingSource.HASH in sources
+            and hash_action is not None
+            and hash_action in actions
+            and actions[0] != hash_action
+        ):
+            actions = [
+                hash_action,
+                *(action for action in actions if action != hash_action),
+            ]
+        return actions
+
+    def record_cutoff(self, action: Action, ply: int, depth: int) -> None:
+        """Record that the given action caused a cutoff."""
+        if OrderingSource.KILLERS in self.sources:
+            while len(self._killers) <= ply:
+                self._killers.append([])
+            killers = self._killers[ply]
+            if action not in killers:
+                killers.insert(0, action)
+                del killers[KILLER_NUM:]
+        if OrderingSource.HISTORY in self.sources:
+            # Cutoffs far from the leaves save more nodes
+            self._history[action] = self._history.get(action, 0) + depth**2
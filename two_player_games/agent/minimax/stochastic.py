@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import random
-from functools import partial
 
-from two_player_games.common import Turn
+from two_player_games.common import CellMark
 from two_player_games.model import Action, Change, Model, State
 
 from . import MaxiMin
@@ -15,20 +14,14 @@ class MaxiMinStochastic(MaxiMin[Action, State, Change]):
         self,
         model: Model[Action, State, Change],
         depth: int,
-        turn: Turn,
+        turn: CellMark,
     ) -> tuple[float, Action | None]:
-        # Note: In some games, like Othello, a player may not have any valid
-        # actions and pass their turn to the opponent without the game ending.
-        # TODO Amend model implementations to ensure that game_over implies
-        # no possible actions. Then, simplify the condition below.
-        if model.is_over() or not model.possible_actions or depth <= 0:
-            return model.reward(self.maximin_turn), None
-
-        maximin_f = partial(self.maximin, depth=depth - 1, turn=-turn)
+        if self._is_leaf(model, depth):
+            return self._leaf_reward(model, self.maximin_turn), None
 
         rewards_and_actions = [
-            (model.peek_then_eval(action, maximin_f)[0], action)
-            for action in model.possible_actions
+            (self._search_child(model, action, depth - 1, -turn)[0], action)
+            for action in self._actions(model, depth)
         ]
 
         if turn == self.maximin_turn:
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from array import array
+
+# Bound types of the stored values. Enum is avoided for performance.
+EXACT = 0
+# The value is a lower bound, i.e., the search failed high
+LOWER = 1
+# The value is an upper bound, i.e., the search failed low
+UPPER = 2
+
+NO_MOVE = -1
+EMPTY_DEPTH = -1
+# The depth of the entries whose subtree was searched to the end of the game,
+# so that their value holds at any depth
+SOLVED_DEPTH = 0x7FFF
+# key (Q), value (d), depth (h), bound (b) and move (h)
+ENTRY_SIZE = 8 + 8 + 2 + 1 + 2
+
+TranspositionEntry = tuple[int, float, int, int]
+
+
+class TranspositionTable:
+    """
+    A fixed-size table of search results keyed by the position's hash.
+
+    Entries are stored in preallocated arrays, one per field, rather than as
+    Python objects. Each bucket holds two entries: the first is only replaced
+    by searches at least as deep, and the second is always replaced.
+
+    The best move is stored as its index in `model.possible_actions`, which
+    is the same for all occurrences of a position. Searches keying positions
+    by their canonical form store the cell of the move in that form instead,
+    see `Board.symmetric_cell`.
+    """
+
+    # TODO pylint: disable=too-many-instance-attributes
+    def __init__(self, size: float) -> None:
+        """Preallocate a table taking up to `size` megabytes."""
+        bucket_num = max(1, int(size * 2**20) // (2 * ENTRY_SIZE))
+        # Round down to a power of two to find buckets by masking
+        bucket_num = 1 << (bucket_num.bit_length() - 1)
+        self._mask = bucket_num - 1
+        entry_num = 2 * bucket_num
+        self._keys = array("Q", bytes(8 * entry_num))
+        self._values = array("d", bytes(8 * entry_num))
+        self._depths = array("h", [EMPTY_DEPTH]) * entry_num
+        self._bounds = array("b", bytes(entry_num))
+        self._moves = array("h", [NO_MOVE]) * entry_num
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def probe(self, key: int) -> TranspositionEntry | None:
+        """Return the (depth, value, bound, move) stored for the given key."""
+        self.probes += 1
+        index = (key & self._mask) << 1
+        keys = self._keys
+        if keys[index] != key or self._depths[index] == EMPTY_DEPTH:
+            index += 1
+            if keys[index] != key or self._depths[index] == EMPTY_DEPTH:
+                return None
+        self.hits += 1
+        return (
+            self._depths[index],
+            self._values[index],
+            self._bounds[index],
+            self._moves[index],
+        )
+
+    # pylint: disable=too-many-arguments
+    def store(
+        self,
+        key: int,
+        depth: int,
+        value: float,
+        bound: int,
+        move: int,
+    ) -> None:
+        self.stores += 1
+        index = (key & self._mask) << 1
+        if depth < self._depths[index] and self._keys[index] != key:
+            # Keep the deeper entry and use the always-replace one instead
+            index += 1
+        self._keys[index] = key
+        self._values[index] = value
+        self._depths[index] = depth
+        self._bounds[index] = bound
+        self._moves[index] = move
+
+    def clear(self) -> None:
+        for index in range(len(self._depths)):
+            self._depths[index] = EMPTY_DEPTH
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    def __str__(self) -> str:
+        hit_rate = self.hits / self.probes if self.probes else 0
+        return (
+            f"{len(self)} entries, {self.probes} probes, {self.hits} hits "
+            f"({hit_rate:.1%}), {self.cutoffs} cutoffs, {self.stores} stores"
+        )
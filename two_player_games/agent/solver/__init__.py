@@ -0,0 +1,87 @@
+"""
+Exact solvers, which agents switch to once few empty cells remain, as the
+rest of the game is then cheaper to solve than to search to a fixed depth.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Generic
+
+from two_player_games.agent import Agent
+from two_player_games.common import MARK_EMPTY
+from two_player_games.model import Action, Change, Model, State
+from two_player_games.model.board import BoardChange, BoardState
+
+logger = logging.getLogger(__name__)
+
+
+class Solver(ABC, Generic[Action, State, Change]):
+    """Compute the game-theoretic value of positions with few empty cells."""
+
+    def __init__(self, empties: int) -> None:
+        """`empties` is the largest number of empty cells solved."""
+        self.empties = empties
+        # The number of nodes visited by the last call to `solve`
+        self.nodes = 0
+
+    @abstractmethod
+    def empty_num(self, model: Model[Action, State, Change]) -> int:
+        """Return the number of empty cells of the given position."""
+
+    def can_solve(self, model: Model[Action, State, Change]) -> bool:
+        return not model.is_over() and self.empty_num(model) <= self.empties
+
+    @abstractmethod
+    def solve(
+        self,
+        model: Model[Action, State, Change],
+    ) -> tuple[float, Action | None]:
+        """
+        Return the reward of the player to move under perfect play, as
+        `model.reward` would return it at the end of the game, and a best
+        action, which is None if the player must pass.
+        """
+
+
+class BoardSolver(Solver[Action, BoardState, BoardChange]):
+    """A solver of board games, which counts the empty cells of `state`."""
+
+    def empty_num(self, model: Model[Action, BoardState, BoardChange]) -> int:
+        return int((model.state == MARK_EMPTY).sum())
+
+
+# TODO pylint: disable=too-few-public-methods
+class SolvingAgent(Agent[Action, State, Change]):
+    """
+    Play perfectly once the given solver can solve the position, and let the
+    given agent select actions until then.
+    """
+
+    def __init__(
+        self,
+        agent: Agent[Action, State, Change],
+        solver: Solver[Action, State, Change],
+    ) -> None:
+        super().__init__()
+        self.agent = agent
+        self.solver = solver
+
+    def select_action(
+        self,
+        model: Model[Action, State, Change],
+    ) -> Action | None:
+        if not self.solver.can_solve(model):
+            return self.agent.select_action(model)
+        reward, action = self.solver.solve(model)
+        logger.info(
+            "Solved in %s nodes: reward %s with %s",
+            self.solver.nodes,
+            reward,
+            action,
+        )
+        return action
+
+    def close(self) -> None:
+        self.agent.close()
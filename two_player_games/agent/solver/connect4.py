@@ -0,0 +1,209 @@
+"""
+A Connect Four solver searching every action to the end of the game.
+
+Positions are encoded as two bitboards in the layout of `Connect4Bitboard`:
+the discs of the player to move, and the discs of both players. Only wins,
+draws and losses are told apart, which is much cheaper than the exact number
+of moves to the end.
+https://blog.gamesolver.org/solving-connect-four/
+"""
+
+from __future__ import annotations
+
+from two_player_games.agent.minimax.transposition import (
+    EXACT,
+    LOWER,
+    NO_MOVE,
+    UPPER,
+    TranspositionTable,
+)
+from two_player_games.common import MARK_EMPTY
+from two_player_games.model import Model
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.vertical import VerticalBoardAction
+from two_player_games.model.board.vertical.connect4 import COL_NUM, ROW_NUM
+from two_player_games.model.board.vertical.connect4_bitboard import (
+    BOARD_MASK,
+    BOTTOM_MASK,
+    COL_HEIGHT,
+    FIRST_COLUMN_MASK,
+)
+
+from . import BoardSolver
+
+# Searching the central columns first finds wins and cutoffs sooner
+COLUMN_ORDER = tuple(
+    sorted(range(COL_NUM), key=lambda column: abs(2 * column - COL_NUM + 1)),
+)
+COLUMN_MASKS = tuple(
+    FIRST_COLUMN_MASK << (column * COL_HEIGHT) for column in range(COL_NUM)
+)
+# Positions have unique keys, which are scrambled so that the buckets of the
+# transposition table do not only depend on the first column
+KEY_MULTIPLIER = 0x9E3779B97F4A7C15
+KEY_MASK = (1 << 64) - 1
+WIN = 1
+DRAW = 0
+LOSS = -1
+# The default largest number of empty cells solved
+EMPTIES = 20
+# The memory budget of the transposition table in megabytes
+TRANSPOSITION_TABLE_SIZE = 16
+
+
+def winning_cells(own: int, mask: int) -> int:
+    """
+    Return the bitmask of the empty cells that complete four aligned discs of
+    `own`, whether they can be played now or not.
+    """
+    # Vertical
+    cells = (own << 1) & (own << 2) & (own << 3)
+    # Horizontal, anti-diagonal (/) and main diagonal (\)
+    for shift in (COL_HEIGHT, COL_HEIGHT - 1, COL_HEIGHT + 1):
+        pairs = (own << shift) & (own << 2 * shift)
+        cells |= pairs & (own << 3 * shift)
+        cells |= pairs & (own >> shift)
+        pairs = (own >> shift) & (own >> 2 * shift)
+        cells |= pairs & (own << shift)
+        cells |= pairs & (own >> 3 * shift)
+    return cells & (BOARD_MASK ^ mask)
+
+
+class Connect4Solver(BoardSolver[VerticalBoardAction]):
+    """Negamax with alpha-beta pruning and a transposition table."""
+
+    def __init__(
+        self,
+        empties: int = EMPTIES,
+        transposition_table_size: float = TRANSPOSITION_TABLE_SIZE,
+    ) -> None:
+        super().__init__(empties)
+        # Kept from one position to the next, as values are exact
+        self.transposition_table = TranspositionTable(transposition_table_size)
+
+    def solve(
+        self,
+        model: Model[VerticalBoardAction, BoardState, BoardChange],
+    ) -> tuple[float, VerticalBoardAction | None]:
+        self.nodes = 0
+        if not model.possible_actions:
+            return DRAW, None
+        own, mask = self._bitboards(model.state, model.turn)
+        best_value, best_action = LOSS - 1, None
+        alpha = LOSS - 1
+        for action in self._order(own, mask):
+            move = (mask + BOTTOM_MASK) & COLUMN_MASKS[action]
+            if winning_cells(own, mask) & move:
+                return WIN, action
+            value = -self._negamax(own ^ mask, mask | move, LOSS, -alpha)
+            if value > best_value:
+                best_value, best_action = value, action
+                alpha = value
+                if value == WIN:
+                    break
+        return best_value, best_action
+
+    @staticmethod
+    def _bitboards(state: BoardState, turn: int) -> tuple[int, int]:
+        """
+        Return the bitboards of the player with the given mark and of both
+        players.
+        """
+        own = mask = 0
+        for column in range(COL_NUM):
+            for height, row in enumerate(range(ROW_NUM - 1, -1, -1)):
+                mark = state[row, column]
+                if mark == MARK_EMPTY:
+                    break
+                bit = 1 << (column * COL_HEIGHT + height)
+                mask |= bit
+                if mark == turn:
+                    own |= bit
+        return own, mask
+
+    @staticmethod
+    def _order(own: int, mask: int) -> list[VerticalBoardAction]:
+        """
+        Return the playable columns, those creating the most winning cells
+        first, and then the central ones.
+        """
+        playable = (mask + BOTTOM_MASK) & BOARD_MASK
+        columns = [
+            column
+            for column in COLUMN_ORDER
+            if playable & COLUMN_MASKS[column]
+        ]
+        return sorted(
+            columns,
+            key=lambda column: -winning_cells(
+                own | (playable & COLUMN_MASKS[column]),
+                mask,
+            ).bit_count(),
+        )
+
+    def _negamax(self, own: int, mask: int, alpha: int, beta: int) -> int:
+        """
+        Return the value of the position for the player to move, whose discs
+        are `own`, within the window (alpha, beta).
+        """
+        self.nodes += 1
+        playable = (mask + BOTTOM_MASK) & BOARD_MASK
+        if not playable:
+            return DRAW
+        if winning_cells(own, mask) & playable:
+            return WIN
+        opponent_cells = winning_cells(own ^ mask, mask)
+        forced = playable & opponent_cells
+        if forced:
+            if forced & (forced - 1):
+                # The opponent threatens to win in two columns
+                return LOSS
+            playable = forced
+        # Playing right below an opponent's winning cell gives it away
+        playable &= ~(opponent_cells >> 1)
+        if not playable:
+            return LOSS
+
+        table = self.transposition_table
+        key = ((own + mask) * KEY_MULTIPLIER) & KEY_MASK
+        entry = table.probe(key)
+        if entry is not None:
+            _, value, bound, _ = entry
+            if bound == EXACT:
+                return int(value)
+            if bound == LOWER:
+                alpha = max(alpha, int(value))
+            else:
+                beta = min(beta, int(value))
+            if alpha >= beta:
+                return int(value)
+        alpha_orig = alpha
+
+        moves = [
+            playable & COLUMN_MASKS[column]
+            for column in COLUMN_ORDER
+            if playable & COLUMN_MASKS[column]
+        ]
+        if len(moves) > 1:
+            moves.sort(
+                key=lambda move: -winning_cells(own | move, mask).bit_count(),
+            )
+        value = LOSS
+        for move in moves:
+            value = max(
+                value,
+                -self._negamax(own ^ mask, mask | move, -beta, -alpha),
+            )
+            if value >= beta:
+                break
+            alpha = max(alpha, value)
+
+        if value <= alpha_orig:
+            bound = UPPER
+        elif value >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        empty_num = BOARD_MASK.bit_count() - mask.bit_count()
+        table.store(key, empty_num, value, bound, NO_MOVE)
+        return value
@@ -0,0 +1,148 @@
+"""
+An exact Othello endgame solver, which searches the last empty cells to the
+end of the game with the bitboard moves of `OthelloBitboard`.
+
+The value of a position is the final difference in discs, as returned by
+`Othello.reward` once the game is over.
+"""
+
+from __future__ import annotations
+
+from two_player_games.common import MARK_EMPTY
+from two_player_games.model import Model
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.othello import COL_NUM, ROW_NUM
+from two_player_games.model.board.horizontal.othello_bitboard import (
+    CELL_NUM,
+    FULL_MASK,
+    flip_mask,
+    legal_moves,
+)
+
+from . import BoardSolver
+
+# The default largest number of empty cells solved
+EMPTIES = 10
+# Ordering by the opponent's mobility only pays off with enough empty cells
+FASTEST_FIRST_EMPTIES = 6
+# The bitmasks of the four quadrants of the board
+QUADRANTS = tuple(
+    sum(
+        1 << (row * COL_NUM + column)
+        for row in range(top, top + ROW_NUM // 2)
+        for column in range(left, left + COL_NUM // 2)
+    )
+    for top in (0, ROW_NUM // 2)
+    for left in (0, COL_NUM // 2)
+)
+
+
+def odd_regions(empty: int) -> int:
+    """
+    Return the bitmask of the quadrants holding an odd number of the given
+    empty cells.
+
+    Playing there first tends to get the last move of each region, a.k.a.
+    parity.
+    """
+    regions = 0
+    for quadrant in QUADRANTS:
+        if (empty & quadrant).bit_count() & 1:
+            regions |= quadrant
+    return regions
+
+
+def move_bits(moves: int) -> list[int]:
+    """Return the single bits of the given bitmask."""
+    bits = []
+    while moves:
+        lowest = moves & -moves
+        bits.append(lowest)
+        moves ^= lowest
+    return bits
+
+
+class OthelloSolver(BoardSolver[HorizontalBoardAction]):
+    """Negamax with alpha-beta pruning on the final difference in discs."""
+
+    def __init__(self, empties: int = EMPTIES) -> None:
+        super().__init__(empties)
+
+    def solve(
+        self,
+        model: Model[HorizontalBoardAction, BoardState, BoardChange],
+    ) -> tuple[float, HorizontalBoardAction | None]:
+        self.nodes = 0
+        own = opponent = 0
+        for index, mark in enumerate(model.state.flat):
+            if mark == model.turn:
+                own |= 1 << index
+            elif mark != MARK_EMPTY:
+                opponent |= 1 << index
+        moves = legal_moves(own, opponent)
+        if not moves:
+            return -self._negamax(opponent, own, -CELL_NUM, CELL_NUM), None
+        best_value, best_move = -CELL_NUM - 1, 0
+        for move in self._order(own, opponent, moves):
+            flips = flip_mask(own, opponent, move)
+            value = -self._negamax(
+                opponent ^ flips,
+                own | move | flips,
+                -CELL_NUM,
+                -best_value,
+            )
+            if value > best_value:
+                best_value, best_move = value, move
+        return best_value, divmod(best_move.bit_length() - 1, COL_NUM)
+
+    @staticmethod
+    def _order(own: int, opponent: int, moves: int) -> list[int]:
+        """
+        Return the given legal moves, those in the quadrants with an odd
+        number of empty cells first, and then those leaving the opponent the
+        fewest moves, a.k.a. fastest-first.
+        """
+        empty = FULL_MASK & ~(own | opponent)
+        odd = odd_regions(empty)
+        moves_first = move_bits(moves & odd) + move_bits(moves & ~odd)
+        if empty.bit_count() < FASTEST_FIRST_EMPTIES:
+            return moves_first
+
+        def replies(move: int) -> int:
+            flips = flip_mask(own, opponent, move)
+            return legal_moves(
+                opponent ^ flips,
+                own | move | flips,
+            ).bit_count()
+
+        return sorted(moves_first, key=replies)
+
+    def _negamax(self, own: int, opponent: int, alpha: int, beta: int) -> int:
+        """
+        Return the final difference in discs for the player to move, whose
+        discs are `own`, within the window (alpha, beta).
+        """
+        self.nodes += 1
+        moves = legal_moves(own, opponent)
+        if not moves:
+            if not legal_moves(opponent, own):
+                return own.bit_count() - opponent.bit_count()
+            # Pass
+            return -self._negamax(opponent, own, -beta, -alpha)
+        value = -CELL_NUM
+        for move in self._order(own, opponent, moves):
+            flips = flip_mask(own, opponent, move)
+            value = max(
+                value,
+                -self._negamax(
+                    opponent ^ flips,
+                    own | move | flips,
+                    -beta,
+                    -alpha,
+                ),
+            )
+            if value >= beta:
+                break
+            alpha = max(alpha, value)
+        return value
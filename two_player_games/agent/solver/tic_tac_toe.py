@@ -0,0 +1,139 @@
+"""
+A table of the values and best actions of every reachable Tic-Tac-Toe
+position, so that solving a position is a single lookup.
+
+Positions are keyed by their base-3 encoding, where the flat cell i holds the
+digit `mark % 3` times 3 ** i, i.e. 0 for an empty cell, 1 for the first
+player and 2 for the second one. Only the position with the smallest key
+among its 8 symmetries is solved, and the others are mapped onto it.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+from two_player_games.model import Model
+from two_player_games.model.board import BoardChange, BoardState
+from two_player_games.model.board.horizontal import HorizontalBoardAction
+from two_player_games.model.board.horizontal.tic_tac_toe import (
+    COL_NUM,
+    ROW_NUM,
+)
+from two_player_games.model.board.lines import line_windows
+from two_player_games.model.board.symmetry import square_symmetries
+
+from . import BoardSolver
+
+CELL_NUM = ROW_NUM * COL_NUM
+KEY_NUM = 3**CELL_NUM
+POWERS = tuple(3**cell for cell in range(CELL_NUM))
+WIN = 1
+DRAW = 0
+LOSS = -1
+# Entries pack the value of the player to move and the flat cell of a best
+# action as (value + 1) << VALUE_SHIFT | cell
+VALUE_SHIFT = 4
+CELL_MASK = (1 << VALUE_SHIFT) - 1
+# The entry of unreachable positions and of those that are not canonical
+UNSOLVED = 0xFF
+LINES = tuple(map(tuple, line_windows(ROW_NUM, COL_NUM, ROW_NUM).tolist()))
+SYMMETRIES = square_symmetries(ROW_NUM)
+# The base-3 power of the cell each cell is moved to by each symmetry, with
+# shape (CELL_NUM, 8), so that the keys of all symmetries are one product
+SYMMETRY_POWERS = np.zeros((CELL_NUM, len(SYMMETRIES)), np.int64)
+for _symmetry, _cells in enumerate(SYMMETRIES):
+    SYMMETRY_POWERS[_cells, _symmetry] = POWERS
+SYMMETRY_POWERS.flags.writeable = False
+
+
+def _canonical(digits: list[int]) -> tuple[int, tuple[int, ...]]:
+    """
+    Return the smallest key among the symmetries of the given base-3 digits,
+    and the symmetry giving it.
+    """
+    return min(
+        (
+            sum(digits[cell] * power for cell, power in zip(cells, POWERS)),
+            cells,
+        )
+        for cells in map(tuple, SYMMETRIES.tolist())
+    )
+
+
+def _solve(
+    digits: list[int],
+    digit: int,
+    table: npt.NDArray[np.uint8],
+) -> int:
+    """
+    Fill the entries of the canonical positions reachable from the given
+    running one, where `digit` is that of the player to move, and return its
+    value.
+    """
+    key, cells = _canonical(digits)
+    if table[key] != UNSOLVED:
+        return int(table[key] >> VALUE_SHIFT) - 1
+    best_value, best_cell = LOSS - 1, 0
+    for cell in range(CELL_NUM):
+        if digits[cell]:
+            continue
+        digits[cell] = digit
+        if any(
+            all(digits[line_cell] == digit for line_cell in line)
+            for line in LINES
+            if cell in line
+        ):
+            value = WIN
+        elif all(digits):
+            value = DRAW
+        else:
+            value = -_solve(digits, 3 - digit, table)
+        digits[cell] = 0
+        # Winning actions do not cut the loop short, so that every reachable
+        # position is solved
+        if value > best_value:
+            best_value, best_cell = value, cell
+    # The entry holds the cell of the canonical position
+    table[key] = (best_value + 1) << VALUE_SHIFT | cells.index(best_cell)
+    return best_value
+
+
+@cache
+def solved_table() -> npt.NDArray[np.uint8]:
+    """
+    Return the packed entries of all keys, which are only solved for the
+    canonical running positions.
+
+    The table is built once per process, in well under a second.
+    """
+    table = np.full(KEY_NUM, UNSOLVED, np.uint8)
+    _solve([0] * CELL_NUM, 1, table)
+    table.flags.writeable = False
+    return table
+
+
+class TicTacToeSolver(BoardSolver[HorizontalBoardAction]):
+    """Look up the value and a best action of any reachable position."""
+
+    def __init__(self, empties: int = CELL_NUM) -> None:
+        super().__init__(empties)
+        self.table = solved_table()
+
+    def solve(
+        self,
+        model: Model[HorizontalBoardAction, BoardState, BoardChange],
+    ) -> tuple[float, HorizontalBoardAction | None]:
+        self.nodes = 0
+        if not model.possible_actions:
+            return DRAW, None
+        digits = model.state.ravel() % 3
+        keys = digits @ SYMMETRY_POWERS
+        symmetry = int(keys.argmin())
+        packed = int(self.table[keys[symmetry]])
+        if packed == UNSOLVED:
+            raise ValueError("The position is not reachable")
+        cell = int(SYMMETRIES[symmetry, packed & CELL_MASK])
+        return (packed >> VALUE_SHIFT) - 1, divmod(cell, COL_NUM)
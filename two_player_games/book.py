@@ -0,0 +1,72 @@
+"""
+Build an opening book by searching every position near the start of a game
+offline, e.g. to save the costliest searches of each tournament game.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from argparse import ArgumentParser
+from typing import Any
+
+from .agent.book import build_book, write_book
+from .agent.minimax import MaxiMin
+from .common import CellMark, Turn
+from .model.arg import ModelArg
+from .tournament import parse_agent_spec
+
+
+def main() -> None:
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+    arg_parser = ArgumentParser(
+        description="Build an opening book with a maximin agent.",
+    )
+    arg_parser.add_argument(
+        "-m",
+        "--model",
+        dest="model",
+        type=ModelArg,
+        choices=ModelArg,
+        required=True,
+    )
+    arg_parser.add_argument(
+        "-a",
+        "--agent",
+        dest="agent",
+        type=parse_agent_spec,
+        required=True,
+        metavar="AGENT[:OPTION=VALUE,...]",
+        help="Maximin agent with a depth, e.g. maximin-alpha-beta:depth=8",
+    )
+    arg_parser.add_argument(
+        "-n",
+        "--plies",
+        dest="plies",
+        type=int,
+        default=4,
+        help="Plies from the start position searched",
+    )
+    arg_parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        required=True,
+        help="Path of the book file",
+    )
+
+    args = arg_parser.parse_args()
+    agents: dict[CellMark, Any] = {
+        turn: args.agent.create(args.model, turn) for turn in Turn
+    }
+    if not all(
+        isinstance(agent, MaxiMin) and agent.depth > 0
+        for agent in agents.values()
+    ):
+        arg_parser.error("The agent must be a maximin agent with a depth")
+    entries = build_book(args.model.get_model()(), agents, args.plies)
+    write_book(args.output, entries)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from enum import Enum, Flag, auto
+from enum import Enum, Flag, IntEnum, auto
 
 
 class Category(Flag):
@@ -10,7 +10,9 @@ class Category(Flag):
     # Cards = auto()
 
 
-class Status(Enum):  # Status(Flag)
+# IntEnum members are compared and hashed as plain ints, which matters on the
+# search hot path
+class Status(IntEnum):  # Status(Flag)
     RUNNING = auto()
     FIRST_WON = auto()
     SECOND_WON = auto()
@@ -28,19 +30,29 @@ class Event(Enum):
 
 
 # Enum is avoided here for its effect on the performance
-# TODO What about other instances of Enum?
 CellMark = int
 MARK_EMPTY = CellMark(0)
 MARK_FIRST = CellMark(1)
 MARK_SECOND = CellMark(-1)
 
 
-class Turn(Enum):
+class Turn(IntEnum):
+    """
+    The players, whose values are their cell marks.
+
+    Models and agents keep the turn as the plain cell mark of the player to
+    move, e.g. `Model.turn`, so negating it gives the opponent without any
+    Enum machinery. Both compare equal to the members of this class.
+    """
+
     FIRST = MARK_FIRST
     SECOND = MARK_SECOND
 
-    def __neg__(self) -> Turn:
-        return Turn.FIRST if self == Turn.SECOND else Turn.SECOND
+
+# Values per player, e.g. `Model._scores`, are stored in two-slot lists, where
+# the slot of the player with mark `turn` is `turn < 0`
+FIRST_SLOT = 0
+SECOND_SLOT = 1
 
 
 RGB = tuple[int, int, int]
@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
+from copy import copy
 from dataclasses import dataclass
 from functools import partial
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
-from two_player_games.common import Status, Turn
+from two_player_games.common import (
+    FIRST_SLOT,
+    MARK_FIRST,
+    SECOND_SLOT,
+    CellMark,
+    Status,
+    Turn,
+)
 
 Action = TypeVar("Action")
 State = TypeVar("State")
 Change = TypeVar("Change")
 # Item = TypeVar("Item")
+# The action, changes, turn, scores, status and possible actions before an
+# action executed by `push`, and the model-specific data of `_undo_data`
+UndoRecord = tuple[
+    Action | None,
+    list[Change],
+    CellMark,
+    list[float],
+    Status,
+    list[Action],
+    object,
+]
+
+# Setting this environment variable to a value other than 0 makes models
+# verify that `peek_then_eval` restores them, e.g. while debugging agents
+VERIFY_ENV = "TWO_PG_VERIFY"
 
 
 @dataclass
@@ -30,6 +54,17 @@ class PlayAfterGameOver(Exception, Generic[Action]):
         return f"Attempted action after the game is over: {self.action}"
 
 
+def _is_equal(first: object, second: object) -> bool:
+    """Compare the given values, including NumPy arrays and dicts of them."""
+    if isinstance(first, dict) and isinstance(second, dict):
+        return first.keys() == second.keys() and all(
+            _is_equal(value, second[key]) for key, value in first.items()
+        )
+    # NumPy arrays compare element-wise
+    equal: Any = first == second
+    return equal if isinstance(equal, bool) else bool(equal.all())
+
+
 class Model(ABC, Generic[Action, State, Change]):
     """
     An abstract class specifying the interface for a game model.
@@ -45,27 +80,49 @@ class Model(ABC, Generic[Action, State, Change]):
     def state(self, value: State) -> None:
         self._state = value
 
+    @property
+    def scores(self) -> dict[Turn, float]:
+        """Return the score of each player, e.g. for the view."""
+        return {
+            Turn.FIRST: self._scores[FIRST_SLOT],
+            Turn.SECOND: self._scores[SECOND_SLOT],
+        }
+
     @abstractmethod
     def __init__(self) -> None:
-        self.turn: Turn = Turn.FIRST
+        # The cell mark of the player to move, which equals a `Turn` member
+        self.turn: CellMark = MARK_FIRST
         self.status: Status = Status.RUNNING
-        self.scores: dict[Turn, float] = {
-            Turn.FIRST: 0,
-            Turn.SECOND: 0,
-        }
+        # The score of each player, in the slots defined in `common`
+        self._scores: list[float] = [0, 0]
         self.changes: list[Change] = []
         self.possible_actions: list[Action] = []
+        # The records needed to undo the actions executed by `push`
+        self._undo_stack: list[UndoRecord[Action, Change]] = []
+        # Whether `unmake` checks that the model is restored, which copies
+        # the attributes in `_SNAPSHOT_ATTRIBUTES` at every `make`
+        self.verify: bool = os.environ.get(VERIFY_ENV, "0") not in ("", "0")
+        self._snapshots: list[dict[str, Any]] = []
         """
         Subclasses must initialize the following attributes:
         - `self.state`
         - model-specific attributes
         They also can override the following attributes:
-        - `self.scores`
+        - `self._scores`
         - `self.changes`
         Then, they must call the following method:
         - `self._update_possible_actions()`
         """
 
+    # The attributes that must be restored after `peek_then_eval`
+    _SNAPSHOT_ATTRIBUTES: tuple[str, ...] = (
+        "changes",
+        "turn",
+        "_scores",
+        "status",
+        "possible_actions",
+    )
+
     def play(self, action: Action | None) -> bool:
         """
         Execute the given action.
@@ -84,12 +141,74 @@ class Model(ABC, Generic[Action, State, Change]):
         self._update_possible_actions()
         return True
 
+    def push(self, action: Action | None) -> bool:
+        """
+        Execute the given action and record how to undo it with `pop`.
+
+        Only the delta of the action is recorded. In particular, the
+        previous changes and possible actions are kept by reference, as they
+        are replaced rather than modified by `play`.
+        """
+        record = (
+            action,
+            self.changes,
+            self.turn,
+            self._scores.copy(),
+            self.status,
+            self.possible_actions,
+            self._undo_data(),
+        )
+        if not self.play(action):
+            return False
+        self._undo_stack.append(record)
+        return True
+
+    def pop(self) -> Action | None:
+        """Undo the last action executed by `push` and return it."""
+        action: Action | None
+        (
+            action,
+            changes,
+            turn,
+            scores,
+            status,
+            possible_actions,
+            data,
+        ) = self._undo_stack.pop()
+        self._undo_state_and_changes(action, data)
+        self.changes = changes
+        self.turn = turn
+        self._scores = scores
+        self.status = status
+        self.possible_actions = possible_actions
+        return action
+
+    def _undo_data(self) -> object:
+        """
+        Return the model-specific data needed to undo the next action, e.g.
+        attributes that are not restored by `pop`.
+        """
+        return None
+
     @abstractmethod
     def _update_state_and_changes(self, action: Action) -> None:
         """Update state and changes for the given action."""
         # No need to check for invalid actions as this method is only called
         # for actions in self.possible_actions
 
+    @abstractmethod
+    def _undo_state_and_changes(
+        self,
+        action: Action | None,
+        data: object,
+    ) -> None:
+        """
+        Revert the state for the given action, which has just been executed.
+
+        `self.changes` still holds the changes made by the action, and `data`
+        is the value returned by `_undo_data` before executing it.
+        """
+
     @abstractmethod
     def _update_scores(self, action: Action | None) -> None:
         """Update scores for each player for the given action."""
@@ -111,14 +230,44 @@ class Model(ABC, Generic[Action, State, Change]):
         # pylint: disable=unnecessary-dunder-call
         self.__init__()  # type: ignore
 
-    def reward(self, turn: Turn) -> float:
-        """Return the reward for the given player."""
-        return self.scores[turn] - self.scores[-turn]
+    def reward(self, turn: CellMark) -> float:
+        """Return the reward for the player with the given mark or `Turn`."""
+        return self._scores[turn < 0] - self._scores[turn > 0]
 
     def is_over(self) -> bool:
         return self.status != Status.RUNNING
 
-    @abstractmethod
+    def action_prior(self, _action: Action) -> float:
+        """
+        Return how promising the given action is regardless of the position.
+
+        Search agents use it to order actions. The higher, the better.
+        """
+        return 0
+
+    def make(self, action: Action | None) -> None:
+        """
+        Execute the given action during a search, to be undone by `unmake`.
+
+        Searches recurse directly between `make` and `unmake`, e.g. in a
+        try/finally statement so that the model is restored even when the
+        search runs out of time. Unlike `push`, an invalid action raises.
+        """
+        if self.verify:
+            if self.is_over():
+                raise PlayAfterGameOver(action)
+            self._snapshots.append(self._snapshot())
+        if not self.push(action):
+            if self.verify:
+                self._snapshots.pop()
+            raise InvalidAction(action, Turn(self.turn))
+
+    def unmake(self) -> None:
+        """Undo the last action executed by `make`."""
+        self.pop()
+        if self.verify:
+            self._assert_restored(self._snapshots.pop())
+
     def peek_then_eval(
         self,
         action: Action,
@@ -132,4 +281,27 @@ class Model(ABC, Generic[Action, State, Change]):
         2 - Evaluating the given function on the new state
         3 - Undoing the execution,
         3 - Returning the evaluation.
+
+        Searches call `make` and `unmake` directly, which avoids creating a
+        function for each action.
         """
+        self.make(action)
+        try:
+            return func(self)
+        finally:
+            self.unmake()
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {
+            name: copy(getattr(self, name))
+            for name in self._SNAPSHOT_ATTRIBUTES
+        }
+
+    def _assert_restored(self, snapshot: dict[str, Any]) -> None:
+        # Raised explicitly, so that verification also works with `python -O`
+        for name, value in snapshot.items():
+            restored = getattr(self, name)
+            if not _is_equal(value, restored):
+                raise AssertionError(
+                    f"{name} not restored correctly\n{value}\n{restored}",
+                )
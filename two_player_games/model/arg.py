@@ -7,7 +7,9 @@ from two_player_games.config import Config
 
 class ModelArg(StrEnum):
     CONNECT4 = "connect4"
+    CONNECT4_BITBOARD = "connect4-bitboard"
     OTHELLO = "othello"
+    OTHELLO_BITBOARD = "othello-bitboard"
     # PINOCHLE = "pinochle"
     # PONG = "pong"
     TICTACTOE = "tictactoe"
@@ -19,10 +21,18 @@ class ModelArg(StrEnum):
                 from .board.vertical.connect4 import Connect4
 
                 return Connect4
+            case ModelArg.CONNECT4_BITBOARD:
+                from .board.vertical.connect4_bitboard import Connect4Bitboard
+
+                return Connect4Bitboard
             case ModelArg.OTHELLO:
                 from .board.horizontal.othello import Othello
 
                 return Othello
+            case ModelArg.OTHELLO_BITBOARD:
+                from .board.horizontal.othello_bitboard import OthelloBitboard
+
+                return OthelloBitboard
             case ModelArg.TICTACTOE:
                 from .board.horizontal.tic_tac_toe import TicTacToe
 
@@ -31,11 +41,11 @@ class ModelArg(StrEnum):
     # pylint: disable=import-outside-toplevel
     def get_config(self) -> Config:
         match self:
-            case ModelArg.CONNECT4:
+            case ModelArg.CONNECT4 | ModelArg.CONNECT4_BITBOARD:
                 from two_player_games.config.board.connect4 import CONNECT4
 
                 return CONNECT4
-            case ModelArg.OTHELLO:
+            case ModelArg.OTHELLO | ModelArg.OTHELLO_BITBOARD:
                 from two_player_games.config.board.othelo import OTHELO
 
                 return OTHELO
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import random
 from abc import abstractmethod
 from dataclasses import dataclass
+from functools import cache
 
 import numpy as np
 import numpy.typing as npt
 
-from two_player_games.common import CellMark
+from two_player_games.common import (
+    MARK_EMPTY,
+    MARK_FIRST,
+    MARK_SECOND,
+    CellMark,
+    Turn,
+)
 from two_player_games.model import Action, Model
+from two_player_games.model.board.symmetry import identity_symmetries
 
 # Piece = TypeVar("Piece")
 
@@ -16,14 +25,68 @@ from two_player_games.model import Action, Model
 BoardState = npt.NDArray[np.int8]
 BoardChange = tuple[int, int]
 
+# A fixed seed keeps the keys stable across runs, e.g. for keys stored on disk
+ZOBRIST_SEED = 0x2B6
+
+
+@dataclass(frozen=True)
+class ZobristTable:
+    """Random 64-bit keys for each cell mark, the turn and the pass flag."""
+
+    cells: dict[CellMark, dict[BoardChange, int]]
+    # Toggled when the second player is to move
+    turn: int
+    # Toggled when the last turn was passed, e.g. in Othello
+    turn_passed: int
+
+
+@cache
+def zobrist_table(row_num: int, col_num: int) -> ZobristTable:
+    rng = random.Random(ZOBRIST_SEED)
+    cells = {
+        mark: {
+            (row, col): rng.getrandbits(64)
+            for row in range(row_num)
+            for col in range(col_num)
+        }
+        for mark in (MARK_FIRST, MARK_SECOND)
+    }
+    return ZobristTable(cells, rng.getrandbits(64), rng.getrandbits(64))
+
+
+@cache
+def zobrist_cells(row_num: int, col_num: int) -> npt.NDArray[np.uint64]:
+    """
+    Return the keys of `zobrist_table` as an array indexed by the base-3
+    digit of the mark, `mark % 3`, and the flat cell, where empty cells have
+    no key.
+    """
+    table = zobrist_table(row_num, col_num)
+    cells = np.zeros((3, row_num * col_num), np.uint64)
+    for mark, cell_keys in table.cells.items():
+        for (row, col), cell_key in cell_keys.items():
+            cells[mark % 3, row * col_num + col] = cell_key
+    cells.flags.writeable = False
+    return cells
+
 
 @dataclass
 class Board(
     Model[Action, BoardState, BoardChange],
 ):
+    _SNAPSHOT_ATTRIBUTES = (*Model._SNAPSHOT_ATTRIBUTES, "state", "key")
 
     @abstractmethod
-    def __init__(self, row_num: int, col_num: int) -> None:
+    def __init__(
+        self,
+        row_num: int,
+        col_num: int,
+        symmetries: npt.NDArray[np.intp] | None = None,
+    ) -> None:
+        """
+        `symmetries` are those of the rules, see `symmetry`, and default to
+        the identity alone.
+        """
         super().__init__()
 
         # FIXME Avoid this repetition. This should be already covered in Model
@@ -31,3 +94,123 @@ class Board(
         self.changes = []
         self._row_num: int = row_num
         self._col_num: int = col_num
+        # The Zobrist key of the position, which subclasses keep up to date
+        # with `_hash_changes` whenever they update the state
+        self._zobrist = zobrist_table(row_num, col_num)
+        self.key: int = 0
+        self.symmetries = (
+            identity_symmetries(row_num, col_num)
+            if symmetries is None
+            else symmetries
+        )
+        # The cell of the image where each cell is moved by each symmetry
+        self._inverse_symmetries = np.argsort(self.symmetries, axis=1)
+        self._zobrist_cells = zobrist_cells(row_num, col_num)
+
+    def compute_key(self) -> int:
+        """Compute the Zobrist key of the position from scratch."""
+        key = 0 if self.turn == Turn.FIRST else self._zobrist.turn
+        for mark, cell_keys in self._zobrist.cells.items():
+            for cell, cell_key in cell_keys.items():
+                if self.state[cell] == mark:
+                    key ^= cell_key
+        return key
+
+    def symmetric_keys(self) -> list[int]:
+        """
+        Compute the Zobrist key of the image of the position by each
+        symmetry.
+        """
+        digits = self.state.ravel()[self.symmetries] % 3
+        cell_keys = self._zobrist_cells[digits, np.arange(digits.shape[1])]
+        board_keys = np.bitwise_xor.reduce(cell_keys, axis=1).tolist()
+        # The keys of the turn and of passes are the same for all images
+        other_keys = self.key ^ board_keys[0]
+        return [board_key ^ other_keys for board_key in board_keys]
+
+    def canonical_key(self) -> tuple[int, int]:
+        """
+        Return the smallest key among the images of the position, which is
+        the same for all of them, and the symmetry giving it.
+        """
+        keys = self.symmetric_keys()
+        key = min(keys)
+        return key, keys.index(key)
+
+    def symmetric_cell(self, action: Action, symmetry: int) -> int:
+        """
+        Return the flat cell of the image of the given action by the given
+        symmetry, or its column on vertical boards.
+        """
+        inverse = self._inverse_symmetries[symmetry]
+        if isinstance(action, tuple):
+            row, col = action
+            return int(inverse[row * self._col_num + col])
+        # The symmetries of vertical boards keep the rows
+        return int(inverse[action]) % self._col_num
+
+    def symmetric_action(self, action: Action, symmetry: int) -> Action:
+        """Return the image of the given action by the given symmetry."""
+        cell = self.symmetric_cell(action, symmetry)
+        if isinstance(action, tuple):
+            return divmod(cell, self._col_num)
+        return cell
+
+    def unique_actions(self) -> list[Action]:
+        """
+        Return the possible actions, except those leading to the image of the
+        position after a previous one, by a symmetry keeping the position.
+        """
+        keys = self.symmetric_keys()
+        symmetries = [
+            symmetry
+            for symmetry in range(1, len(keys))
+            if keys[symmetry] == keys[0]
+        ]
+        if not symmetries:
+            return self.possible_actions
+        actions: list[Action] = []
+        for action in self.possible_actions:
+            if not any(
+                self.symmetric_action(action, symmetry) in actions
+                for symmetry in symmetries
+            ):
+                actions.append(action)
+        return actions
+
+    def _hash_changes(self) -> None:
+        """
+        Update the key for the changes made by the player to move: the first
+        cell has been marked, and the remaining ones, if any, flipped.
+        """
+        if not self.changes:
+            return
+        own_keys = self._zobrist.cells[self.turn]
+        opponent_keys = self._zobrist.cells[-self.turn]
+        cells = iter(self.changes)
+        key = self.key ^ own_keys[next(cells)]
+        for cell in cells:
+            key ^= own_keys[cell] ^ opponent_keys[cell]
+        self.key = key
+
+    def _switch_turn(self) -> None:
+        super()._switch_turn()
+        self.key ^= self._zobrist.turn
+
+    def _undo_data(self) -> int:
+        return self.key
+
+    def _undo_state_and_changes(
+        self,
+        action: Action | None,
+        data: int,
+    ) -> None:
+        self.key = data
+        if not self.changes:
+            return
+        # The first change is the cell marked by the action, and the
+        # remaining ones, if any, are the cells it flipped.
+        cells = iter(self.changes)
+        self.state[next(cells)] = MARK_EMPTY
+        for cell in cells:
+            self.state[cell] = -self.state[cell]
@@ -0,0 +1,137 @@
+"""
+Many games of the same board game stepped together in NumPy, e.g. for
+playouts or self-play data, instead of one `Model` at a time.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import numpy.typing as npt
+
+from two_player_games.common import MARK_EMPTY, CellMark, Turn
+
+from . import BoardState
+from .lines import cell_windows
+
+# pylint: disable=unsubscriptable-object
+BatchState = npt.NDArray[np.int8]
+BatchActions = npt.NDArray[np.intp]
+
+
+class BoardBatch(ABC):
+    """
+    A batch of `size` boards stored as one (size, row_num, col_num) array of
+    cell marks.
+
+    The turns and winners are cell marks per board, and a winner of
+    `MARK_EMPTY` means that the game is running or drawn. Games that are over
+    ignore the actions they are given.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        row_num: int,
+        col_num: int,
+        winning_streak: int,
+        action_num: int,
+    ) -> None:
+        self.size = size
+        self._row_num = row_num
+        self._col_num = col_num
+        # The number of actions, legal or not, on every board
+        self.action_num = action_num
+        self.states: BatchState = np.zeros((size, row_num, col_num), np.int8)
+        self.turns: npt.NDArray[np.int8] = np.full(
+            size,
+            Turn.FIRST,
+            np.int8,
+        )
+        self.winners: npt.NDArray[np.int8] = np.full(size, MARK_EMPTY, np.int8)
+        self.mark_nums: npt.NDArray[np.intp] = np.zeros(size, np.intp)
+        self._cell_windows = cell_windows(row_num, col_num, winning_streak)
+        self._boards = np.arange(size)
+
+    def reset(
+        self,
+        state: BoardState | None = None,
+        turn: CellMark = Turn.FIRST,
+    ) -> None:
+        """
+        Start every game from the given running position, or from an empty
+        board.
+        """
+        if state is None:
+            self.states[:] = MARK_EMPTY
+        else:
+            self.states[:] = state
+        self.turns[:] = turn
+        self.winners[:] = MARK_EMPTY
+        self.mark_nums[:] = np.count_nonzero(self.states[0])
+
+    @abstractmethod
+    def legal_mask(self) -> npt.NDArray[np.bool_]:
+        """Return which actions are legal, with shape (size, action_num)."""
+
+    @abstractmethod
+    def _place(
+        self,
+        boards: BatchActions,
+        actions: BatchActions,
+    ) -> BatchActions:
+        """
+        Update any state specific to the game for the legal actions on the
+        given boards, and return the flat cells they mark.
+        """
+
+    def step(self, actions: BatchActions) -> None:
+        """
+        Play one action per board, given as an index below `action_num`.
+
+        Raise ValueError if an action is illegal on a running board.
+        """
+        boards = self._boards[~self.is_terminal()]
+        actions = np.asarray(actions)[boards]
+        if not self.legal_mask()[boards, actions].all():
+            raise ValueError("Illegal actions in the batch")
+        cells = self._place(boards, actions)
+        marks = self.turns[boards]
+        flat_states = self.states.reshape(self.size, -1)
+        flat_states[boards, cells] = marks
+        self.mark_nums[boards] += 1
+        # Only the lines through the new marks can have been completed
+        lines = flat_states[boards[:, None, None], self._cell_windows[cells]]
+        won = (lines == marks[:, None, None]).all(axis=2).any(axis=1)
+        self.winners[boards[won]] = marks[won]
+        self.turns[boards] = -marks
+
+    def is_terminal(self) -> npt.NDArray[np.bool_]:
+        """Return whether each game is over."""
+        is_terminal: npt.NDArray[np.bool_] = (self.winners != MARK_EMPTY) | (
+            self.mark_nums == self._row_num * self._col_num
+        )
+        return is_terminal
+
+    def reward(self, turn: CellMark) -> npt.NDArray[np.float64]:
+        """
+        Return 1 for each game won by the player, -1 for each game lost and 0
+        otherwise, as `Model.reward` does for finished games.
+        """
+        reward: npt.NDArray[np.float64] = (self.winners * turn).astype(
+            np.float64,
+        )
+        return reward
+
+    def random_actions(self, rng: np.random.Generator) -> BatchActions:
+        """Return a uniformly random legal action per board, or 0 if none."""
+        keys = rng.random((self.size, self.action_num))
+        keys[~self.legal_mask()] = -1
+        actions: BatchActions = keys.argmax(axis=1)
+        return actions
+
+    def play_out(self, rng: np.random.Generator) -> None:
+        """Play random actions until every game is over."""
+        while not self.is_terminal().all():
+            self.step(self.random_actions(rng))
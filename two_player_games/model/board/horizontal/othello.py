@@ -1,27 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import partial
 
 import numpy as np
 import numpy.typing as npt
 
 from two_player_games.common import (
+    FIRST_SLOT,
     MARK_EMPTY,
     MARK_FIRST,
     MARK_SECOND,
+    SECOND_SLOT,
     Status,
     Turn,
 )
 from two_player_games.config.board.othelo import OTHELO
-from two_player_games.model import InvalidAction, PlayAfterGameOver
 from two_player_games.model.board.horizontal import (
     HorizontalBoard,
     HorizontalBoardAction,
 )
+from two_player_games.model.board.symmetry import square_symmetries
 
 BLACK = Turn.FIRST
 WHITE = Turn.SECOND
+BLACK_SLOT = FIRST_SLOT
+WHITE_SLOT = SECOND_SLOT
 BLACK_MARK = MARK_FIRST
 WHITE_MARK = MARK_SECOND
 BLACK_WON = Status.FIRST_WON
@@ -38,180 +41,222 @@ INIT_WHITE = [
     (ROW_NUM // 2 - 1, COL_NUM // 2 - 1),
     (ROW_NUM // 2, COL_NUM // 2),
 ]
-GRID_INDICES = (
-    np.array(list(np.ndindex(ROW_NUM, COL_NUM)))
-    .view(
-        dtype=np.dtype(
-            [("row", "<i4"), ("column", "<i4")],
-        ),
-    )
-    .reshape(ROW_NUM, COL_NUM)
+CELL_NUM = ROW_NUM * COL_NUM
+# The (row, column) of each flat cell, row * COL_NUM + column
+CELLS = tuple(divmod(cell, COL_NUM) for cell in range(CELL_NUM))
+
+# The eight directions as (row, column) steps
+DIRECTIONS = (
+    (-1, -1),  # UP_LEFT
+    (-1, 0),  # UP
+    (-1, 1),  # UP_RIGHT
+    (0, -1),  # LEFT
+    (0, 1),  # RIGHT
+    (1, -1),  # DOWN_LEFT
+    (1, 0),  # DOWN
+    (1, 1),  # DOWN_RIGHT
 )
+# A ray ends with at least one cell past the edge of the board
+RAY_LENGTH = max(ROW_NUM, COL_NUM)
+# The index of an extra cell past the edge of the board, which stays empty
+OFF_BOARD = CELL_NUM
 
-DIRECTION_ARRAY = (
-    (np.array(list(np.ndindex(3, 3))) - 1)
-    .view(
-        dtype=np.dtype(
-            [("row", "<i4"), ("column", "<i4")],
-        ),
-    )
-    .reshape(9)
+
+def _ray(cell: int, direction: tuple[int, int]) -> list[int]:
+    """
+    Return the flat cells from the given one, excluded, to the edge of the
+    board, padded with OFF_BOARD to RAY_LENGTH cells.
+    """
+    row, column = CELLS[cell]
+    ray = []
+    for _ in range(RAY_LENGTH):
+        row += direction[0]
+        column += direction[1]
+        if 0 <= row < ROW_NUM and 0 <= column < COL_NUM:
+            ray.append(row * COL_NUM + column)
+        else:
+            ray.append(OFF_BOARD)
+    return ray
+
+
+# The ray of each cell in each direction, with shape
+# (CELL_NUM, len(DIRECTIONS), RAY_LENGTH)
+RAYS: npt.NDArray[np.intp] = np.array(
+    [
+        [_ray(cell, direction) for direction in DIRECTIONS]
+        for cell in range(CELL_NUM)
+    ],
+    np.intp,
+)
+RAYS.flags.writeable = False
+RAY_INDICES = np.arange(RAY_LENGTH)
+# The flat cells next to each cell, i.e. the first cell of each of its rays
+NEIGHBOURS = tuple(
+    RAYS[cell, :, 0][RAYS[cell, :, 0] != OFF_BOARD] for cell in range(CELL_NUM)
 )
 
-# FIXME Type inheritance is not correct here. Is this needed? Could it be a
-# tuple, e.g. ((-1, -1),) , ...? No. Explain why.
-DIRECTION = dict[str, tuple[int, int]](
-    UP_LEFT=DIRECTION_ARRAY[0],
-    UP=DIRECTION_ARRAY[1],
-    UP_RIGHT=DIRECTION_ARRAY[2],
-    LEFT=DIRECTION_ARRAY[3],
-    CENTRE=DIRECTION_ARRAY[4],
-    RIGHT=DIRECTION_ARRAY[5],
-    DOWN_LEFT=DIRECTION_ARRAY[6],
-    DOWN=DIRECTION_ARRAY[7],
-    DOWN_RIGHT=DIRECTION_ARRAY[8],
+# The classic positional weights: corners are stable, whereas the cells next
+# to them give the opponent access to the corners
+POSITIONAL_WEIGHTS = (
+    (100, -20, 10, 5, 5, 10, -20, 100),
+    (-20, -50, -2, -2, -2, -2, -50, -20),
+    (10, -2, -1, -1, -1, -1, -2, 10),
+    (5, -2, -1, -1, -1, -1, -2, 5),
+    (5, -2, -1, -1, -1, -1, -2, 5),
+    (10, -2, -1, -1, -1, -1, -2, 10),
+    (-20, -50, -2, -2, -2, -2, -50, -20),
+    (100, -20, 10, 5, 5, 10, -20, 100),
 )
+# The Zobrist key, whether the last turn was passed, the frontier and the
+# possible flips
+OthelloUndoData = tuple[
+    int,
+    bool,
+    npt.NDArray[np.bool_],
+    npt.NDArray[np.intp],
+]
 
 
 # TODO pylint: disable=too-many-instance-attributes
 @dataclass
 class Othello(HorizontalBoard):
 
+    _SNAPSHOT_ATTRIBUTES = (
+        *HorizontalBoard._SNAPSHOT_ATTRIBUTES,
+        "_turn_passed",
+        "_frontier",
+        "_possible_flips",
+    )
+
     # TODO Avoid this repetition. This should be already covered in Model
     def __init__(self) -> None:
-        super().__init__(ROW_NUM, COL_NUM)
+        super().__init__(ROW_NUM, COL_NUM, square_symmetries(ROW_NUM))
         for cell in INIT_BLACK:
             self.changes.append(cell)
             self.state[cell] = BLACK_MARK
+            self.key ^= self._zobrist.cells[BLACK_MARK][cell]
         for cell in INIT_WHITE:
             self.changes.append(cell)
             self.state[cell] = WHITE_MARK
-        self.scores = {
-            BLACK: len(INIT_BLACK),
-            WHITE: len(INIT_WHITE),
-        }
+            self.key ^= self._zobrist.cells[WHITE_MARK][cell]
+        self._scores = [len(INIT_BLACK), len(INIT_WHITE)]
         # Mark whether the last turn was passed without playing
         self._turn_passed: bool = False
-        # The number of possible flips in each direction for each action.
-        self._possible_flips: dict[str, npt.NDArray[np.int8]] = {}
-        self._vectorized_possible_flips_dir = np.vectorize(
-            self._possible_flips_dir,
-            otypes=[int],
+        # Whether each flat cell is empty and next to a disc. Only these cells
+        # can be possible actions.
+        self._frontier: npt.NDArray[np.bool_] = np.zeros(CELL_NUM, np.bool_)
+        for row, column in (*INIT_BLACK, *INIT_WHITE):
+            self._update_frontier(row * COL_NUM + column)
+        # The number of possible flips in each direction for each action,
+        # with shape (len(DIRECTIONS), ROW_NUM, COL_NUM)
+        self._possible_flips: npt.NDArray[np.intp] = np.zeros(
+            (len(DIRECTIONS), ROW_NUM, COL_NUM),
+            np.intp,
         )
         self._update_possible_actions()
 
     def _update_state_and_changes(self, action: HorizontalBoardAction) -> None:
-        self.changes = [action]
-        self.state[action] = self.turn.value
-        # TODO Update more efficiently (without for loop)
-        for direction_name, direction_value in DIRECTION.items():
-            self._update_state_and_changes_dir(
-                action,
-                direction_value,
-                # TODO Convert possible flips to 3x3xrow_numxcol_num array
-                self._possible_flips[direction_name][action],
-            )
+        counts = self._possible_flips[:, action[0], action[1]]
+        # The first `count` cells of the ray in each direction are flipped
+        flips = RAYS[action[0] * COL_NUM + action[1]][
+            RAY_INDICES < counts[:, None]
+        ]
+        self.changes = [action, *(CELLS[cell] for cell in flips.tolist())]
+        flat_state = self.state.ravel()
+        flat_state[action[0] * COL_NUM + action[1]] = self.turn
+        flat_state[flips] = self.turn
+        # Flipping discs does not change which cells are empty
+        self._frontier = self._frontier.copy()
+        self._update_frontier(action[0] * COL_NUM + action[1])
+        self._hash_changes()
+
+    def _update_frontier(self, cell: int) -> None:
+        """Update the frontier for a disc placed on the given flat cell."""
+        neighbours = NEIGHBOURS[cell]
+        self._frontier[neighbours] |= (
+            self.state.ravel()[neighbours] == MARK_EMPTY
+        )
+        self._frontier[cell] = False
 
-    def _update_state_and_changes_dir(
+    def _undo_data(self) -> OthelloUndoData:
+        # _frontier and _possible_flips are replaced rather than modified by
+        # play, so keeping references is enough
+        return (
+            super()._undo_data(),
+            self._turn_passed,
+            self._frontier,
+            self._possible_flips,
+        )
+
+    def _undo_state_and_changes(
         self,
-        action: HorizontalBoardAction,
-        direction: tuple[int, int],
-        count: int,
+        action: HorizontalBoardAction | None,
+        data: OthelloUndoData,
     ) -> None:
-        """
-        Flip the cells in the given direction starting from the cell
-        following the given action, updating scores accordingly.
-        """
-        cell_mark = self.turn.value
-        # TODO Update more efficiently (without for loop)
-        for _ in range(count):
-            # change = action + (i + 1) * direction
-            row = action[0] + direction[0]
-            column = action[1] + direction[1]
-            action = (row, column)
-            self.changes.append(action)
-            self.state[action] = cell_mark
+        key, self._turn_passed, self._frontier, self._possible_flips = data
+        super()._undo_state_and_changes(action, key)
+
+    def compute_key(self) -> int:
+        key = super().compute_key()
+        return key ^ self._zobrist.turn_passed if self._turn_passed else key
+
+    def _set_turn_passed(self, turn_passed: bool) -> None:
+        if turn_passed != self._turn_passed:
+            self._turn_passed = turn_passed
+            self.key ^= self._zobrist.turn_passed
 
     def _update_scores(self, action: HorizontalBoardAction | None) -> None:
         if action is None:
             return
-        self.scores[self.turn] += 1
-        # TODO Update more efficiently (without for loop)
-        for direction_name in DIRECTION:
-            possible_flips = self._possible_flips[direction_name][action]
-            self.scores[self.turn] += possible_flips
-            self.scores[-self.turn] -= possible_flips
+        flip_num = int(self._possible_flips[:, action[0], action[1]].sum())
+        self._scores[self.turn < 0] += 1 + flip_num
+        self._scores[self.turn > 0] -= flip_num
 
     def _update_status(self, action: HorizontalBoardAction | None) -> None:
         if action is not None:
-            self._turn_passed = False
+            self._set_turn_passed(False)
         else:
             if self._turn_passed:
                 # The game is over when both players pass consecutively
-                if self.scores[BLACK] > self.scores[WHITE]:
+                if self._scores[BLACK_SLOT] > self._scores[WHITE_SLOT]:
                     self.status = BLACK_WON
-                elif self.scores[BLACK] < self.scores[WHITE]:
+                elif self._scores[BLACK_SLOT] < self._scores[WHITE_SLOT]:
                     self.status = WHITE_WON
                 else:
                     self.status = Status.DRAW
             else:
-                self._turn_passed = True
+                self._set_turn_passed(True)
+
+    def action_prior(self, action: HorizontalBoardAction) -> float:
+        return POSITIONAL_WEIGHTS[action[0]][action[1]]
 
     def _update_possible_actions(self) -> None:
         self._update_possible_flips()
-        # TODO Update more efficiently (without for loops)
-        self.possible_actions = [
-            (row, column)
-            for row in range(self._row_num)
-            for column in range(self._col_num)
-            if any(
-                self._possible_flips[direction][(row, column)]
-                for direction in DIRECTION
-            )
-        ]
+        rows, columns = self._possible_flips.any(axis=0).nonzero()
+        self.possible_actions = list(zip(rows.tolist(), columns.tolist()))
 
     def _update_possible_flips(self) -> None:
-        """Compute the possible flips for each cell in each direction."""
-        self._possible_flips = {}
-        # TODO Update more efficiently (without for loop)
-        for direction_name, direction_value in DIRECTION.items():
-            self._possible_flips[direction_name] = (
-                self._vectorized_possible_flips_dir(
-                    GRID_INDICES,
-                    direction_value,
-                )
-            )
-
-    def _possible_flips_dir(
-        self,
-        action: HorizontalBoardAction,
-        direction: tuple[int, int],
-    ) -> int:
         """
-        Return the number of possible flips in the given direction starting
-        from the cell following the given action.
+        Compute the possible flips for each cell in each direction, which are
+        zero outside the frontier.
         """
-        # TODO Is it more efficient to take slices and check possible flips for
-        # each slice instead of the while loop?
-        if self.state[action] != MARK_EMPTY:
-            return 0
-        result = 0
-        player_cell = self.turn.value
-        opponent_cell = -player_cell
-        while True:
-            row = action[0] + direction[0]
-            column = action[1] + direction[1]
-            action = (row, column)
-
-            if not (0 <= row < self._row_num and 0 <= column < self._col_num):
-                return 0
-            if self.state[action] == player_cell:
-                return result
-            if self.state[action] == opponent_cell:
-                result += 1
-            else:
-                # Empty cell
-                return 0
+        player_mark = self.turn
+        cells = self._frontier.nonzero()[0]
+        flat_state = np.append(self.state.ravel(), MARK_EMPTY)
+        # The marks along each ray, with shape (len(cells), 8, RAY_LENGTH)
+        rays = flat_state[RAYS[cells]]
+        # The number of opponent discs at the start of each ray
+        runs = np.cumprod(rays == -player_mark, axis=2).sum(axis=2)
+        # The cell right after the opponent discs must hold a player disc.
+        # The last cell of a ray is always off the board, which stops runs.
+        ends = np.take_along_axis(rays, runs[..., None], axis=2)[..., 0]
+        flips = np.zeros((CELL_NUM, len(DIRECTIONS)), np.intp)
+        flips[cells] = np.where(ends == player_mark, runs, 0)
+        self._possible_flips = flips.T.reshape(
+            len(DIRECTIONS),
+            ROW_NUM,
+            COL_NUM,
+        )
 
     # TODO Refactor: Move these repeated methods to Model
     # TODO Consider overloading __init__ instead of deepcopy to avoid needing
@@ -231,96 +276,3 @@ class Othello(HorizontalBoard):
     #     board._turn_passed = self._turn_passed
     #     board._possible_flips = self._possible_flips.copy()
     #     return board
-
-    # TODO Refactor: Move these repeated methods to Model
-    def peek_then_eval(
-        self,
-        action: HorizontalBoardAction,
-        func: partial[tuple[float, HorizontalBoardAction | None]],
-    ) -> tuple[float, HorizontalBoardAction | None]:
-        # TODO Why not use deep copy? Benchmark both options
-        # Save state
-        changes = self.changes.copy()
-        state = self.state.copy()
-        turn = self.turn
-        scores = self.scores.copy()
-        status = self.status
-        possible_actions = self.possible_actions.copy()
-        _turn_passed = self._turn_passed
-        # TODO Compare performance with
-        # _possible_flips = self._possible_flips.copy()
-        # This makes more sense if _possible_flips is a numpy array, in which
-        # case it would be more efficient to set:
-        # _possible_flips = self._possible_flips[:, action].copy()
-        _possible_flips = {
-            direction: self._possible_flips[direction][action]
-            for direction in DIRECTION
-        }
-
-        # Execute
-        if not self.is_over():
-            if not self.play(action):
-                raise InvalidAction(action, self.turn)
-        else:
-            # Unreachable
-            raise PlayAfterGameOver(action)
-
-        # Eval
-        evaluation = func(self)
-
-        # Undo execution
-        # FIXME Look for a more efficient approach to restore the state
-        self.changes = changes
-        self.state[action] = MARK_EMPTY
-        self.scores[turn] -= 1
-        # TODO Update more efficiently (without for loop)
-        for direction_name, direction_value in DIRECTION.items():
-            self._update_state_and_changes_dir(
-                action,
-                direction_value,
-                _possible_flips[direction_name],
-            )
-        self._update_scores(action)
-        self.turn = turn
-        self.status = status
-        self._update_possible_actions()
-        self._turn_passed = _turn_passed
-
-        # TODO Move these assert statements to tests
-        assert (
-            changes == self.changes
-        ), f"Grid not restored correctly\n{state}\n{self.state}"
-        assert (
-            state == self.state
-        ).all(), f"Grid not restored correctly\n{state}\n{self.state}"
-        assert (
-            turn == self.turn
-        ), f"Player turn not restored correctly\n{turn}\n{self.turn}"
-        assert (
-            scores == self.scores
-        ), f"Scores not restored correctly\n{scores}\n{self.scores}"
-        assert (
-            possible_actions == self.possible_actions
-        ), "Possible actions not restored correctly.\n{}\n{}".format(
-            possible_actions,
-            self.possible_actions,
-        )
-        assert (
-            status == self.status
-        ), f"Status not restored correctly\n{status}\n{self.status}"
-        assert (
-            _turn_passed == self._turn_passed
-        ), "turn_passed not restored correctly\n{}\n{}".format(
-            _turn_passed,
-            self._turn_passed,
-        )
-        # TODO Check more efficiently, e.g. with np.array_equal
-        assert _possible_flips == {
-            direction: self._possible_flips[direction][action]
-            for direction in DIRECTION
-        }, "Possible flips not restored correctly.\n{}\n{}".format(
-            _possible_flips,
-            self._possible_flips,
-        )
-
-        return evaluation
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import numpy as np
+
+from two_player_games.common import MARK_EMPTY, Status
+from two_player_games.model import Model
+from two_player_games.model.board import BoardState
+from two_player_games.model.board.horizontal import (
+    HorizontalBoard,
+    HorizontalBoardAction,
+)
+from two_player_games.model.board.horizontal.othello import (
+    BLACK,
+    BLACK_MARK,
+    BLACK_SLOT,
+    BLACK_WON,
+    COL_NUM,
+    INIT_BLACK,
+    INIT_WHITE,
+    POSITIONAL_WEIGHTS,
+    ROW_NUM,
+    WHITE_MARK,
+    WHITE_SLOT,
+    WHITE_WON,
+)
+from two_player_games.model.board.symmetry import square_symmetries
+
+# Cell (row, column) is stored in bit row * COL_NUM + column
+CELL_NUM = ROW_NUM * COL_NUM
+FULL_MASK = (1 << CELL_NUM) - 1
+FIRST_COLUMN = sum(1 << (row * COL_NUM) for row in range(ROW_NUM))
+LAST_COLUMN = FIRST_COLUMN << (COL_NUM - 1)
+# Shifting towards the right (left) wraps around onto the first (last)
+# column, which must be masked out.
+NOT_FIRST_COLUMN = FULL_MASK ^ FIRST_COLUMN
+NOT_LAST_COLUMN = FULL_MASK ^ LAST_COLUMN
+# (shift, mask) pairs for the eight directions
+DIRECTIONS = (
+    (-COL_NUM - 1, NOT_LAST_COLUMN),  # UP_LEFT
+    (-COL_NUM, FULL_MASK),  # UP
+    (-COL_NUM + 1, NOT_FIRST_COLUMN),  # UP_RIGHT
+    (-1, NOT_LAST_COLUMN),  # LEFT
+    (1, NOT_FIRST_COLUMN),  # RIGHT
+    (COL_NUM - 1, NOT_LAST_COLUMN),  # DOWN_LEFT
+    (COL_NUM, FULL_MASK),  # DOWN
+    (COL_NUM + 1, NOT_FIRST_COLUMN),  # DOWN_RIGHT
+)
+
+
+# The Zobrist key, the bitboards of both players, the legal moves and whether
+# the last turn was passed
+OthelloBitboardUndoData = tuple[int, int, int, int, bool]
+
+
+def cell_to_bit(cell: HorizontalBoardAction) -> int:
+    return 1 << (cell[0] * COL_NUM + cell[1])
+
+
+def bits_to_cells(bits: int) -> list[HorizontalBoardAction]:
+    """Return the cells of the set bits in increasing order."""
+    cells = []
+    while bits:
+        lowest = bits & -bits
+        cells.append(divmod(lowest.bit_length() - 1, COL_NUM))
+        bits ^= lowest
+    return cells
+
+
+def _shift(bits: int, amount: int, mask: int) -> int:
+    if amount > 0:
+        return (bits << amount) & mask
+    return (bits >> -amount) & mask
+
+
+def _fill(generator: int, propagator: int, amount: int, mask: int) -> int:
+    """
+    Extend `generator` along the given direction through `propagator`.
+
+    This is the Kogge-Stone parallel prefix (occluded) fill, which needs three
+    doubling steps instead of looping cell by cell.
+    """
+    propagator &= mask
+    generator |= propagator & _shift(generator, amount, FULL_MASK)
+    propagator &= _shift(propagator, amount, FULL_MASK)
+    generator |= propagator & _shift(generator, 2 * amount, FULL_MASK)
+    propagator &= _shift(propagator, 2 * amount, FULL_MASK)
+    generator |= propagator & _shift(generator, 4 * amount, FULL_MASK)
+    return generator
+
+
+def legal_moves(own: int, opponent: int) -> int:
+    """Return the bitmask of the legal moves for the owner of `own`."""
+    empty = FULL_MASK & ~(own | opponent)
+    moves = 0
+    for amount, mask in DIRECTIONS:
+        flanked = _fill(own, opponent, amount, mask) & opponent
+        moves |= _shift(flanked, amount, mask) & empty
+    return moves
+
+
+def flip_mask(own: int, opponent: int, move: int) -> int:
+    """Return the bitmask of the discs flipped by playing `move`."""
+    flips = 0
+    for amount, mask in DIRECTIONS:
+        run = _fill(move, opponent, amount, mask) & opponent
+        if _shift(run, amount, mask) & own:
+            flips |= run
+    return flips
+
+
+# TODO pylint: disable=too-many-instance-attributes
+class OthelloBitboard(HorizontalBoard):
+    """
+    An Othello model backed by two bitboards, one for each player.
+
+    Legal moves and flips are generated for all directions at once with
+    shifts and masks, and the scores are the population counts of the
+    bitboards. The `state` grid is only built on demand, e.g. for the view.
+    """
+
+    # Comparing the bitboards is cheaper than building the `state` grid
+    _SNAPSHOT_ATTRIBUTES = (
+        *Model._SNAPSHOT_ATTRIBUTES,
+        "key",
+        "_black_bits",
+        "_white_bits",
+        "_legal_moves",
+        "_turn_passed",
+    )
+
+    def __init__(self) -> None:
+        # `self.state` is assigned in `Board.__init__`, which initialises the
+        # bitboards
+        self._black_bits: int = 0
+        self._white_bits: int = 0
+        super().__init__(ROW_NUM, COL_NUM, square_symmetries(ROW_NUM))
+        for cell in INIT_BLACK:
+            self.changes.append(cell)
+            self._black_bits |= cell_to_bit(cell)
+            self.key ^= self._zobrist.cells[BLACK_MARK][cell]
+        for cell in INIT_WHITE:
+            self.changes.append(cell)
+            self._white_bits |= cell_to_bit(cell)
+            self.key ^= self._zobrist.cells[WHITE_MARK][cell]
+        self._scores = [len(INIT_BLACK), len(INIT_WHITE)]
+        # Mark whether the last turn was passed without playing
+        self._turn_passed: bool = False
+        # The bitmask of the legal moves for the current player
+        self._legal_moves: int = 0
+        self._update_possible_actions()
+
+    @property
+    def state(self) -> BoardState:
+        state = np.full(CELL_NUM, MARK_EMPTY, np.int8)
+        for index in range(CELL_NUM):
+            if self._black_bits >> index & 1:
+                state[index] = BLACK_MARK
+            elif self._white_bits >> index & 1:
+                state[index] = WHITE_MARK
+        return state.reshape(ROW_NUM, COL_NUM)
+
+    @state.setter
+    def state(self, value: BoardState) -> None:
+        self._black_bits = 0
+        self._white_bits = 0
+        for index, mark in enumerate(value.flat):
+            if mark == BLACK_MARK:
+                self._black_bits |= 1 << index
+            elif mark == WHITE_MARK:
+                self._white_bits |= 1 << index
+
+    @property
+    def bitboards(self) -> tuple[int, int]:
+        """Return the bitboards of the black and white discs."""
+        return self._black_bits, self._white_bits
+
+    def _own_and_opponent(self) -> tuple[int, int]:
+        if self.turn == BLACK:
+            return self._black_bits, self._white_bits
+        return self._white_bits, self._black_bits
+
+    def _update_state_and_changes(self, action: HorizontalBoardAction) -> None:
+        own, opponent = self._own_and_opponent()
+        move = cell_to_bit(action)
+        flips = flip_mask(own, opponent, move)
+        own |= move | flips
+        opponent ^= flips
+        if self.turn == BLACK:
+            self._black_bits, self._white_bits = own, opponent
+        else:
+            self._white_bits, self._black_bits = own, opponent
+        self.changes = [action, *bits_to_cells(flips)]
+        self._hash_changes()
+
+    def _undo_data(self) -> OthelloBitboardUndoData:
+        return (
+            self.key,
+            self._black_bits,
+            self._white_bits,
+            self._legal_moves,
+            self._turn_passed,
+        )
+
+    def _undo_state_and_changes(
+        self,
+        action: HorizontalBoardAction | None,
+        data: OthelloBitboardUndoData,
+    ) -> None:
+        (
+            self.key,
+            self._black_bits,
+            self._white_bits,
+            self._legal_moves,
+            self._turn_passed,
+        ) = data
+
+    def compute_key(self) -> int:
+        key = super().compute_key()
+        return key ^ self._zobrist.turn_passed if self._turn_passed else key
+
+    def _set_turn_passed(self, turn_passed: bool) -> None:
+        if turn_passed != self._turn_passed:
+            self._turn_passed = turn_passed
+            self.key ^= self._zobrist.turn_passed
+
+    def _update_scores(self, action: HorizontalBoardAction | None) -> None:
+        if action is None:
+            return
+        self._scores[BLACK_SLOT] = self._black_bits.bit_count()
+        self._scores[WHITE_SLOT] = self._white_bits.bit_count()
+
+    def _update_status(self, action: HorizontalBoardAction | None) -> None:
+        if action is not None:
+            self._set_turn_passed(False)
+        elif self._turn_passed:
+            # The game is over when both players pass consecutively
+            if self._scores[BLACK_SLOT] > self._scores[WHITE_SLOT]:
+                self.status = BLACK_WON
+            elif self._scores[BLACK_SLOT] < self._scores[WHITE_SLOT]:
+                self.status = WHITE_WON
+            else:
+                self.status = Status.DRAW
+        else:
+            self._set_turn_passed(True)
+
+    def action_prior(self, action: HorizontalBoardAction) -> float:
+        return POSITIONAL_WEIGHTS[action[0]][action[1]]
+
+    def _update_possible_actions(self) -> None:
+        self._legal_moves = legal_moves(*self._own_and_opponent())
+        self.possible_actions = bits_to_cells(self._legal_moves)
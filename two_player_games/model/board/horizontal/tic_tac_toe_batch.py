@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+from two_player_games.common import MARK_EMPTY
+from two_player_games.model.board.batch import BatchActions, BoardBatch
+from two_player_games.model.board.horizontal.tic_tac_toe import (
+    COL_NUM,
+    ROW_NUM,
+)
+
+
+class TicTacToeBatch(BoardBatch):
+    """
+    Tic-tac-toe games stepped together, with the flat cells, row * COL_NUM +
+    col, as actions.
+    """
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size, ROW_NUM, COL_NUM, ROW_NUM, ROW_NUM * COL_NUM)
+
+    def legal_mask(self) -> npt.NDArray[np.bool_]:
+        legal_mask: npt.NDArray[np.bool_] = (
+            self.states.reshape(self.size, -1) == MARK_EMPTY
+        ) & ~self.is_terminal()[:, None]
+        return legal_mask
+
+    def _place(
+        self,
+        boards: BatchActions,
+        actions: BatchActions,
+    ) -> BatchActions:
+        return actions
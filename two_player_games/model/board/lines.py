@@ -0,0 +1,69 @@
+"""
+Index tables of the lines of cells that win a game, e.g. four in a row.
+
+Cells are identified by their flat index, row * col_num + col. The tables are
+built once per board size, so that win detection only needs array lookups.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+# Horizontal, vertical, diagonal and anti-diagonal steps (row, col)
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@cache
+def line_windows(
+    row_num: int,
+    col_num: int,
+    length: int,
+) -> npt.NDArray[np.intp]:
+    """
+    Return the flat cell indices of every window of `length` consecutive
+    cells in any direction, with shape (window_num, length).
+    """
+    windows = [
+        [(row + d_row * i) * col_num + col + d_col * i for i in range(length)]
+        for d_row, d_col in LINE_DIRECTIONS
+        for row in range(row_num)
+        for col in range(col_num)
+        if 0 <= row + d_row * (length - 1) < row_num
+        and 0 <= col + d_col * (length - 1) < col_num
+    ]
+    windows_array: npt.NDArray[np.intp] = np.array(windows, np.intp)
+    windows_array.flags.writeable = False
+    return windows_array
+
+
+@cache
+def cell_windows(
+    row_num: int,
+    col_num: int,
+    length: int,
+) -> npt.NDArray[np.intp]:
+    """
+    Return the flat cell indices of the windows through each cell, with shape
+    (cell_num, max_window_num, length).
+
+    Cells in fewer windows repeat their first window, which does not change
+    whether any of them is complete.
+    """
+    windows = line_windows(row_num, col_num, length).tolist()
+    cell_lists = [
+        [window for window in windows if cell in window]
+        for cell in range(row_num * col_num)
+    ]
+    max_window_num = max(len(cell_list) for cell_list in cell_lists)
+    table: npt.NDArray[np.intp] = np.array(
+        [
+            cell_list + cell_list[:1] * (max_window_num - len(cell_list))
+            for cell_list in cell_lists
+        ],
+        np.intp,
+    )
+    table.flags.writeable = False
+    return table
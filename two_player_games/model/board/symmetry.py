@@ -0,0 +1,54 @@
+"""
+Index tables of the symmetries of boards, i.e. the rotations and reflections
+that do not change the rules of a game.
+
+A symmetry is a permutation of the flat cells, row * col_num + col: the image
+of a position holds the mark of the cell `symmetry[i]` at the cell i. The
+first symmetry of each table is the identity.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+
+def _table(boards: list[npt.NDArray[np.intp]]) -> npt.NDArray[np.intp]:
+    table: npt.NDArray[np.intp] = np.array(
+        [board.ravel() for board in boards],
+        np.intp,
+    )
+    table.flags.writeable = False
+    return table
+
+
+@cache
+def identity_symmetries(row_num: int, col_num: int) -> npt.NDArray[np.intp]:
+    """Return the identity alone, e.g. for boards without symmetries."""
+    return _table([np.arange(row_num * col_num)])
+
+
+@cache
+def mirror_symmetries(row_num: int, col_num: int) -> npt.NDArray[np.intp]:
+    """
+    Return the identity and the left-right reflection, e.g. for Connect Four,
+    where gravity rules out the others.
+    """
+    cells = np.arange(row_num * col_num).reshape(row_num, col_num)
+    return _table([cells, cells[:, ::-1]])
+
+
+@cache
+def square_symmetries(size: int) -> npt.NDArray[np.intp]:
+    """
+    Return the 8 rotations and reflections of a square board, e.g. for
+    Tic-Tac-Toe and Othello.
+    """
+    cells = np.arange(size * size).reshape(size, size)
+    boards = []
+    for quarter_turns in range(4):
+        rotated = np.rot90(cells, quarter_turns)
+        boards += [rotated, rotated.T]
+    return _table(boards)
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from functools import partial
-
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import convolve2d  # type: ignore
 
-from two_player_games.common import MARK_EMPTY, Status, Turn
+from two_player_games.common import FIRST_SLOT, SECOND_SLOT, Status, Turn
 from two_player_games.config.board.connect4 import CONNECT4
-from two_player_games.model import InvalidAction, PlayAfterGameOver
+from two_player_games.model.board.lines import cell_windows
+from two_player_games.model.board.symmetry import mirror_symmetries
 from two_player_games.model.board.vertical import (
     VerticalBoard,
     VerticalBoardAction,
@@ -22,78 +20,88 @@ SECOND_WON = Status.SECOND_WON
 ROW_NUM = CONNECT4.row_num
 COL_NUM = CONNECT4.col_num
 
-KERNEL_HORIZONTAL = np.array([[1, 1, 1, 1]], dtype=np.int8)
-KERNEL_VERTICAL = np.array([[1], [1], [1], [1]], dtype=np.int8)
-KERNEL_DIAGONAL = np.eye(4, dtype=np.int8)
-KERNEL_DIAGONAL_FLIPLR = np.eye(4, dtype=np.int8)[:, ::-1]
 WINNING_STREAK = 4
+# The flat cells of the lines of four through each flat cell
+CELL_LINES = cell_windows(ROW_NUM, COL_NUM, WINNING_STREAK)
 
 
 class Connect4(VerticalBoard):
+    _SNAPSHOT_ATTRIBUTES = (*VerticalBoard._SNAPSHOT_ATTRIBUTES, "_heights")
+
     def __init__(self) -> None:
-        super().__init__(ROW_NUM, COL_NUM)
+        super().__init__(ROW_NUM, COL_NUM, mirror_symmetries(ROW_NUM, COL_NUM))
+        # The number of discs in each column
+        self._heights: list[int] = [0] * COL_NUM
         self._update_possible_actions()
 
+    @property
+    def legal_mask(self) -> npt.NDArray[np.bool_]:
+        """Return whether a disc can be dropped in each column."""
+        legal_mask: npt.NDArray[np.bool_] = np.array(self._heights) < ROW_NUM
+        return legal_mask
+
     def _update_state_and_changes(self, action: VerticalBoardAction) -> None:
-        count: int = (self.state[:, action] != MARK_EMPTY).sum(axis=0)
+        count = self._heights[action]
+        self._heights[action] = count + 1
         change = ROW_NUM - 1 - count, action
         self.changes = [change]
-        self.state[change] = self.turn.value
+        self.state[change] = self.turn
+        self._hash_changes()
+
+    def _undo_state_and_changes(
+        self,
+        action: VerticalBoardAction | None,
+        data: int,
+    ) -> None:
+        super()._undo_state_and_changes(action, data)
+        if action is not None:
+            self._heights[action] -= 1
 
     def _update_scores(self, action: VerticalBoardAction | None) -> None:
         if action is None:
-            self.scores[FIRST_TURN] = 0.5
-            self.scores[SECOND_TURN] = 0.5
+            self._scores[FIRST_SLOT] = 0.5
+            self._scores[SECOND_SLOT] = 0.5
         elif self._is_won():
             if self.turn == FIRST_TURN:
-                self.scores[FIRST_TURN] = 1
+                self._scores[FIRST_SLOT] = 1
             else:
-                self.scores[SECOND_TURN] = 1
+                self._scores[SECOND_SLOT] = 1
 
-    # TODO It would be more efficient to check only lines that contain the
-    # last move
     def _is_won(self) -> bool:
-        """Claclulate whether the executed move is a winning move."""
-        cell_mark = self.turn.value
-        state_eq_mark: npt.NDArray[np.bool_] = self.state == cell_mark
-        horizontal: bool = (
-            convolve2d(state_eq_mark, KERNEL_HORIZONTAL, mode="valid")
-            == WINNING_STREAK
-        ).any()
-        vertical: bool = (
-            convolve2d(state_eq_mark, KERNEL_VERTICAL, mode="valid")
-            == WINNING_STREAK
-        ).any()
-        main_diagonal: bool = (
-            convolve2d(state_eq_mark, KERNEL_DIAGONAL, mode="valid")
-            == WINNING_STREAK
-        ).any()
-        anti_diagonal: bool = (
-            convolve2d(state_eq_mark, KERNEL_DIAGONAL_FLIPLR, mode="valid")
-            == WINNING_STREAK
-        ).any()
-        return horizontal or vertical or main_diagonal or anti_diagonal
+        """Calculate whether the executed move is a winning move."""
+        # Only the lines through the last disc can have been completed
+        row, col = self.changes[0]
+        lines = self.state.ravel()[CELL_LINES[row * COL_NUM + col]]
+        return bool((lines == self.turn).all(axis=1).any())
 
     def _update_status(self, _action: VerticalBoardAction | None) -> None:
-        match (self.scores[FIRST_TURN], self.scores[SECOND_TURN]):
-            case (1, 0):
+        match self._scores:
+            case [1, 0]:
                 self.status = FIRST_WON
-            case (0, 1):
+            case [0, 1]:
                 self.status = SECOND_WON
-            case (0.5, 0.5):
+            case [0.5, 0.5]:
                 self.status = Status.DRAW
             case _:
                 pass
                 # self.status = Status.RUNNING
 
+    def action_prior(self, action: VerticalBoardAction) -> float:
+        # Central columns take part in more lines of four
+        return -abs(2 * action - (COL_NUM - 1))
+
     def _update_possible_actions(self) -> None:
-        # TODO update more efficiently, e.g. by removing the last move
+        if self.changes:
+            row, col = self.changes[0]
+            if row == 0:
+                # The column is full. The list is replaced rather than
+                # modified, as `push` keeps the previous one for `pop`.
+                self.possible_actions = [
+                    action for action in self.possible_actions if action != col
+                ]
+            return
         self.possible_actions = [
-            i
-            for i, x in enumerate(
-                (self.state == MARK_EMPTY).sum(axis=0) != 0,
-            )
-            if x
+            col for col, height in enumerate(self._heights) if height < ROW_NUM
         ]
 
     # TODO Refactor: Move these repeated methods to Model
@@ -108,69 +116,3 @@ class Connect4(VerticalBoard):
     #     board.scores = self.scores.copy()
     #     board.status = self.status
     #     return board
-
-    # TODO Refactor: Move these repeated methods to Model
-    def peek_then_eval(
-        self,
-        action: VerticalBoardAction,
-        func: partial[tuple[float, VerticalBoardAction | None]],
-    ) -> tuple[float, VerticalBoardAction | None]:
-        # Save state
-        changes = self.changes.copy()
-        state = self.state.copy()
-        turn = self.turn
-        scores = self.scores.copy()
-        status = self.status
-        possible_actions = self.possible_actions.copy()
-
-        # Execute
-        if not self.is_over():
-            if not self.play(action):
-                raise InvalidAction(action, self.turn)
-        else:
-            # Unreachable
-            raise PlayAfterGameOver(action)
-
-        # Eval
-        evaluation = func(self)
-
-        # Undo execution
-        self.changes = changes
-        count = (self.state[:, action] != MARK_EMPTY).sum(axis=0)
-        assert (
-            count
-        ), f"Column {action} must contain at least one non-empty cell."
-        indices = ROW_NUM - count, action
-        self.state[indices] = MARK_EMPTY
-        self.scores = {
-            FIRST_TURN: 0,
-            SECOND_TURN: 0,
-        }
-        self.turn = turn
-        self.status = status
-        self._update_possible_actions()
-
-        # TODO Move these assert statements to tests
-        assert (
-            changes == self.changes
-        ), f"Grid not restored correctly\n{state}\n{self.state}"
-        assert (
-            state == self.state
-        ).all(), f"Grid not restored correctly\n{state}\n{self.state}"
-        assert (
-            turn == self.turn
-        ), f"Player turn not restored correctly\n{turn}\n{self.turn}"
-        assert (
-            scores == self.scores
-        ), f"Scores not restored correctly\n{scores}\n{self.scores}"
-        assert (
-            possible_actions == self.possible_actions
-        ), "Possible actions not restored correctly.\n{}\n{}".format(
-            possible_actions,
-            self.possible_actions,
-        )
-        assert (
-            status == self.status
-        ), f"Status not restored correctly\n{status}\n{self.status}"
-
-        return evaluation
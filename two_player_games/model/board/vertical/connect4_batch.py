@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+from two_player_games.common import MARK_EMPTY, CellMark, Turn
+from two_player_games.model.board import BoardState
+from two_player_games.model.board.batch import BatchActions, BoardBatch
+from two_player_games.model.board.vertical.connect4 import (
+    COL_NUM,
+    ROW_NUM,
+    WINNING_STREAK,
+)
+
+
+class Connect4Batch(BoardBatch):
+    """Connect Four games stepped together, with columns as actions."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size, ROW_NUM, COL_NUM, WINNING_STREAK, COL_NUM)
+        # The number of discs in each column of each board
+        self.heights: npt.NDArray[np.intp] = np.zeros((size, COL_NUM), np.intp)
+
+    def reset(
+        self,
+        state: BoardState | None = None,
+        turn: CellMark = Turn.FIRST,
+    ) -> None:
+        super().reset(state, turn)
+        self.heights[:] = (self.states != MARK_EMPTY).sum(axis=1)
+
+    def legal_mask(self) -> npt.NDArray[np.bool_]:
+        legal_mask: npt.NDArray[np.bool_] = (self.heights < ROW_NUM) & (
+            ~self.is_terminal()[:, None]
+        )
+        return legal_mask
+
+    def _place(
+        self,
+        boards: BatchActions,
+        actions: BatchActions,
+    ) -> BatchActions:
+        # Rows are counted from the top, and discs fall to the bottom
+        rows = ROW_NUM - 1 - self.heights[boards, actions]
+        self.heights[boards, actions] += 1
+        cells: BatchActions = rows * COL_NUM + actions
+        return cells
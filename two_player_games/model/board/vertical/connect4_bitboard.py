@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import numpy as np
+
+from two_player_games.common import MARK_FIRST, MARK_SECOND
+from two_player_games.model import Model
+from two_player_games.model.board import BoardState
+from two_player_games.model.board.vertical import VerticalBoardAction
+from two_player_games.model.board.vertical.connect4 import (
+    COL_NUM,
+    FIRST_TURN,
+    ROW_NUM,
+    Connect4,
+)
+
+# Each column is stored in ROW_NUM + 1 consecutive bits, the lowest being the
+# bottom cell. The extra bit on top of each column is always empty, which
+# prevents the shifts used in `_is_won` from wrapping across columns.
+# https://github.com/denkspuren/BitboardC4/blob/master/BitboardDesign.md
+COL_HEIGHT = ROW_NUM + 1
+FIRST_COLUMN_MASK = (1 << ROW_NUM) - 1
+BOTTOM_CELLS = tuple(1 << (col * COL_HEIGHT) for col in range(COL_NUM))
+BOTTOM_MASK = sum(BOTTOM_CELLS)
+BOARD_MASK = BOTTOM_MASK * FIRST_COLUMN_MASK
+# Vertical, horizontal, anti-diagonal (/) and main diagonal (\) shifts
+WINNING_SHIFTS = (1, COL_HEIGHT, COL_HEIGHT - 1, COL_HEIGHT + 1)
+
+
+def bit_to_cell(index: int) -> tuple[int, int]:
+    """Return the `state` cell corresponding to the given bit index."""
+    column, height = divmod(index, COL_HEIGHT)
+    return ROW_NUM - 1 - height, column
+
+
+def has_four(bits: int) -> bool:
+    """Return whether the given bitboard contains four aligned cells."""
+    for shift in WINNING_SHIFTS:
+        pairs = bits & (bits >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+class Connect4Bitboard(Connect4):
+    """
+    A Connect4 model backed by two bitboards, one for each player.
+
+    Dropping a piece and undoing it only take a handful of integer
+    operations. A win is found by ANDing the bitboard of the player with
+    itself shifted along each direction, which leaves the first cell of each
+    run of four, see `has_four`. The `state` grid is only built on demand,
+    e.g. for the view.
+    """
+
+    # Comparing the bitboards is cheaper than building the `state` grid
+    _SNAPSHOT_ATTRIBUTES = (
+        *Model._SNAPSHOT_ATTRIBUTES,
+        "key",
+        "_first_bits",
+        "_second_bits",
+        "_heights",
+    )
+
+    def __init__(self) -> None:
+        # `self.state` is assigned in `Board.__init__`, which initialises the
+        # bitboards and the column heights
+        self._first_bits: int = 0
+        self._second_bits: int = 0
+        self._heights: list[int] = []
+        super().__init__()
+
+    @property
+    def state(self) -> BoardState:
+        state = np.zeros((ROW_NUM, COL_NUM), np.int8)
+        for index in range(COL_NUM * COL_HEIGHT):
+            bit = 1 << index
+            if self._first_bits & bit:
+                state[bit_to_cell(index)] = MARK_FIRST
+            elif self._second_bits & bit:
+                state[bit_to_cell(index)] = MARK_SECOND
+        return state
+
+    @state.setter
+    def state(self, value: BoardState) -> None:
+        self._first_bits = 0
+        self._second_bits = 0
+        self._heights = []
+        for column in range(COL_NUM):
+            # Pieces are stacked from the bottom row up to the first empty cell
+            height = 0
+            while height < ROW_NUM:
+                mark = value[ROW_NUM - 1 - height, column]
+                bit = 1 << (column * COL_HEIGHT + height)
+                if mark == MARK_FIRST:
+                    self._first_bits |= bit
+                elif mark == MARK_SECOND:
+                    self._second_bits |= bit
+                else:
+                    break
+                height += 1
+            self._heights.append(height)
+
+    @property
+    def bitboards(self) -> tuple[int, int]:
+        """Return the bitboards of the first and second players."""
+        return self._first_bits, self._second_bits
+
+    @property
+    def legal_moves(self) -> int:
+        """Return the bitmask of the cells where a piece can be dropped."""
+        return ((self._first_bits | self._second_bits) + BOTTOM_MASK) & (
+            BOARD_MASK
+        )
+
+    def _update_state_and_changes(self, action: VerticalBoardAction) -> None:
+        height = self._heights[action]
+        self._heights[action] = height + 1
+        index = action * COL_HEIGHT + height
+        if self.turn == FIRST_TURN:
+            self._first_bits |= 1 << index
+        else:
+            self._second_bits |= 1 << index
+        self.changes = [bit_to_cell(index)]
+        self._hash_changes()
+
+    def _undo_state_and_changes(
+        self,
+        action: VerticalBoardAction | None,
+        data: int,
+    ) -> None:
+        self.key = data
+        if action is None:
+            return
+        self._heights[action] -= 1
+        bit = 1 << (action * COL_HEIGHT + self._heights[action])
+        self._first_bits &= ~bit
+        self._second_bits &= ~bit
+
+    def _is_won(self) -> bool:
+        return has_four(
+            self._first_bits if self.turn == FIRST_TURN else self._second_bits,
+        )
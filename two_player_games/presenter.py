@@ -28,6 +28,11 @@ class Presenter(Generic[Action, State, Change]):
     def quit(self) -> None:
         self.view.quit()
 
+    def close(self) -> None:
+        """Release the resources of both agents."""
+        self.first_agent.close()
+        self.second_agent.close()
+
     def main_loop(self) -> None:
         while not self.model.is_over():
             logger.debug(
@@ -63,11 +68,11 @@ class Presenter(Generic[Action, State, Change]):
                 case _:
                     logger.debug(
                         "%s: %s",
-                        self.model.turn,
+                        Turn(self.model.turn).name,
                         action,
                     )
                     if not self.model.play(action):
-                        raise InvalidAction(action, self.model.turn)
+                        raise InvalidAction(action, Turn(self.model.turn))
             # TODO `cell` is board specific. Replace it with a more generic
             # property or method
             self.view.human_action = None
@@ -0,0 +1,391 @@
+"""
+Play many games between agents without a view, e.g. to evaluate changes.
+
+Each pair of agents plays the given number of games, alternating colours,
+and the results are reported as win/draw/loss tables with Elo differences.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import sys
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Any
+
+from .agent import Agent
+from .agent.arg import (
+    AgentArg,
+    AgentOptions,
+    EvaluatorArg,
+    SolverArg,
+    parse_duration,
+    parse_flag,
+    parse_ordering,
+)
+from .common import Status, Turn
+from .model import InvalidAction
+from .model.arg import ModelArg
+
+# The z-score of the two-sided 95% confidence interval
+Z_95 = 1.96
+
+# The keys of agent specs and how they map to `AgentOptions`
+SPEC_OPTIONS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "depth": ("depth", int),
+    "tt": ("transposition_table_size", float),
+    "time": ("time_budget", parse_duration),
+    "order": ("ordering", parse_ordering),
+    "iterations": ("iterations", int),
+    "exploration": ("exploration", float),
+    "workers": ("workers", int),
+    "eval": ("evaluator", EvaluatorArg),
+    "solve": ("solver", SolverArg),
+    "empties": ("solver_empties", int),
+    "book": ("book", str),
+    "sym": ("symmetric", parse_flag),
+}
+# The agents that need a depth or a time budget to stop searching
+MAXIMIN_AGENTS = frozenset(
+    {
+        AgentArg.MAXIMIN_NAIVE,
+        AgentArg.MAXIMIN_DEFENSIVE,
+        AgentArg.MAXIMIN_STOCHASTIC,
+        AgentArg.MAXIMIN_ALPHA_BETA_PRUNING,
+        AgentArg.NEGAMAX_PVS,
+    },
+)
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """An agent and its options, e.g. `maximin-alpha-beta:depth=4,tt=16`."""
+
+    label: str
+    agent: AgentArg
+    options: dict[str, Any] = field(default_factory=dict, hash=False)
+
+    def create(self, model_arg: ModelArg, turn: Turn) -> Agent[Any, Any, Any]:
+        return self.agent.create(
+            model_arg.get_config().category,
+            None,
+            AgentOptions(turn, **self.options),
+        )
+
+
+def parse_agent_spec(value: str) -> AgentSpec:
+    """
+    Parse an agent followed by comma-separated options, e.g.
+    `mcts:iterations=500` or `maximin-alpha-beta:depth=4,order=all`.
+    """
+    name, _, option_text = value.strip().partition(":")
+    try:
+        agent = AgentArg(name)
+    except ValueError as exc:
+        raise ValueError(f"Invalid agent: {name!r}") from exc
+    if agent == AgentArg.HUMAN:
+        raise ValueError("Human agents cannot play tournaments")
+    options = {}
+    for option in filter(None, option_text.split(",")):
+        key, _, text = option.partition("=")
+        if key.strip() not in SPEC_OPTIONS:
+            raise ValueError(f"Invalid agent option: {key!r}")
+        attribute, parse = SPEC_OPTIONS[key.strip()]
+        options[attribute] = parse(text.strip())
+    # Checked here rather than when the agent is created in a worker process
+    if (
+        agent in MAXIMIN_AGENTS
+        and options.get("depth", 0) <= 0
+        and options.get("time_budget") is None
+    ):
+        raise ValueError(f"Maximin agents need a depth or a time: {name!r}")
+    return AgentSpec(value.strip(), agent, options)
+
+
+@dataclass
+class Record:
+    """The results of an agent against an opponent, or the whole field."""
+
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        """The average points per game, counting draws as half a point."""
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    def add(self, points: float) -> None:
+        if points == 1:
+            self.wins += 1
+        elif points == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def reversed(self) -> Record:
+        """Return the record from the opponent's perspective."""
+        return Record(self.losses, self.draws, self.wins)
+
+    def elo(self) -> float:
+        """Return the Elo difference corresponding to the score."""
+        return score_to_elo(self.score)
+
+    def elo_interval(self) -> tuple[float, float]:
+        """
+        Return the 95% confidence interval of the Elo difference.
+
+        The interval is that of the record with an extra win and loss
+        (Laplace's rule), so that sweeps and all-draw records, whose sample
+        variance is 0, still get an interval of positive width.
+        """
+        adjusted = Record(self.wins + 1, self.draws, self.losses + 1)
+        score = adjusted.score
+        variance = (
+            adjusted.wins * (1 - score) ** 2
+            + adjusted.draws * (0.5 - score) ** 2
+            + adjusted.losses * score**2
+        ) / adjusted.games
+        margin = Z_95 * math.sqrt(variance / adjusted.games)
+        return score_to_elo(score - margin), score_to_elo(score + margin)
+
+
+def score_to_elo(score: float) -> float:
+    """Return the Elo difference expected to result in the given score."""
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def play_game(
+    model_arg: ModelArg,
+    first: AgentSpec,
+    second: AgentSpec,
+    random_plies: int = 0,
+    seed: int | None = None,
+) -> Status:
+    """
+    Play a game and return its final status.
+
+    The first `random_plies` actions are random, which diversifies the games
+    of deterministic agents.
+    """
+    random.seed(seed)
+    model = model_arg.get_model()()
+    agents = {
+        Turn.FIRST: first.create(model_arg, Turn.FIRST),
+        Turn.SECOND: second.create(model_arg, Turn.SECOND),
+    }
+    ply = 0
+    try:
+        while not model.is_over():
+            if ply < random_plies:
+                action = (
+                    random.choice(model.possible_actions)
+                    if model.possible_actions
+                    else None
+                )
+            else:
+                action = agents[model.turn].select_action(model)
+            if not model.play(action):
+                raise InvalidAction(action, Turn(model.turn))
+            ply += 1
+    finally:
+        for agent in agents.values():
+            agent.close()
+    status: Status = model.status
+    return status
+
+
+def _play_pairing(
+    args: tuple[ModelArg, AgentSpec, AgentSpec, int, int],
+) -> Status:
+    return play_game(*args)
+
+
+# pylint: disable=too-many-arguments
+def run_tournament(
+    model_arg: ModelArg,
+    specs: list[AgentSpec],
+    games: int,
+    workers: int = 1,
+    random_plies: int = 0,
+    seed: int = 0,
+) -> dict[tuple[int, int], Record]:
+    """
+    Play `games` games between each pair of agents, alternating colours, and
+    return the record of the first agent of each pair against the second one.
+    """
+    pairs = list(combinations(range(len(specs)), 2))
+
+    def schedule() -> (
+        Iterator[tuple[ModelArg, AgentSpec, AgentSpec, int, int]]
+    ):
+        for pair_index, pair in enumerate(pairs):
+            for game in range(games):
+                first, second = pair if game % 2 == 0 else pair[::-1]
+                yield (
+                    model_arg,
+                    specs[first],
+                    specs[second],
+                    random_plies,
+                    seed + pair_index * games + game,
+                )
+
+    records = {pair: Record() for pair in pairs}
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            statuses = list(
+                executor.map(
+                    _play_pairing,
+                    schedule(),
+                    chunksize=max(1, games // (4 * workers)),
+                ),
+            )
+    else:
+        statuses = [_play_pairing(args) for args in schedule()]
+    index = 0
+    for pair in pairs:
+        for game in range(games):
+            status = statuses[index]
+            index += 1
+            if status == Status.DRAW:
+                points = 0.5
+            else:
+                # Whether the first agent of the pair won
+                points = float(
+                    (status == Status.FIRST_WON) == (game % 2 == 0),
+                )
+            records[pair].add(points)
+    return records
+
+
+def format_elo(elo: float) -> str:
+    # Rounding to an int avoids printing -0, e.g. for an even score
+    return f"{round(elo):+d}" if math.isfinite(elo) else f"{elo:+}"
+
+
+def format_results(
+    specs: list[AgentSpec],
+    records: dict[tuple[int, int], Record],
+) -> str:
+    lines = ["Pairings (first agent's perspective):"]
+    label_width = max(len(spec.label) for spec in specs)
+    for (first, second), record in records.items():
+        low, high = record.elo_interval()
+        lines.append(
+            f"  {specs[first].label:>{label_width}} vs "
+            f"{specs[second].label:<{label_width}}  "
+            f"W {record.wins:>5}  D {record.draws:>5}  L {record.losses:>5}  "
+            f"Elo {format_elo(record.elo())} "
+            f"[{format_elo(low)}, {format_elo(high)}]",
+        )
+    totals = [Record() for _ in specs]
+    for (first, second), record in records.items():
+        for index, side in ((first, record), (second, record.reversed())):
+            totals[index].wins += side.wins
+            totals[index].draws += side.draws
+            totals[index].losses += side.losses
+    lines.append("Standings (against the field):")
+    for index in sorted(
+        range(len(specs)),
+        key=lambda index: totals[index].score,
+        reverse=True,
+    ):
+        record = totals[index]
+        low, high = record.elo_interval()
+        lines.append(
+            f"  {specs[index].label:<{label_width}}  "
+            f"W {record.wins:>5}  D {record.draws:>5}  L {record.losses:>5}  "
+            f"Score {record.score:.3f}  "
+            f"Elo {format_elo(record.elo())} "
+            f"[{format_elo(low)}, {format_elo(high)}]",
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
+    arg_parser = ArgumentParser(
+        description="Play a round-robin tournament between agents.",
+    )
+    arg_parser.add_argument(
+        "-m",
+        "--model",
+        dest="model",
+        type=ModelArg,
+        choices=ModelArg,
+        required=True,
+    )
+    arg_parser.add_argument(
+        "-a",
+        "--agents",
+        dest="agents",
+        type=parse_agent_spec,
+        nargs="+",
+        required=True,
+        metavar="AGENT[:OPTION=VALUE,...]",
+        help=(
+            "Agents with options among "
+            f"{', '.join(SPEC_OPTIONS)}, e.g. maximin-alpha-beta:depth=4"
+        ),
+    )
+    arg_parser.add_argument(
+        "-n",
+        "--games",
+        dest="games",
+        type=int,
+        default=100,
+        help="Games per pair of agents",
+    )
+    arg_parser.add_argument(
+        "-p",
+        "--workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help="Processes playing games in parallel",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--random-plies",
+        dest="random_plies",
+        type=int,
+        default=0,
+        help="Random actions opening each game",
+    )
+    arg_parser.add_argument(
+        "-s",
+        "--seed",
+        dest="seed",
+        type=int,
+        default=0,
+    )
+    args = arg_parser.parse_args()
+    specs: list[AgentSpec] = args.agents
+    if len(specs) < 2:
+        arg_parser.error("At least two agents are needed")
+    records = run_tournament(
+        args.model,
+        specs,
+        args.games,
+        args.workers,
+        args.random_plies,
+        args.seed,
+    )
+    print(format_results(specs, records))
+
+
+if __name__ == "__main__":
+    main()
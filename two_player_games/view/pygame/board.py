@@ -260,7 +260,7 @@ class PyGameBoardView(View[HorizontalBoardAction, BoardState, BoardChange]):
 
     def _display_hint(
         self,
-        turn: Turn,
+        turn: CellMark,
         possible_actions: list[HorizontalBoardAction],
     ) -> None:
         radius = min(self.cell_width, self.cell_height) // 2 - self.padding